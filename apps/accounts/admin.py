@@ -1,3 +1,24 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Account
+
+
+@admin.register(Account)
+class AccountAdmin(admin.ModelAdmin):
+    list_display = (
+        "account_number",
+        "user",
+        "bank_code",
+        "account_type",
+        "balance",
+        "created_at",
+    )
+    # 사용자 열(Account.__str__ 포함)을 행마다 조회하지 않도록 한 번에 JOIN
+    list_select_related = ("user",)
+    list_filter = ("bank_code", "account_type")
+    search_fields = ["account_number", "user__email", "user__nickname"]
+    date_hierarchy = "created_at"
+    # 사용자 선택 목록(<select>)을 만들려고 전체 사용자를 읽지 않도록 id 입력 위젯 사용
+    raw_id_fields = ("user",)
+    readonly_fields = ("balance",)  # 잔액은 거래로만 변경
+    show_full_result_count = False
@@ -0,0 +1,136 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# 사용자별 데이터 버전과 계좌 목록 캐시
+#
+# 사용자마다 버전 번호를 두고 계좌/거래가 바뀔 때마다 올린다.
+# - 계좌 목록 캐시: "목록 키 = 사용자 id + 버전" 으로 저장하므로 버전을 올리면 이전 목록은
+#   더 이상 읽히지 않고 만료 시간이 지나 사라진다.
+# - ETag: 버전으로 만들므로 DB 조회 없이 캐시 조회 한 번으로 변경 여부를 판단한다.
+# 버전은 DB 트랜잭션이 커밋된 뒤에 올리므로(on_commit) 커밋 전 데이터를 캐시한 요청이 있더라도
+# 그 데이터는 이전 버전 키에만 남는다.
+# 버전은 캐시에 있으므로 여러 워커 프로세스(와 관리 명령)가 같은 버전을 보려면 공유 캐시(REDIS_URL)가 필요하다.
+# 로컬 메모리 캐시는 한 프로세스로 실행하는 개발 환경용이며, prod 설정은 공유 캐시가 없으면 시작하지 않는다.
+
+VERSION_KEY = "accounts:version:{user_id}"
+LIST_KEY = "accounts:list:{user_id}:{version}"
+
+# 캐시 적중/미스 횟수 (프로세스 단위)
+stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        stats[name] += 1
+
+
+def get_stats():
+    """캐시 적중/미스 횟수와 적중률"""
+    with _stats_lock:
+        hits, misses = stats["hits"], stats["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else None,
+    }
+
+
+def get_version(user_id):
+    """사용자 데이터(계좌/거래) 버전"""
+    key = VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        # 버전 키가 캐시에서 밀려난 경우에도 이전에 쓰던 버전 번호가 다시 나오지 않도록 시각으로 시작
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(user_id):
+    """get_version 의 async 버전"""
+    key = VERSION_KEY.format(user_id=user_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def get_account_list(user_id, build):
+    """
+    캐시된 계좌 목록을 반환한다. 캐시에 없으면 build()로 만들어 저장한다.
+    build 는 응답으로 보낼 직렬화된 데이터를 반환해야 한다.
+    """
+    key = LIST_KEY.format(user_id=user_id, version=get_version(user_id))
+    data = cache.get(key)
+    if data is not None:
+        _count("hits")
+        return data
+    _count("misses")
+    data = build()
+    cache.set(key, data, timeout=settings.ACCOUNT_LIST_CACHE_TIMEOUT)
+    return data
+
+
+async def aget_account_list(user_id, build):
+    """get_account_list 의 async 버전 - build 는 coroutine 함수"""
+    key = LIST_KEY.format(user_id=user_id, version=await aget_version(user_id))
+    data = await cache.aget(key)
+    if data is not None:
+        _count("hits")
+        return data
+    _count("misses")
+    data = await build()
+    await cache.aset(key, data, timeout=settings.ACCOUNT_LIST_CACHE_TIMEOUT)
+    return data
+
+
+def bump_user_version(user_id):
+    """
+    사용자 데이터 버전을 올려 계좌 목록 캐시와 ETag 를 무효화한다. 계좌/거래를 바꾼 뒤 호출한다.
+    DB 트랜잭션 안에서 호출하면 커밋된 뒤에 무효화하며, 롤백되면 아무것도 하지 않는다.
+    """
+    transaction.on_commit(lambda: _bump_version(user_id))
+
+
+def _bump_version(user_id):
+    try:
+        cache.incr(VERSION_KEY.format(user_id=user_id))
+    except ValueError:
+        # 버전 키가 없으면 다음 조회 때 새 버전(현재 시각)으로 시작하므로 할 일이 없음
+        pass
+
+
+def user_data_etag(request, *args, **kwargs):
+    """
+    사용자 데이터 버전으로 만든 ETag (django condition 데코레이터의 etag_func)
+
+    같은 버전이라도 URL(쿼리 문자열 포함)이나 Accept 헤더가 다르면 응답이 달라지므로 함께 넣는다.
+    버전을 공유 캐시에서 읽으므로 다른 워커나 관리 명령이 데이터를 바꿔도 304 를 잘못 응답하지 않는다.
+    """
+    return _make_etag(request, get_version(request.user.id))
+
+
+async def auser_data_etag(request):
+    """user_data_etag 의 async 버전"""
+    return _make_etag(request, await aget_version(request.user.id))
+
+
+def _make_etag(request, version):
+    raw = "|".join(
+        (
+            str(request.user.id),
+            str(version),
+            request.get_full_path(),
+            request.headers.get("Accept", ""),
+        )
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
@@ -143,4 +143,11 @@ class Account(BaseModel):
         # 이 Account 객체를 사람이 알아보기 쉬운 문자열로 표현
         # Django 관리자 페이지나 디버깅 시, Account object(2)와 같이 알아보기 힘든 표현 대신
         # '홍길동의 국민은행 계좌 (123-456)'와 같이 훨씬 명확한 형태로 객체를 표시한다.
-        return f"{self.user.nickname}의 {self.get_bank_code_display()} 계좌 ({self.account_number})"
+        # 사용자를 함께 읽지 않았으면(select_related 없이 조회) 추가 쿼리 대신 사용자 id 로 표시
+        # (관리자 목록, 로그 등에서 행마다 사용자 조회 쿼리가 나가지 않도록)
+        owner = (
+            self.user.nickname
+            if Account.user.is_cached(self)
+            else f"사용자 {self.user_id}"
+        )
+        return f"{owner}의 {self.get_bank_code_display()} 계좌 ({self.account_number})"
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from apps.common.serializers import ValuesListSerializer
+
 from .models import Account
 
 
@@ -10,3 +12,8 @@ class AccountSerializer(serializers.ModelSerializer):
         model = Account
         fields = "__all__"
         read_only_fields = ("user", "balance")  # 사용자와 잔액은 직접 수정 불가
+
+
+class AccountListSerializer(ValuesListSerializer):
+    # 계좌 목록 조회용 fast path - AccountSerializer 와 같은 JSON 을 만든다
+    serializer_class = AccountSerializer
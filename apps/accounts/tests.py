@@ -1,8 +1,14 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 
 from apps.accounts.models import Account
+from apps.accounts.serializers import AccountListSerializer, AccountSerializer
 from apps.users.models import User
 
 
@@ -73,6 +79,32 @@ class AccountAPITestCase(APITestCase):
         self.assertEqual(response.data[0]["account_number"], "1111111111")
         self.assertEqual(response.data[1]["account_number"], "2222222222")
 
+    def test_list_accounts_fast_path_matches_model_serializer(self):
+        """
+        계좌 목록 fast path 가 AccountSerializer 와 같은 JSON 을 만드는지 확인하는 테스트
+        """
+        Account.objects.create(
+            user=self.user,
+            account_number="1111111111",
+            bank_code="004",
+            account_type="CHECKING",
+            balance=1234.5,
+        )
+        Account.objects.create(
+            user=self.user,
+            account_number="2222222222",
+            bank_code="088",
+            account_type="SAVING",
+        )
+        accounts = Account.objects.filter(user=self.user).order_by("id")
+        expected = JSONRenderer().render(AccountSerializer(accounts, many=True).data)
+        fast = JSONRenderer().render(
+            AccountListSerializer(
+                accounts.values(*AccountListSerializer.value_fields())
+            ).data
+        )
+        self.assertEqual(fast, expected)
+
     def test_retrieve_account(self):
         """
         특정 계좌를 상세 조회하는 테스트
@@ -168,3 +200,105 @@ class AccountAPITestCase(APITestCase):
         self.assertEqual(
             response.status_code, status.HTTP_404_NOT_FOUND
         )  # 권한이 없으므로 404 반환
+
+
+class AccountListCacheTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="cacheuser@example.com",
+            password="testpassword123",
+            nickname="cacheuser",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="1111111111",
+            bank_code="004",
+            account_type="CHECKING",
+            balance=1000.00,
+        )
+        self.list_url = reverse("account-list-create")
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get(self.list_url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.list_url)
+        self.assertEqual(second.data, first.data)
+
+    def test_create_and_delete_invalidate_cache(self):
+        self.client.get(self.list_url)
+        data = {
+            "account_number": "2222222222",
+            "bank_code": "088",
+            "account_type": "SAVING",
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            created = self.client.post(self.list_url, data, format="json")
+        self.assertEqual(len(self.client.get(self.list_url).data), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse("account-detail", args=[created.data["id"]]))
+        self.assertEqual(len(self.client.get(self.list_url).data), 1)
+
+    def test_transaction_invalidates_cache_after_commit(self):
+        self.client.get(self.list_url)
+        data = {
+            "account": self.account.id,
+            "amount": "300.00",
+            "io_type": "WITHDRAW",
+            "transaction_type": "CARD",
+        }
+        create_url = reverse("transactions:transaction-create")
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(create_url, data, format="json")
+        # 커밋 전에는 무효화되지 않음
+        self.assertEqual(self.client.get(self.list_url).data[0]["balance"], "1000.00")
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.client.get(self.list_url).data[0]["balance"], "700.00")
+
+    def test_conditional_get_with_etag(self):
+        first = self.client.get(self.list_url)
+        etag = first["ETag"]
+        # 버전이 같으면 조회/직렬화 없이 304 (캐시 조회만 수행)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse("account-detail", args=[self.account.id]))
+        response = self.client.get(self.list_url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data, [])
+
+    def test_version_bumped_outside_request_changes_etag(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        # 요청 밖(관리 명령)에서 올린 버전도 같은 캐시에서 읽으므로 이전 ETag 로는 304 가 아님
+        # setUp 의 계좌는 거래 없이 잔액이 1000 이므로 원장 검사가 잔액을 0 으로 고침
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("reconcile_ledgers", "--repair", stdout=StringIO())
+        response = self.client.get(self.list_url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["balance"], "0.00")
+
+    def test_cache_stats(self):
+        self.client.get(self.list_url)
+        self.client.get(self.list_url)
+        stats_url = reverse("account-cache-stats")
+        self.assertEqual(
+            self.client.get(stats_url).status_code, status.HTTP_403_FORBIDDEN
+        )
+
+        admin = User.objects.create_user(
+            email="admin@example.com",
+            password="testpassword123",
+            nickname="admin",
+            is_staff=True,
+        )
+        self.client.force_authenticate(user=admin)
+        response = self.client.get(stats_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreaterEqual(response.data["hits"], 1)
+        self.assertGreaterEqual(response.data["misses"], 1)
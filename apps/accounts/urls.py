@@ -1,8 +1,25 @@
 from django.urls import path
 
-from .views import AccountDetailView, AccountListCreateView
+from apps.common.views import async_read_view
+
+from .views import (
+    AccountCacheStatsView,
+    AccountDetailAsyncView,
+    AccountDetailView,
+    AccountListAsyncView,
+    AccountListCreateView,
+)
 
 urlpatterns = [
-    path("", AccountListCreateView.as_view(), name="account-list-create"),
-    path("<int:pk>/", AccountDetailView.as_view(), name="account-detail"),
+    path(
+        "",
+        async_read_view(AccountListAsyncView, AccountListCreateView),
+        name="account-list-create",
+    ),
+    path(
+        "<int:pk>/",
+        async_read_view(AccountDetailAsyncView, AccountDetailView),
+        name="account-detail",
+    ),
+    path("cache-stats/", AccountCacheStatsView.as_view(), name="account-cache-stats"),
 ]
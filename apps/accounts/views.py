@@ -1,10 +1,23 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common.views import AsyncAPIView
+from config.db_routers import replica_reads
+
+from .cache import (
+    aget_account_list,
+    auser_data_etag,
+    bump_user_version,
+    get_account_list,
+    get_stats,
+    user_data_etag,
+)
 from .models import Account
-from .serializers import AccountSerializer
+from .serializers import AccountListSerializer, AccountSerializer
 
 
 class AccountListCreateView(APIView):
@@ -14,20 +27,47 @@ class AccountListCreateView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    # 사용자 데이터 버전으로 만든 ETag 가 If-None-Match 와 같으면 조회/직렬화 없이 304 응답
+    @method_decorator(condition(etag_func=user_data_etag))
+    @replica_reads
     def get(self, request):
         """사용자의 계좌 목록을 조회합니다."""
-        accounts = Account.objects.filter(user=request.user)
-        serializer = AccountSerializer(accounts, many=True)
-        return Response(serializer.data)
+
+        def build():
+            accounts = Account.objects.filter(user=request.user).values(
+                *AccountListSerializer.value_fields()
+            )
+            return AccountListSerializer(accounts).data  # 읽기 전용 목록 fast path
+
+        # 계좌 생성/삭제, 잔액 변경 시 무효화되는 사용자별 캐시
+        return Response(get_account_list(request.user.id, build))
 
     def post(self, request):
         """신규 계좌를 생성합니다."""
         serializer = AccountSerializer(data=request.data)
         if serializer.is_valid(raise_exception=True):
             serializer.save(user=request.user)  # 현재 로그인된 사용자를 user로 설정
+            bump_user_version(request.user.id)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class AccountListAsyncView(AsyncAPIView):
+    """AccountListCreateView.get 의 async 버전 (ASGI 에서 GET 요청 처리)"""
+
+    async def get_etag(self, request):
+        return await auser_data_etag(request)
+
+    @replica_reads
+    async def get(self, request):
+        async def build():
+            accounts = Account.objects.filter(user=request.user).values(
+                *AccountListSerializer.value_fields()
+            )
+            return AccountListSerializer([row async for row in accounts]).data
+
+        return Response(await aget_account_list(request.user.id, build))
+
+
 class AccountDetailView(APIView):
     """
     특정 계좌의 상세 조회, 수정, 삭제
@@ -61,4 +101,29 @@ class AccountDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
         account.delete()
+        bump_user_version(request.user.id)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class AccountDetailAsyncView(AsyncAPIView):
+    """AccountDetailView.get 의 async 버전 (ASGI 에서 GET 요청 처리)"""
+
+    async def get(self, request, pk):
+        account = await Account.objects.filter(pk=pk, user=request.user).afirst()
+        if account is None:
+            return Response(
+                {"error": "계좌를 찾을 수 없거나 권한이 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(AccountSerializer(account).data)
+
+
+class AccountCacheStatsView(APIView):
+    """
+    계좌 목록 캐시 적중/미스 횟수 조회 (관리자 전용, 요청을 처리한 프로세스 기준)
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_stats())
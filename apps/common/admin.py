@@ -1,3 +1,74 @@
+import json
+from datetime import timedelta
+
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    큰 테이블용 관리자 목록 페이지네이터
+
+    전체 건수를 COUNT(*) 대신 PostgreSQL 실행 계획의 예상 행 수(EXPLAIN)로 구한다.
+    예상 행 수가 exact_count_limit 이하이면 COUNT(*) 도 싸므로 정확한 건수를 센다.
+    PostgreSQL 이 아니면 기본 Paginator 와 같이 COUNT(*) 를 사용한다.
+    (ModelAdmin.show_full_result_count = False 와 함께 사용해야 필터 없는 전체 건수도 세지 않음)
+    """
+
+    exact_count_limit = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connections[queryset.db].vendor != "postgresql":
+            return super().count
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate <= self.exact_count_limit:
+            return super().count
+        return estimate
+
+
+class ReadOnlyAdminMixin:
+    """조회만 허용하는 ModelAdmin (추가/수정/삭제 버튼과 권한 없음)"""
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+class RecentPeriodListFilter(admin.SimpleListFilter):
+    """
+    최근 기간(24시간/7일/30일/1년)만 고르는 날짜 필터 (field_name: 날짜 컬럼)
+
+    date_hierarchy 는 목록을 열 때마다 날짜 컬럼의 MIN/MAX 와 연/월/일 목록(DISTINCT)을 조회하므로
+    날짜로 시작하는 인덱스가 없는 큰 테이블에서는 전체 스캔이 된다.
+    이 필터는 고정된 선택지를 보여 주고, 선택했을 때만 "field_name >= 시작 시각" 범위 조건을 건다.
+    """
+
+    title = "기간"
+    parameter_name = "period"
+    field_name = None
+    periods = (
+        ("1", "최근 24시간"),
+        ("7", "최근 7일"),
+        ("30", "최근 30일"),
+        ("365", "최근 1년"),
+    )
+
+    def lookups(self, request, model_admin):
+        return self.periods
 
-# Register your models here.
+    def queryset(self, request, queryset):
+        if self.value() not in dict(self.periods):
+            return queryset
+        since = timezone.now() - timedelta(days=int(self.value()))
+        return queryset.filter(**{f"{self.field_name}__gte": since})
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from apps.common.metrics import install_query_recorder
+
+        # 모든 DB 연결(primary/복제본)의 쿼리를 요청 지표에 기록
+        connection_created.connect(install_query_recorder)
@@ -0,0 +1,220 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
+
+# 요청별 SQL/지연 시간 계측
+#
+# request_metrics_middleware 가 요청마다 쿼리 수, DB 시간, 직렬화 시간, 전체 시간을 모아
+# - Server-Timing 응답 헤더로 내려주고 (브라우저 개발자 도구/부하 테스트 도구에서 확인)
+# - URL 이름(resolver_match.view_name)별로 집계해 관리자용 지표 API(/metrics/)로 보여준다.
+# 쿼리는 모든 DB 연결에 설치한 execute wrapper 가, 직렬화 시간은 measure_serialization 으로
+# 감싼 구간(ValuesListSerializer.data, FastJSONRenderer.render)이 기록한다.
+# 집계는 프로세스 메모리에 하므로 워커 프로세스별 값이다.
+
+logger = logging.getLogger(__name__)
+
+# 전체 시간 히스토그램 버킷 상한(ms) - 마지막 버킷은 그 이상 전부
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """QUERY_BUDGET_STRICT 에서 요청의 쿼리 수가 URL 이름별 예산을 넘음 (N+1 회귀)"""
+
+
+class RequestMetrics:
+    """요청 하나의 계측 값"""
+
+    __slots__ = ("queries", "db_time", "serialize_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+
+
+# 요청마다 새 객체를 넣음 (sync_to_async 로 넘어간 스레드에서도 같은 객체에 기록하도록 객체를 공유)
+_current = ContextVar("request_metrics", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    """DB 연결의 execute wrapper - 진행 중인 요청이 있으면 쿼리 수와 실행 시간을 기록"""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created 시그널 수신 - 새로 연결된 DB 연결에 record_query 를 설치"""
+    # 같은 연결 객체가 다시 연결될 때(연결 풀, CONN_MAX_AGE 만료 등) 중복 설치하지 않음
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def measure_serialization():
+    """감싼 구간의 시간을 진행 중인 요청의 직렬화 시간으로 기록"""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serialize_time += time.perf_counter() - started
+
+
+class EndpointStats:
+    """URL 이름 하나의 누적 지표"""
+
+    __slots__ = (
+        "count",
+        "total_time",
+        "max_time",
+        "db_time",
+        "serialize_time",
+        "queries",
+        "max_queries",
+        "over_budget",
+        "buckets",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = self.max_time = 0.0
+        self.db_time = self.serialize_time = 0.0
+        self.queries = self.max_queries = 0
+        self.over_budget = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, metrics, elapsed, over_budget):
+        self.count += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.db_time += metrics.db_time
+        self.serialize_time += metrics.serialize_time
+        self.queries += metrics.queries
+        self.max_queries = max(self.max_queries, metrics.queries)
+        self.over_budget += over_budget
+        elapsed_ms = elapsed * 1000
+        for index, upper in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= upper:
+                break
+        else:
+            index = len(LATENCY_BUCKETS_MS)
+        self.buckets[index] += 1
+
+    def as_dict(self):
+        labels = [f"le_{upper}ms" for upper in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_time / self.count * 1000, 3),
+            "max_ms": round(self.max_time * 1000, 3),
+            "avg_db_ms": round(self.db_time / self.count * 1000, 3),
+            "avg_serialize_ms": round(self.serialize_time / self.count * 1000, 3),
+            "avg_queries": round(self.queries / self.count, 2),
+            "max_queries": self.max_queries,
+            "over_budget": self.over_budget,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def record_request(name, metrics, elapsed):
+    """
+    URL 이름별 누적 지표에 요청 하나를 더한다.
+    쿼리 예산(QUERY_BUDGETS)을 넘으면 경고 로그를 남기고, QUERY_BUDGET_STRICT 이면 예외를 발생시킨다.
+    """
+    budget = settings.QUERY_BUDGETS.get(name)
+    over_budget = budget is not None and metrics.queries > budget
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = EndpointStats()
+        stats.add(metrics, elapsed, over_budget)
+    if over_budget:
+        message = f"쿼리 예산 초과: {name} {metrics.queries}건 (예산 {budget}건)"
+        if settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+def snapshot():
+    """URL 이름별 누적 지표 {URL 이름: 지표 dict}"""
+    with _stats_lock:
+        return {
+            name: dict(stats.as_dict(), query_budget=settings.QUERY_BUDGETS.get(name))
+            for name, stats in sorted(_stats.items())
+        }
+
+
+def reset():
+    with _stats_lock:
+        _stats.clear()
+
+
+def server_timing(metrics, elapsed):
+    """Server-Timing 헤더 값 (ms 단위)"""
+    return (
+        f'db;dur={metrics.db_time * 1000:.3f};desc="{metrics.queries} queries", '
+        f"serialize;dur={metrics.serialize_time * 1000:.3f}, "
+        f"total;dur={elapsed * 1000:.3f}"
+    )
+
+
+def finish_request(request, response, metrics, started):
+    elapsed = time.perf_counter() - started
+    if settings.SERVER_TIMING_HEADER:
+        response["Server-Timing"] = server_timing(metrics, elapsed)
+    # URL 패턴에 매칭되지 않은 요청(404)은 집계하지 않음
+    match = getattr(request, "resolver_match", None)
+    if match is not None:
+        record_request(match.view_name, metrics, elapsed)
+    return response
+
+
+@sync_and_async_middleware
+def request_metrics_middleware(get_response):
+    """요청마다 계측 값을 모아 Server-Timing 헤더와 URL 이름별 집계에 반영한다"""
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            metrics = RequestMetrics()
+            token = _current.set(metrics)
+            started = time.perf_counter()
+            try:
+                response = await get_response(request)
+            finally:
+                _current.reset(token)
+            return finish_request(request, response, metrics, started)
+
+        markcoroutinefunction(middleware)
+    else:
+
+        def middleware(request):
+            metrics = RequestMetrics()
+            token = _current.set(metrics)
+            started = time.perf_counter()
+            try:
+                response = get_response(request)
+            finally:
+                _current.reset(token)
+            return finish_request(request, response, metrics, started)
+
+    return middleware
@@ -0,0 +1,39 @@
+import codecs
+import io
+
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from apps.common.renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(parsers.JSONParser):
+    """
+    orjson 기반 JSON 파서 (orjson 이 설치되어 있지 않으면 DRF 기본 JSONParser 로 동작)
+
+    DRF JSONParser(STRICT_JSON) 와 같이 NaN/Infinity 는 허용하지 않는다.
+    orjson 이 읽지 못한 본문(64비트를 넘는 정수, 잘못된 JSON 등)은 DRF 기본 JSONParser 로 다시 읽으므로
+    결과와 오류(ParseError)가 DRF 와 같다.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None or not self.strict:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        raw = stream.read()
+        try:
+            data = raw
+            if codecs.lookup(encoding).name != "utf-8":
+                data = data.decode(encoding)
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # 64비트를 넘는 정수는 json 모듈은 읽을 수 있으므로 DRF 파서로 다시 읽음 (잘못된 JSON 이면 ParseError)
+            return super().parse(io.BytesIO(raw), media_type, parser_context)
+        except (ValueError, LookupError) as exc:
+            # UnicodeDecodeError 는 ValueError 의 하위 클래스
+            raise ParseError("JSON parse error - %s" % str(exc))
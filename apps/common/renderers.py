@@ -0,0 +1,83 @@
+import math
+from datetime import datetime
+from decimal import Decimal
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+from apps.common.metrics import measure_serialization
+
+try:
+    import orjson
+except ImportError:  # orjson 은 선택 의존성 - 없으면 DRF 기본 JSONRenderer 로 동작
+    orjson = None
+
+_drf_encoder = encoders.JSONEncoder()
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러
+
+    DRF JSONRenderer 와 같은 바이트를 만든다. (compact 구분자, UTF-8, U+2028/U+2029 이스케이프)
+    orjson 이 기본 지원하지 않는 값(datetime, Decimal, lazy 문자열 등)은 DRF JSONEncoder 의
+    변환 규칙을 그대로 사용한다. 다음 경우에는 DRF 기본 렌더러로 처리한다.
+
+    - orjson 이 설치되어 있지 않은 경우
+    - 들여쓰기(indent)를 요청한 경우 (Browsable API 등)
+    - COMPACT_JSON/UNICODE_JSON/STRICT_JSON 설정을 기본값에서 바꾼 경우
+    - orjson 이 직렬화하지 못하는 값(64비트를 넘는 정수 등)이 있는 경우
+
+    DRF 와 다른 점: 파이썬 float 의 NaN/Infinity 는 DRF(STRICT_JSON)처럼 오류를 내지 않고 null 로 쓴다.
+    orjson 이 float 를 default() 없이 직접 쓰기 때문이며, 응답 전체를 파이썬으로 훑어 찾으면
+    직렬화보다 몇 배 느려지므로 검사하지 않는다. (Decimal 의 NaN/Infinity 는 default()에서 DRF 와 같이 오류)
+    금액 등 API 응답의 숫자는 Decimal 또는 문자열이므로 NaN 이 float 로 나오는 필드는 없다.
+    """
+
+    # datetime 계열은 orjson 기본 형식 대신 DRF JSONEncoder 형식으로 직렬화
+    orjson_options = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # 요청 지표(Server-Timing)의 직렬화 시간에 포함
+        with measure_serialization():
+            return self.encode(data, accepted_media_type, renderer_context)
+
+    def encode(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            orjson is None
+            or not self.compact
+            or self.ensure_ascii
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.orjson_options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # DRF 와 같이 U+2028, U+2029 는 JavaScript 호환을 위해 이스케이프
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+    @staticmethod
+    def default(obj):
+        # 목록 응답에 가장 많은 두 타입은 DRF JSONEncoder 와 같은 변환을 바로 적용
+        if type(obj) is datetime:
+            value = obj.isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+        if type(obj) is Decimal:
+            value = float(obj)
+        else:
+            value = _drf_encoder.default(obj)
+        if isinstance(value, float) and not math.isfinite(value):
+            # STRICT_JSON 위반 - DRF 렌더러로 넘겨 같은 예외가 나도록 함
+            raise TypeError("Out of range float values are not JSON compliant")
+        return value
@@ -0,0 +1,123 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from apps.common.metrics import measure_serialization
+
+
+class ValuesListSerializer:
+    """
+    읽기 전용 목록 응답을 위한 직렬화 fast path
+
+    serializer_class(ModelSerializer)의 필드 구성을 그대로 따르되, 필드마다 변환 함수를
+    한 번만 만들어 두고 queryset.values() 결과 dict 에서 바로 응답 dict 를 만든다.
+    필드 객체를 거치는 DRF 직렬화와 같은 JSON 을 만들면서 행당 비용을 크게 줄인다.
+
+        rows = queryset.values(*TransactionHistoryListSerializer.value_fields())
+        TransactionHistoryListSerializer(rows).data
+    """
+
+    serializer_class = None
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def get_plan(cls):
+        """(응답 키, values() 컬럼명, 변환 함수 생성기) 목록 - 클래스마다 한 번만 계산"""
+        if "_plan" not in cls.__dict__:
+            plan = []
+            for name, field in cls.serializer_class().fields.items():
+                if field.write_only:
+                    continue
+                if field.source == "*" or "." in field.source:
+                    raise ImproperlyConfigured(
+                        f"{cls.__name__}: '{name}' 필드는 values()로 읽을 수 없습니다."
+                    )
+                plan.append((name, field.source, cls.get_converter_factory(field)))
+            cls._plan = plan
+        return cls._plan
+
+    @classmethod
+    def value_fields(cls):
+        """queryset.values()에 넘길 컬럼 목록"""
+        return [source for _, source, _ in cls.get_plan()]
+
+    @classmethod
+    def get_converter_factory(cls, field):
+        """
+        필드의 to_representation 과 같은 결과를 내는 변환 함수를 만드는 함수를 반환한다.
+        시간대처럼 요청마다 달라질 수 있는 값은 data 를 만들 때 한 번만 읽는다.
+        """
+        if isinstance(field, serializers.DecimalField):
+            if (
+                getattr(
+                    field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING
+                )
+                and field.decimal_places is not None
+                and not field.localize
+                and not field.normalize_output
+            ):
+                quantum = Decimal(".1") ** field.decimal_places
+                return lambda: lambda value: "{:f}".format(
+                    value.quantize(quantum, rounding=field.rounding)
+                )
+        elif isinstance(field, serializers.DateTimeField):
+            output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+            if output_format is not None and output_format.lower() == ISO_8601:
+                return lambda: cls.datetime_converter(field)
+        elif (
+            isinstance(field, serializers.PrimaryKeyRelatedField)
+            and field.pk_field is None
+        ) or type(field) in (
+            serializers.ChoiceField,
+            serializers.CharField,
+            serializers.IntegerField,
+        ):
+            # values()가 돌려주는 값(외래키 id, 선택지 값, 문자열, 정수)을 그대로 사용
+            return lambda: None
+        # 그 밖의 필드는 DRF 필드의 to_representation 을 그대로 사용
+        return lambda: field.to_representation
+
+    @staticmethod
+    def datetime_converter(field):
+        field_timezone = getattr(field, "timezone", None) or (
+            timezone.get_current_timezone() if settings.USE_TZ else None
+        )
+        if field_timezone is None:
+            return field.to_representation
+
+        def convert(value):
+            if timezone.is_naive(value):
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+        return convert
+
+    @property
+    def data(self):
+        # 요청 지표(Server-Timing)의 직렬화 시간에 포함
+        with measure_serialization():
+            return self.build_data()
+
+    def build_data(self):
+        plan = [
+            (name, source, make_converter())
+            for name, source, make_converter in self.get_plan()
+        ]
+        return [
+            {
+                name: (
+                    value
+                    if (value := row[source]) is None or convert is None
+                    else convert(value)
+                )
+                for name, source, convert in plan
+            }
+            for row in self.rows
+        ]
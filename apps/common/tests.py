@@ -1,3 +1,578 @@
-from django.test import TestCase
+import importlib
+import io
+import os
+import subprocess
+import sys
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from importlib import import_module
+from unittest import mock, skipIf
+from uuid import UUID
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import clear_url_caches, resolve, reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.authentication import BaseAuthentication, SessionAuthentication
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import (
+    APIRequestFactory,
+    APITestCase,
+    APITransactionTestCase,
+    force_authenticate,
+)
+from rest_framework.throttling import BaseThrottle
+
+from apps.accounts.models import Account
+from apps.accounts.views import (
+    AccountDetailAsyncView,
+    AccountDetailView,
+    AccountListCreateView,
+)
+from apps.common import metrics, parsers, renderers
+from apps.common.parsers import FastJSONParser
+from apps.common.renderers import FastJSONRenderer
+from apps.common.views import async_read_view
+from apps.transactions.models import Transaction
+from apps.transactions.views import TransactionView
+from apps.users.authentication import issue_refresh_token
+from apps.users.models import User
+from apps.users.permissions import IsOwner
+from apps.users.views import UserProfileAPIView
+from config.db_routers import PIN_KEY, ReplicaRouter, _RoutingState, _state
+
+
+class FastJSONRendererTestCase(SimpleTestCase):
+    data = {
+        "results": [
+            {
+                "id": 1,
+                "amount": Decimal("1234.50"),
+                "balance_after": "1000.00",
+                "description": "줄 구분자\u2028문단 구분자\u2029",
+                "transaction_date": timezone.now(),
+                "naive": datetime(2025, 1, 2, 3, 4, 5, 123456),
+                "day": date(2025, 1, 2),
+                "time": time(3, 4, 5),
+                "duration": timedelta(seconds=90),
+                "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+                "lazy": gettext_lazy("지연 번역 문자열"),
+                "tuple": (1, 2),
+                "empty": None,
+                "flag": True,
+                1: "정수 키",
+            }
+        ],
+        "next": None,
+    }
+
+    @skipIf(renderers.orjson is None, "orjson 미설치")
+    def test_same_bytes_as_drf_renderer(self):
+        self.assertEqual(
+            FastJSONRenderer().render(self.data), JSONRenderer().render(self.data)
+        )
+
+    def test_indent_uses_drf_renderer(self):
+        media_type = "application/json; indent=4"
+        self.assertEqual(
+            FastJSONRenderer().render(self.data, media_type),
+            JSONRenderer().render(self.data, media_type),
+        )
+
+    def test_fallback_without_orjson(self):
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(
+                FastJSONRenderer().render(self.data), JSONRenderer().render(self.data)
+            )
+
+    def test_unsupported_values_use_drf_renderer(self):
+        # 64비트를 넘는 정수는 DRF 렌더러로 처리
+        data = {"big": 2**70}
+        self.assertEqual(FastJSONRenderer().render(data), b'{"big":%d}' % 2**70)
+        # NaN 은 DRF(STRICT_JSON) 와 같이 오류
+        with self.assertRaises(ValueError):
+            FastJSONRenderer().render({"amount": Decimal("NaN")})
+
+    @skipIf(renderers.orjson is None, "orjson 미설치")
+    def test_native_float_nan_renders_null(self):
+        # 문서화한 DRF 와의 차이 - float NaN/Infinity 는 검사하지 않고 orjson 과 같이 null
+        data = {"nan": float("nan"), "inf": float("inf")}
+        self.assertEqual(FastJSONRenderer().render(data), b'{"nan":null,"inf":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+
+class FastJSONParserTestCase(SimpleTestCase):
+    def parse(self, body, encoding="utf-8"):
+        return FastJSONParser().parse(io.BytesIO(body), None, {"encoding": encoding})
+
+    def test_parse(self):
+        body = '{"amount": 10.5, "description": "입금", "items": [1, null]}'
+        expected = {"amount": 10.5, "description": "입금", "items": [1, None]}
+        self.assertEqual(self.parse(body.encode()), expected)
+        self.assertEqual(self.parse(body.encode("utf-16"), "utf-16"), expected)
+        with mock.patch.object(parsers, "orjson", None):
+            self.assertEqual(self.parse(body.encode()), expected)
+
+    def test_big_integer_matches_drf_parser(self):
+        # orjson 은 64비트를 넘는 정수를 읽지 못하므로 DRF 파서로 다시 읽음
+        body = b'{"amount": %d}' % 2**70
+        self.assertEqual(self.parse(body), {"amount": 2**70})
+        self.assertEqual(
+            self.parse(body), JSONParser().parse(io.BytesIO(body), None, {})
+        )
+
+    def test_invalid_json(self):
+        for body in (b"{", b'{"amount": NaN}', b"\xff"):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(body)
+
+
+def reload_urlconfs():
+    """ASYNC_READ_VIEWS 는 URL 설정을 import 할 때 반영되므로 설정을 바꾼 뒤 URL 모듈을 다시 읽음"""
+    for name in (
+        "apps.accounts.urls",
+        "apps.transactions.urls",
+        "apps.users.urls",
+        settings.ROOT_URLCONF,
+    ):
+        importlib.reload(import_module(name))
+    clear_url_caches()
+
+
+class DenyAllThrottle(BaseThrottle):
+    def allow_request(self, request, view):
+        return False
+
+    def wait(self):
+        return 30
+
+
+class HeaderUserAuthentication(BaseAuthentication):
+    """aauthenticate() 가 없는 sync 인증 클래스 (X-User-Id 헤더의 사용자로 인증, DB 조회)"""
+
+    def authenticate(self, request):
+        user_id = request.META.get("HTTP_X_USER_ID")
+        if user_id is None:
+            return None
+        return User.objects.get(pk=user_id), None
+
+
+class AsyncReadViewTestCase(APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        # 테스트는 WSGI 기본값(async 뷰 꺼짐)으로 실행되므로 ASGI 배포처럼 켜고 URL 을 다시 만듦
+        cls.addClassCleanup(reload_urlconfs)  # 설정을 되돌린 뒤 다시 읽음
+        cls.enterClassContext(override_settings(ASYNC_READ_VIEWS=True))
+        reload_urlconfs()
+        super().setUpClass()
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="async@example.com", password="testpassword123", nickname="async"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="1111111111", balance=Decimal("1000.00")
+        )
+        Transaction.objects.create(
+            account=self.account,
+            amount=Decimal("1000.00"),
+            io_type="DEPOSIT",
+            transaction_type="ATM",
+            balance_after=Decimal("1000.00"),
+        )
+        token = issue_refresh_token(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.factory = APIRequestFactory()
+        self.endpoints = [
+            (reverse("account-list-create"), AccountListCreateView, {}),
+            (
+                reverse("account-detail", args=[self.account.pk]),
+                AccountDetailView,
+                {"pk": self.account.pk},
+            ),
+            (reverse("transactions:transaction-list"), TransactionView, {}),
+            (
+                reverse("users:user_profile", args=[self.user.pk]),
+                UserProfileAPIView,
+                {"pk": self.user.pk},
+            ),
+        ]
+
+    def test_read_views_are_async(self):
+        for url, _, _ in self.endpoints:
+            with self.subTest(url=url):
+                self.assertTrue(iscoroutinefunction(resolve(url).func))
+
+    def test_async_response_matches_sync_view(self):
+        for url, sync_view_class, kwargs in self.endpoints:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response["Content-Type"], "application/json")
+
+                request = self.factory.get(url)
+                force_authenticate(request, user=self.user)
+                expected = sync_view_class.as_view()(request, **kwargs)
+                self.assertEqual(response.data, expected.data)
+
+    def test_unauthenticated_request(self):
+        self.client.credentials()
+        response = self.client.get(reverse("account-list-create"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("Bearer", response["WWW-Authenticate"])
+
+    def test_errors_use_drf_format(self):
+        other = User.objects.create_user(
+            email="other@example.com", password="testpassword123", nickname="other"
+        )
+        response = self.client.get(reverse("users:user_profile", args=[other.pk]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data["detail"], IsOwner.message)
+
+        response = self.client.get(reverse("users:user_profile", args=[0]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(
+            reverse("transactions:transaction-list"), {"io_type": "UNKNOWN"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("io_type", response.data)
+
+    def test_declared_permissions_and_throttles(self):
+        class AdminOnlyDetailView(AccountDetailView):
+            permission_classes = [IsAdminUser]
+
+        class ThrottledDetailView(AccountDetailView):
+            throttle_classes = [DenyAllThrottle]
+
+        kwargs = {"pk": self.account.pk}
+        request = self.factory.get(reverse("account-detail", kwargs=kwargs))
+        force_authenticate(request, user=self.user)
+
+        # sync 뷰에 선언된 권한/스로틀이 async 경로에도 적용됨
+        view = async_read_view(AccountDetailAsyncView, AdminOnlyDetailView)
+        response = async_to_sync(view)(request, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        view = async_read_view(AccountDetailAsyncView, ThrottledDetailView)
+        response = async_to_sync(view)(request, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "30")
+
+    def test_sync_authentication_classes(self):
+        class HeaderAuthDetailView(AccountDetailView):
+            authentication_classes = [HeaderUserAuthentication]
+
+        class SessionAuthDetailView(AccountDetailView):
+            authentication_classes = [SessionAuthentication]
+
+        kwargs = {"pk": self.account.pk}
+        url = reverse("account-detail", kwargs=kwargs)
+
+        # aauthenticate 가 없으면 authenticate() 를 스레드에서 실행
+        view = async_read_view(AccountDetailAsyncView, HeaderAuthDetailView)
+        request = self.factory.get(url, HTTP_X_USER_ID=str(self.user.pk))
+        response = async_to_sync(view)(request, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], self.account.pk)
+
+        # 세션 인증은 WWW-Authenticate 헤더가 없으므로 DRF 와 같이 인증 실패를 403 으로 응답
+        view = async_read_view(AccountDetailAsyncView, SessionAuthDetailView)
+        response = async_to_sync(view)(self.factory.get(url), **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+# DB_REPLICA_HOSTS 로 복제본을 설정하면 실제 복제본 별칭으로, 아니면 default 로 확인
+# 복제본은 별도 연결이므로 커밋된 데이터만 보임 (TransactionTestCase 사용)
+@override_settings(DATABASE_REPLICAS=settings.DATABASE_REPLICAS or ["default"])
+class ReplicaRouterTestCase(APITransactionTestCase):
+    databases = "__all__"
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="replica@example.com", password="testpassword123", nickname="replica"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="2222222222", balance=Decimal("0.00")
+        )
+        token = issue_refresh_token(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.router = ReplicaRouter()
+        # 복제본을 골랐는지 기록
+        patcher = mock.patch(
+            "config.db_routers.random.choice", side_effect=lambda aliases: aliases[0]
+        )
+        self.choose_replica = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_outside_request_use_primary(self):
+        self.assertIsNone(self.router.db_for_read(Account))
+        self.assertIsNone(self.router.db_for_write(Account))
+
+    def test_writes_in_request_move_later_reads_to_primary(self):
+        state = _RoutingState()
+        state.use_replica = True
+        token = _state.set(state)
+        try:
+            self.assertEqual(
+                self.router.db_for_read(Account), settings.DATABASE_REPLICAS[0]
+            )
+            self.assertIsNone(self.router.db_for_write(Account))
+            self.assertIsNone(self.router.db_for_read(Account))
+        finally:
+            _state.reset(token)
+
+    def test_request_reads_from_one_replica(self):
+        state = _RoutingState()
+        state.use_replica = True
+        token = _state.set(state)
+        try:
+            with mock.patch(
+                "config.db_routers.random.choice", side_effect=["replica1", "replica2"]
+            ) as choose_replica:
+                self.assertEqual(self.router.db_for_read(Account), "replica1")
+                self.assertEqual(self.router.db_for_read(Transaction), "replica1")
+            self.assertEqual(choose_replica.call_count, 1)
+        finally:
+            _state.reset(token)
+
+    def test_read_endpoints_use_replica(self):
+        urls = [
+            reverse("account-list-create"),
+            reverse("transactions:transaction-list"),
+            reverse("transactions:transaction-summary"),
+            reverse("transactions:transaction-export"),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.choose_replica.reset_mock()
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                if hasattr(response, "streaming_content"):
+                    b"".join(response.streaming_content)
+                self.assertTrue(self.choose_replica.called)
+
+    def test_user_reads_primary_after_write(self):
+        response = self.client.post(
+            reverse("account-list-create"),
+            {
+                "account_number": "3333333333",
+                "bank_code": "004",
+                "account_type": "CHECKING",
+                "balance": "0.00",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.choose_replica.reset_mock()
+        response = self.client.get(reverse("account-list-create"))
+        self.assertEqual(len(response.data), 2)
+        self.assertFalse(self.choose_replica.called)
+
+        # 고정 시간이 지나면 다시 복제본에서 읽음
+        cache.delete(PIN_KEY.format(user_id=self.user.id))
+        self.client.get(reverse("transactions:transaction-list"))
+        self.assertTrue(self.choose_replica.called)
+
+
+class ProdSettingsTestCase(SimpleTestCase):
+    """운영 설정(config.settings.prod)은 새 프로세스에서 읽어 확인 (설정은 import 할 때 한 번만 평가됨)"""
+
+    def load(self, **env):
+        env = {**os.environ, "DJANGO_SECRET_KEY": "x" * 50, **env}
+        return subprocess.run(
+            [sys.executable, "-c", "import config.settings.prod"],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    def test_requires_shared_cache(self):
+        # 복제본이 없어도 계좌 목록 캐시 버전/ETag 를 워커끼리 공유해야 함
+        for replica_hosts in ("", "localhost"):
+            with self.subTest(replica_hosts=replica_hosts):
+                result = self.load(DB_REPLICA_HOSTS=replica_hosts, REDIS_URL="")
+                self.assertNotEqual(result.returncode, 0)
+                self.assertIn("ImproperlyConfigured", result.stderr)
+
+        result = self.load(DB_REPLICA_HOSTS="localhost", REDIS_URL="redis://cache")
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class QueryBudgetTestCase(APITestCase):
+    """
+    URL 이름별 쿼리 예산(settings.QUERY_BUDGETS) 검증
+
+    계좌/거래가 여러 건인 사용자로 모든 API 를 호출하며, 캐시가 비어 있는 상태에서도
+    예산을 넘으면 QUERY_BUDGET_STRICT 에 의해 요청이 실패한다. (행마다 쿼리를 보내는 N+1 회귀 검출)
+    """
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.user = User.objects.create_user(
+            email="budget@example.com", password="testpassword123", nickname="budget"
+        )
+        self.accounts = [
+            Account.objects.create(
+                user=self.user,
+                account_number=f"BUDGET-{index}",
+                balance=Decimal("1000.00"),
+            )
+            for index in range(3)
+        ]
+        Transaction.objects.bulk_create(
+            Transaction(
+                account=account,
+                amount=Decimal("10.00"),
+                balance_after=Decimal("1000.00"),
+                io_type="DEPOSIT",
+                transaction_type="ATM",
+            )
+            for account in self.accounts
+            for _ in range(20)
+        )
+        token = issue_refresh_token(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def request(self, method, url, data=None):
+        response = getattr(self.client, method)(url, data, format="json")
+        self.assertLess(response.status_code, 400, url)
+        # 캐시를 비워 매 요청을 처음 요청처럼 측정
+        cache.clear()
+        return response
+
+    def test_endpoints_stay_within_query_budget(self):
+        account = self.accounts[0]
+        transaction = Transaction.objects.filter(account=account).first()
+        self.request(
+            "post",
+            reverse("users:register"),
+            {
+                "email": "budget-new@example.com",
+                "nickname": "budget-new",
+                "name": "예산",
+                "phone_number": "01000000000",
+                "password": "testpassword123",
+                "password2": "testpassword123",
+            },
+        )
+        self.request(
+            "post",
+            reverse("users:jwt_login"),
+            {
+                "email": "budget@example.com",
+                "password": "testpassword123",
+            },
+        )
+        self.request("get", reverse("users:user_profile", args=[self.user.pk]))
+        self.request("get", reverse("account-list-create"))
+        self.request(
+            "post",
+            reverse("account-list-create"),
+            {
+                "account_number": "BUDGET-NEW",
+                "bank_code": "004",
+                "account_type": "CHECKING",
+            },
+        )
+        self.request("get", reverse("account-detail", args=[account.pk]))
+        self.request("get", reverse("transactions:transaction-list"))
+        self.request("get", reverse("transactions:transaction-summary"))
+        response = self.request("get", reverse("transactions:transaction-export"))
+        b"".join(response.streaming_content)
+        self.request(
+            "post",
+            reverse("transactions:transaction-create"),
+            {
+                "account": account.pk,
+                "amount": "5.00",
+                "io_type": "DEPOSIT",
+                "transaction_type": "ATM",
+            },
+        )
+        self.request(
+            "post",
+            reverse("transactions:transaction-bulk-create"),
+            [
+                {
+                    "account": item.pk,
+                    "amount": "1.00",
+                    "io_type": io_type,
+                    "transaction_type": "ATM",
+                }
+                for item in self.accounts
+                for io_type in ("DEPOSIT", "WITHDRAW")
+            ],
+        )
+        detail_url = reverse("transactions:transaction-detail", args=[transaction.pk])
+        self.request("put", detail_url, {"description": "수정"})
+        # 금액을 줄이면 이후 거래 최소 잔액 확인, 이후 거래/계좌 잔액 갱신까지 실행
+        self.request("put", detail_url, {"amount": "5.00", "transaction_type": "CARD"})
+        self.request("delete", detail_url)
+        # 로그인 응답의 refresh_token 쿠키로 로그아웃
+        self.request("post", reverse("users:jwt_logout"))
+
+        recorded = metrics.snapshot()
+        for name, budget in settings.QUERY_BUDGETS.items():
+            with self.subTest(name=name):
+                self.assertIn(name, recorded)  # 예산이 있는 API 는 모두 호출해 봄
+                self.assertLessEqual(recorded[name]["max_queries"], budget)
+
+    def test_over_budget_request_fails_in_strict_mode(self):
+        with override_settings(QUERY_BUDGETS={"account-list-create": 0}):
+            with self.assertRaises(metrics.QueryBudgetExceeded):
+                self.client.get(reverse("account-list-create"))
+
+
+class RequestMetricsTestCase(APITestCase):
+    def setUp(self):
+        metrics.reset()
+        self.user = User.objects.create_user(
+            email="metrics@example.com", password="testpassword123", nickname="metrics"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.metrics_url = reverse("request-metrics")
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("account-list-create"))
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="\d+ queries", serialize;dur=[\d.]+, total;dur=[\d.]+$',
+        )
+
+    def test_metrics_endpoint_is_staff_only(self):
+        self.client.get(reverse("account-list-create"))
+        self.assertEqual(
+            self.client.get(self.metrics_url).status_code, status.HTTP_403_FORBIDDEN
+        )
+
+        self.user.is_staff = True
+        self.user.save(update_fields=["is_staff"])
+        endpoints = self.client.get(self.metrics_url).data["endpoints"]
+        stats = endpoints["account-list-create"]
+        self.assertEqual(stats["count"], 1)
+        self.assertGreater(stats["max_queries"], 0)
+        self.assertEqual(sum(stats["histogram"].values()), 1)
+        self.assertEqual(
+            stats["query_budget"], settings.QUERY_BUDGETS["account-list-create"]
+        )
+
+        response = self.client.delete(self.metrics_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotIn("account-list-create", metrics.snapshot())
@@ -1,3 +1,214 @@
-from django.shortcuts import render
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from drf_spectacular.utils import extend_schema
+from rest_framework import exceptions, status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView, exception_handler
 
-# Create your views here.
+from apps.common import metrics
+from apps.common.renderers import FastJSONRenderer
+
+
+class AsyncAPIView(View):
+    """
+    읽기 전용 async API 뷰 (DRF 3.16 의 APIView 는 async 핸들러를 지원하지 않음)
+
+    DRF APIView 와 같은 응답을 내도록 다음을 처리한다. 하위 클래스는 async get() 만 구현한다.
+    - authentication_classes 의 aauthenticate()로 인증하며 인증되지 않은 요청은 401
+      (aauthenticate 가 없는 DRF/외부 인증 클래스는 authenticate()를 스레드에서 실행)
+    - permission_classes 의 has_permission() 검사 후 throttle_classes 검사
+      (async_read_view 가 sync DRF 뷰에 선언된 클래스로 지정)
+    - get_etag()가 값을 돌려주면 If-None-Match 와 비교해 조회/직렬화 없이 304 응답
+    - APIException, Http404, PermissionDenied 는 DRF 예외 처리기로 변환
+    - 핸들러가 돌려준 DRF Response 는 JSON 으로 렌더링 (Browsable API 는 지원하지 않음)
+    """
+
+    renderer_class = FastJSONRenderer
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = api_settings.DEFAULT_PERMISSION_CLASSES
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.query_params = request.GET  # DRF Request 와 같은 이름으로 제공
+        etag = None
+        try:
+            await self.perform_authentication(request)
+            self.check_permissions(request)
+            await self.check_throttles(request)
+            if request.method in ("GET", "HEAD"):
+                etag = await self.get_etag(request)
+                if etag is not None:
+                    etag = quote_etag(etag)
+                    not_modified = get_conditional_response(request, etag=etag)
+                    if not_modified is not None:
+                        return not_modified
+            response = await super().dispatch(request, *args, **kwargs)
+        except (exceptions.APIException, Http404, PermissionDenied) as exc:
+            response = self.handle_exception(request, exc)
+        else:
+            if etag is not None:
+                response.headers.setdefault("ETag", etag)
+        return self.finalize_response(request, response)
+
+    async def perform_authentication(self, request):
+        # 테스트의 APIClient.force_authenticate() (DRF APIView 와 동일하게 처리)
+        force_user = getattr(request, "_force_auth_user", None)
+        force_token = getattr(request, "_force_auth_token", None)
+        if force_user is not None or force_token is not None:
+            request.user, request.auth = force_user, force_token
+            if force_user is None:
+                raise exceptions.NotAuthenticated()
+            return
+
+        for authentication_class in self.authentication_classes:
+            authenticator = authentication_class()
+            if hasattr(authenticator, "aauthenticate"):
+                result = await authenticator.aauthenticate(request)
+            else:
+                # sync 인증 클래스는 DRF Request 를 받으며 DB 를 조회할 수 있으므로 스레드에서 실행
+                result = await sync_to_async(authenticator.authenticate)(
+                    Request(request)
+                )
+            if result is not None:
+                request.user, request.auth = result
+                return
+        raise exceptions.NotAuthenticated()
+
+    def get_permissions(self):
+        return [permission() for permission in self.permission_classes]
+
+    def check_permissions(self, request):
+        """
+        뷰 레벨 권한 검사 (DRF APIView.check_permissions 와 같음)
+        이벤트 루프에서 바로 호출하므로 권한 클래스의 has_permission 은 DB 를 조회하지 않아야 함
+        """
+        for permission in self.get_permissions():
+            if not permission.has_permission(request, self):
+                raise exceptions.PermissionDenied(
+                    getattr(permission, "message", None),
+                    code=getattr(permission, "code", None),
+                )
+
+    def check_object_permissions(self, request, obj):
+        """객체 레벨 권한 검사 (DRF APIView.check_object_permissions 와 같음)"""
+        for permission in self.get_permissions():
+            if not permission.has_object_permission(request, self, obj):
+                raise exceptions.PermissionDenied(
+                    getattr(permission, "message", None),
+                    code=getattr(permission, "code", None),
+                )
+
+    def get_throttles(self):
+        return [throttle() for throttle in self.throttle_classes]
+
+    async def check_throttles(self, request):
+        """스로틀 검사 (DRF APIView.check_throttles 와 같음) - 캐시를 읽고 쓰므로 스레드에서 실행"""
+        durations = []
+        for throttle in self.get_throttles():
+            if not await sync_to_async(throttle.allow_request)(request, self):
+                durations.append(throttle.wait())
+        if durations:
+            durations = [duration for duration in durations if duration is not None]
+            raise exceptions.Throttled(max(durations, default=None))
+
+    async def get_etag(self, request):
+        """응답 ETag - None 이면 조건부 요청을 처리하지 않음"""
+        return None
+
+    def handle_exception(self, request, exc):
+        if isinstance(
+            exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)
+        ):
+            # DRF APIView 와 같이 WWW-Authenticate 헤더를 줄 수 없는 인증 방식이면 403
+            auth_header = None
+            if self.authentication_classes:
+                authentication_class = self.authentication_classes[0]
+                auth_header = authentication_class().authenticate_header(request)
+            if auth_header:
+                exc.auth_header = auth_header
+            else:
+                exc.status_code = status.HTTP_403_FORBIDDEN
+        response = exception_handler(exc, {"view": self, "request": request})
+        if response is None:
+            raise exc
+        return response
+
+    def finalize_response(self, request, response):
+        if isinstance(response, Response):
+            response.accepted_renderer = self.renderer_class()
+            response.accepted_media_type = self.renderer_class.media_type
+            response.renderer_context = {
+                "view": self,
+                "request": request,
+                "response": response,
+            }
+        return response
+
+
+def async_read_view(async_view_class, sync_view_class):
+    """
+    GET/HEAD 는 async 뷰로, 나머지 메서드는 기존 sync DRF 뷰로 보내는 URL 뷰를 만든다.
+
+    ASGI 로 실행할 때 읽기 요청이 스레드 풀을 거치지 않게 하기 위한 것으로,
+    ASYNC_READ_VIEWS 설정이 꺼져 있으면(WSGI 배포 시 기본값) sync 뷰를 그대로 사용한다.
+    """
+    sync_view = sync_view_class.as_view()
+    if not settings.ASYNC_READ_VIEWS:
+        return sync_view
+    # 인증/권한/스로틀은 sync 뷰에 선언된 것을 그대로 적용 (메서드에 따라 검사가 달라지지 않도록)
+    async_view = async_view_class.as_view(
+        authentication_classes=sync_view.cls.authentication_classes,
+        permission_classes=sync_view.cls.permission_classes,
+        throttle_classes=sync_view.cls.throttle_classes,
+    )
+    sync_view_in_thread = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method in ("GET", "HEAD"):
+            return await async_view(request, *args, **kwargs)
+        return await sync_view_in_thread(request, *args, **kwargs)
+
+    # DRF APIView.as_view() 와 같이 세션 인증 외에는 CSRF 검사 안 함
+    view = csrf_exempt(view)
+    # API 스키마(drf-spectacular)는 기존 DRF 뷰 기준으로 생성
+    view.cls = sync_view.cls
+    view.initkwargs = sync_view.initkwargs
+    return view
+
+
+class RequestMetricsView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+        summary="URL 이름별 요청 지표 조회 (관리자 전용)",
+        description=(
+            "이 프로세스가 처리한 요청의 URL 이름별 건수, 평균/최대 응답 시간, 평균 DB/직렬화 시간, "
+            "평균/최대 쿼리 수, 쿼리 예산 초과 건수와 응답 시간 히스토그램을 조회합니다."
+        ),
+        responses={
+            200: {"description": "URL 이름별 지표"},
+            401: {"description": "인증 정보 없음 (Unauthorized)"},
+            403: {"description": "관리자가 아님 (Forbidden)"},
+        },
+        tags=["metrics"],
+    )
+    def get(self, request):
+        return Response({"endpoints": metrics.snapshot()}, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="요청 지표 초기화 (관리자 전용)",
+        responses={204: None, 403: {"description": "관리자가 아님 (Forbidden)"}},
+        tags=["metrics"],
+    )
+    def delete(self, request):
+        metrics.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
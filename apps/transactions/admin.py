@@ -1,3 +1,60 @@
 from django.contrib import admin
 
-# Register your models here.
+from apps.common.admin import (
+    EstimatedCountPaginator,
+    ReadOnlyAdminMixin,
+    RecentPeriodListFilter,
+)
+
+from .models import Transaction, TransactionArchive
+
+
+class TransactionDateListFilter(RecentPeriodListFilter):
+    title = "거래 일시"
+    field_name = "transaction_date"
+
+
+# 거래/보관 거래는 관리자에서 조회만 가능
+# (잔액, 일일 집계를 함께 맞춰야 하므로 거래 변경은 API 로만 함)
+@admin.register(Transaction)
+class TransactionAdmin(ReadOnlyAdminMixin, admin.ModelAdmin):
+    list_display = (
+        "id",
+        "account",
+        "io_type",
+        "transaction_type",
+        "amount",
+        "balance_after",
+        "transaction_date",
+    )
+    # 계좌 열(Account.__str__ 의 사용자 닉네임 포함)을 행마다 조회하지 않도록 한 번에 JOIN
+    list_select_related = ("account__user",)
+    # 날짜는 date_hierarchy(목록마다 MIN/MAX, DISTINCT 날짜 조회) 대신 최근 기간 필터로 좁힘
+    list_filter = (TransactionDateListFilter, "io_type", "transaction_type")
+    # 계좌번호 완전 일치만 검색 (LIKE 검색은 거래 테이블 전체를 읽게 됨)
+    search_fields = ["=account__account_number"]
+    # id 역순은 기본 키 인덱스를 그대로 따라 읽으므로 정렬 비용이 없음
+    ordering = ("-id",)
+    # 수천만 건 테이블에서 COUNT(*) 를 하지 않도록 예상 건수 사용 + 전체 건수 표시 끔
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(TransactionArchive)
+class TransactionArchiveAdmin(ReadOnlyAdminMixin, admin.ModelAdmin):
+    list_display = (
+        "id",
+        "account",
+        "io_type",
+        "transaction_type",
+        "amount",
+        "balance_after",
+        "transaction_date",
+        "archived_at",
+    )
+    list_select_related = ("account__user",)
+    list_filter = (TransactionDateListFilter, "io_type", "transaction_type")
+    search_fields = ["=account__account_number"]
+    ordering = ("-id",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
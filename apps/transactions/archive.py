@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from apps.transactions.models import Transaction, TransactionArchive
+
+# 오래된 거래 내역 보관(cold storage)
+#
+# archive_transactions 관리 명령이 TRANSACTION_ARCHIVE_AFTER_DAYS 보다 오래된 거래를
+# 거래 내역 테이블에서 보관 테이블(TransactionArchive)로 옮겨 자주 읽는 테이블과 인덱스를 작게 유지한다.
+# 거래 내역 조회/내보내기는 조회 기간이 보관된 가장 최근 거래 일시(archive_horizon)에 걸칠 때만
+# 보관 테이블을 함께 읽어 (거래 일시, id) 순서로 합친다.
+# 일일 집계(TransactionDailySummary)는 보관 거래를 그대로 포함하므로 통계는 바뀌지 않는다.
+
+# 보관 테이블로 그대로 복사할 컬럼 (archived_at 은 보관 시 채워짐)
+ARCHIVE_FIELDS = [
+    field.attname
+    for field in TransactionArchive._meta.concrete_fields
+    if field.name != "archived_at"
+]
+
+
+def archive_cutoff(days=None):
+    """이 시각보다 이전 거래를 보관 대상으로 본다 (days 생략 시 TRANSACTION_ARCHIVE_AFTER_DAYS)"""
+    if days is None:
+        days = settings.TRANSACTION_ARCHIVE_AFTER_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archive_transactions(before, batch_size=5000):
+    """
+    before 이전 거래를 batch_size 건씩 보관 테이블로 옮기고 옮긴 건수를 반환한다.
+
+    배치마다 복사와 삭제를 한 트랜잭션으로 처리하므로 중간에 멈춰도 거래가 사라지거나 중복되지 않는다.
+    옮길 행을 잠그고 읽으므로 동시에 수정 중인 거래는 수정이 커밋된 뒤의 값으로 옮겨진다.
+    """
+    moved = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Transaction.objects.select_for_update()
+                .filter(transaction_date__lt=before)
+                .values(*ARCHIVE_FIELDS)[:batch_size]
+            )
+            if not rows:
+                break
+            TransactionArchive.objects.bulk_create(
+                [TransactionArchive(**row) for row in rows]
+            )
+            # transaction_date 조건은 파티션 테이블에서 오래된 파티션만 보도록 하기 위한 것
+            Transaction.objects.filter(
+                id__in=[row["id"] for row in rows], transaction_date__lt=before
+            ).delete()
+        moved += len(rows)
+    return moved
+
+
+def archive_horizon():
+    """보관된 가장 최근 거래 일시 (보관 거래가 없으면 None)"""
+    return TransactionArchive.objects.aggregate(newest=Max("transaction_date"))[
+        "newest"
+    ]
+
+
+async def aarchive_horizon():
+    """archive_horizon 의 async 버전"""
+    result = await TransactionArchive.objects.aaggregate(newest=Max("transaction_date"))
+    return result["newest"]
@@ -0,0 +1,56 @@
+from django.db.models import F, Min, Q
+
+from apps.transactions.models import Transaction
+
+# 거래 수정/삭제 시 거래 후 잔액(balance_after) 재계산
+#
+# 거래 하나의 금액/입출금 타입이 바뀌거나 거래가 삭제되면, 같은 계좌에서 그 이후 거래들의
+# 거래 후 잔액과 계좌 잔액이 모두 같은 값(delta)만큼 달라진다.
+# 이후 거래를 파이썬에서 하나씩 고치지 않고 UPDATE 한 번으로 delta 를 더한다.
+# 거래 순서는 (거래 일시, id) 이며, 보관 거래는 항상 거래 내역 테이블의 거래보다 오래됐으므로 대상이 아니다.
+
+
+def signed_amount(transaction_obj):
+    """거래가 계좌 잔액에 주는 영향 (입금은 +금액, 출금은 -금액)"""
+    if transaction_obj.io_type == "DEPOSIT":
+        return transaction_obj.amount
+    return -transaction_obj.amount
+
+
+def later_transactions(transaction_obj):
+    """같은 계좌에서 transaction_obj 보다 나중인 거래 ((거래 일시, id) 순서)"""
+    moment = transaction_obj.transaction_date
+    return Transaction.objects.filter(account_id=transaction_obj.account_id).filter(
+        Q(transaction_date__gt=moment)
+        | Q(transaction_date=moment, id__gt=transaction_obj.id)
+    )
+
+
+def keeps_later_balances(transaction_obj, delta):
+    """
+    이후 거래들의 거래 후 잔액에 delta 를 더해도 음수가 되는 거래가 없는지 여부
+
+    마지막 잔액만 보면 앞선 입금을 삭제할 때 그 입금에 기대어 출금한 중간 거래가 음수가 되는 것을 놓치므로
+    이후 거래의 최소 거래 후 잔액을 집계 한 번으로 확인한다. (delta 가 0 이상이면 조회하지 않음)
+    """
+    if delta >= 0:
+        return True
+    lowest = later_transactions(transaction_obj).aggregate(lowest=Min("balance_after"))[
+        "lowest"
+    ]
+    return lowest is None or lowest + delta >= 0
+
+
+def shift_later_balances(transaction_obj, delta):
+    """
+    transaction_obj 이후 거래들의 거래 후 잔액에 delta 를 더하고 바뀐 행 수를 반환한다.
+
+    (account_id, transaction_date, id) 인덱스 범위를 읽는 UPDATE 한 번으로 처리하며,
+    월 파티션 테이블에서는 transaction_date 조건으로 이전 달 파티션은 보지 않는다.
+    계좌 행을 잠근 트랜잭션 안에서 호출해야 같은 계좌의 다른 쓰기와 섞이지 않는다.
+    """
+    if not delta:
+        return 0
+    return later_transactions(transaction_obj).update(
+        balance_after=F("balance_after") + delta
+    )
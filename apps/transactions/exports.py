@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from operator import itemgetter
+
+from django.utils import timezone
+
+# 내보내기 컬럼 - 거래 내역 조회 API(TransactionHistorySerializer)와 같은 순서/이름
+EXPORT_FIELDS = [
+    "id",
+    "amount",
+    "balance_after",
+    "description",
+    "transaction_type",
+    "io_type",
+    "transaction_date",
+    "transaction_updated",
+    "account",
+]
+
+# values_list(*EXPORT_FIELDS) 행의 정렬 키 (transaction_date, id)
+EXPORT_POSITION = itemgetter(
+    EXPORT_FIELDS.index("transaction_date"), EXPORT_FIELDS.index("id")
+)
+
+# 한 번에 내보낼 행 수 - 행마다 yield 하지 않고 묶어서 보내 호출 오버헤드를 줄임
+ROWS_PER_CHUNK = 500
+
+
+def format_value(value):
+    """API 응답과 같은 형태의 문자열로 변환 (Decimal -> 문자열, datetime -> 서비스 시간대 ISO 8601)"""
+    if isinstance(value, datetime):
+        value = timezone.localtime(value).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    if isinstance(value, Decimal):
+        return f"{value:f}"
+    return value
+
+
+def iter_csv(rows, fields=EXPORT_FIELDS):
+    """values_list 행 이터레이터를 CSV 텍스트 조각으로 변환하는 제너레이터"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    count = 0
+    for row in rows:
+        writer.writerow([format_value(value) for value in row])
+        count += 1
+        if count % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows, fields=EXPORT_FIELDS):
+    """values_list 행 이터레이터를 NDJSON(한 줄에 JSON 객체 하나) 텍스트 조각으로 변환하는 제너레이터"""
+    lines = []
+    for row in rows:
+        record = dict(zip(fields, (format_value(value) for value in row)))
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
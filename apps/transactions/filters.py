@@ -0,0 +1,122 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.transactions.models import (
+    DEPOSIT_WITHDRAWAL_CHOICES,
+    TRANSACTION_TYPE_CHOICES,
+)
+
+
+class AccountPeriodFilterSerializer(serializers.Serializer):
+    """기간(시작일~종료일)과 계좌 목록 쿼리 파라미터 공통 검증"""
+
+    start_date = serializers.DateField(required=False, help_text="조회 시작일 (포함)")
+    end_date = serializers.DateField(required=False, help_text="조회 종료일 (포함)")
+    account = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        help_text="조회할 계좌 id (여러 개는 ?account=1&account=2)",
+    )
+
+    def validate(self, data):
+        start_date, end_date = data.get("start_date"), data.get("end_date")
+        if start_date and end_date and start_date > end_date:
+            raise serializers.ValidationError(
+                {"end_date": "종료일은 시작일보다 빠를 수 없습니다."}
+            )
+        return data
+
+    def filter_account_ids(self, account_ids):
+        """사용자 소유 계좌 id 중 account 파라미터로 지정한 계좌만 남긴다."""
+        if not self.validated_data.get("account"):
+            return account_ids
+        requested = set(self.validated_data["account"])
+        return [account_id for account_id in account_ids if account_id in requested]
+
+
+class TransactionFilterSerializer(AccountPeriodFilterSerializer):
+    """
+    거래 내역 조회 쿼리 파라미터 검증 및 필터 적용
+
+    모든 조건은 SQL WHERE 절로 변환되어 DB에서 걸러진다.
+    날짜 조건도 transaction_date 컬럼을 함수로 감싸지 않는 범위 조건으로 바꿔 인덱스를 탈 수 있게 한다.
+    """
+
+    io_type = serializers.ChoiceField(
+        choices=DEPOSIT_WITHDRAWAL_CHOICES, required=False, help_text="입출금 타입"
+    )
+    transaction_type = serializers.ChoiceField(
+        choices=TRANSACTION_TYPE_CHOICES, required=False, help_text="거래 타입"
+    )
+    min_amount = serializers.DecimalField(
+        max_digits=15, decimal_places=2, required=False, help_text="최소 거래 금액"
+    )
+    max_amount = serializers.DecimalField(
+        max_digits=15, decimal_places=2, required=False, help_text="최대 거래 금액"
+    )
+
+    def validate(self, data):
+        data = super().validate(data)
+        min_amount, max_amount = data.get("min_amount"), data.get("max_amount")
+        if min_amount is not None and max_amount is not None:
+            if min_amount > max_amount:
+                raise serializers.ValidationError(
+                    {"max_amount": "최대 금액은 최소 금액보다 작을 수 없습니다."}
+                )
+        return data
+
+    def filter_queryset(self, queryset):
+        data = self.validated_data
+        if "start_date" in data:
+            queryset = queryset.filter(
+                transaction_date__gte=self.start_of_day(data["start_date"])
+            )
+        if "end_date" in data:
+            # 종료일 당일을 포함하도록 다음 날 0시 미만으로 조회
+            queryset = queryset.filter(
+                transaction_date__lt=self.start_of_day(
+                    data["end_date"] + timedelta(days=1)
+                )
+            )
+        if "io_type" in data:
+            queryset = queryset.filter(io_type=data["io_type"])
+        if "transaction_type" in data:
+            queryset = queryset.filter(transaction_type=data["transaction_type"])
+        if "min_amount" in data:
+            queryset = queryset.filter(amount__gte=data["min_amount"])
+        if "max_amount" in data:
+            queryset = queryset.filter(amount__lte=data["max_amount"])
+        return queryset
+
+    def reaches(self, moment):
+        """조회 기간(시작일 이후)에 moment 가 포함되는지 - moment 가 None 이면 False"""
+        if moment is None:
+            return False
+        if "start_date" not in self.validated_data:
+            return True
+        return self.start_of_day(self.validated_data["start_date"]) <= moment
+
+    @staticmethod
+    def start_of_day(date):
+        # 날짜는 서비스 시간대(TIME_ZONE) 기준으로 해석
+        return timezone.make_aware(datetime.combine(date, time.min))
+
+
+class TransactionSummaryFilterSerializer(AccountPeriodFilterSerializer):
+    """거래 통계(일일 집계 합산) 조회 쿼리 파라미터 검증 및 필터 적용"""
+
+    period = serializers.ChoiceField(
+        choices=[("month", "월별"), ("year", "연도별")],
+        default="month",
+        help_text="집계 단위",
+    )
+
+    def filter_queryset(self, queryset):
+        data = self.validated_data
+        if "start_date" in data:
+            queryset = queryset.filter(day__gte=data["start_date"])
+        if "end_date" in data:
+            queryset = queryset.filter(day__lte=data["end_date"])
+        return queryset
@@ -0,0 +1,59 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.transactions.models import IdempotencyKey
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+def get_idempotency_key(request):
+    """요청 헤더의 멱등성 키를 반환 (없으면 None)"""
+    key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+    return key.strip() if key else None
+
+
+def request_fingerprint(request):
+    """같은 키로 다른 요청을 보낸 경우를 구분하기 위한 요청 해시"""
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f"{request.path}\n{body}".encode()).hexdigest()
+
+
+def get_stored_response(user, key, fingerprint):
+    """
+    저장된 응답이 있으면 Response로 돌려준다.
+    (user, key) 유니크 인덱스 한 번만 조회하며, 저장된 응답을 돌려줄 때는 DB 쓰기가 없다.
+    """
+    stored = IdempotencyKey.objects.filter(user=user, key=key).first()
+    if stored is None:
+        return None
+    if stored.expires_at <= timezone.now():
+        # 아직 정리되지 않은 만료 키는 지우고 새 요청으로 처리
+        stored.delete()
+        return None
+    if stored.request_hash != fingerprint:
+        return Response(
+            {"error": "같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return Response(stored.response_body, status=stored.response_status)
+
+
+def store_response(user, key, fingerprint, response):
+    """
+    처리 결과를 저장한다. 거래 생성과 같은 DB 트랜잭션 안에서 호출해야 한다.
+    동시에 같은 키로 들어온 요청은 유니크 제약 위반(IntegrityError)으로 롤백된다.
+    """
+    IdempotencyKey.objects.create(
+        user=user,
+        key=key,
+        request_hash=fingerprint,
+        response_status=response.status_code,
+        response_body=response.data,
+        expires_at=timezone.now() + settings.IDEMPOTENCY_KEY_TTL,
+    )
@@ -0,0 +1,195 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import django
+from django.db import connection, connections, transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from apps.accounts.cache import bump_user_version
+from apps.accounts.models import Account
+from apps.transactions.models import Transaction, TransactionArchive
+
+# 계좌 원장 정합성 검사/복구
+#
+# 계좌 잔액(Account.balance)은 0에서 시작해 거래(보관 거래 포함)의 입금은 더하고 출금은 뺀 합계와 같아야 하고,
+# 각 거래의 거래 후 잔액(balance_after)은 (거래 일시, id) 순서 누적 합계와 같아야 한다.
+# 누적 합계는 SQL 윈도 함수(SUM() OVER (PARTITION BY account_id ORDER BY transaction_date, id))로
+# 계좌 id 구간(chunk)마다 한 번에 구하며, 구간들은 여러 워커 프로세스에 나눠 처리할 수 있다.
+# 어긋난 계좌만 잠그고 다시 계산해 복구하므로 정상 계좌의 거래는 막지 않는다.
+
+# 거래 테이블별 (모델, 보관 여부)
+LEDGER_TABLES = ((Transaction, False), (TransactionArchive, True))
+
+
+def account_where(column, accounts):
+    """
+    계좌 조건 (SQL, 파라미터)
+    accounts 가 (lo, hi) 튜플이면 계좌 id 구간 [lo, hi), 리스트면 계좌 id 목록
+    """
+    if isinstance(accounts, tuple):
+        return f"{column} >= %s AND {column} < %s", list(accounts)
+    placeholders = ", ".join(["%s"] * len(accounts))
+    return f"{column} IN ({placeholders})", list(accounts)
+
+
+def ledger_sql(accounts):
+    """
+    accounts 의 거래(보관 거래 포함)마다 입출금 부호를 붙인 금액(signed)과
+    (거래 일시, id) 순서 누적 합계(expected)를 내는 SELECT (SQL, 파라미터)
+    """
+    where, params = account_where("account_id", accounts)
+    qn = connection.ops.quote_name
+    parts = [
+        f"""
+        SELECT account_id, id, transaction_date, balance_after,
+               CASE WHEN io_type = 'DEPOSIT' THEN amount ELSE -amount END AS signed,
+               {"TRUE" if archived else "FALSE"} AS archived
+        FROM {qn(model._meta.db_table)} WHERE {where}
+        """
+        for model, archived in LEDGER_TABLES
+    ]
+    sql = f"""
+        SELECT account_id, id, transaction_date, balance_after, signed, archived,
+               SUM(signed) OVER (
+                   PARTITION BY account_id ORDER BY transaction_date, id
+               ) AS expected
+        FROM ({" UNION ALL ".join(parts)}) AS ledger_rows
+    """
+    return sql, params * len(parts)
+
+
+def find_drift(accounts):
+    """
+    accounts 중 원장이 어긋난 계좌 목록을 계좌 id 순서로 반환한다.
+
+    각 항목은 계좌 id, 사용자 id, 현재 잔액(balance), 거래로 계산한 잔액(expected_balance),
+    거래 후 잔액이 누적 합계와 다른 거래 수(drifted_rows)를 담은 dict 이다.
+    """
+    ledger, ledger_params = ledger_sql(accounts)
+    where, params = account_where("a.id", accounts)
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH ledger AS ({ledger})
+            SELECT a.id, a.user_id, a.balance, COALESCE(l.total, 0),
+                   COALESCE(l.drifted, 0)
+            FROM {qn(Account._meta.db_table)} AS a
+            LEFT JOIN (
+                SELECT account_id, SUM(signed) AS total,
+                       COUNT(*) FILTER (WHERE balance_after <> expected) AS drifted
+                FROM ledger GROUP BY account_id
+            ) AS l ON l.account_id = a.id
+            WHERE {where}
+              AND (a.balance <> COALESCE(l.total, 0) OR COALESCE(l.drifted, 0) > 0)
+            ORDER BY a.id
+            """,
+            ledger_params + params,
+        )
+        return [
+            {
+                "account_id": account_id,
+                "user_id": user_id,
+                "balance": balance,
+                "expected_balance": expected_balance,
+                "drifted_rows": drifted_rows,
+            }
+            for account_id, user_id, balance, expected_balance, drifted_rows in cursor
+        ]
+
+
+def repair_drift(account_ids):
+    """
+    계좌들의 잔액과 거래 후 잔액을 거래로 계산한 값으로 고치고, 고친 계좌 목록(find_drift 형식)을 반환한다.
+
+    거래 생성/수정/삭제와 같이 계좌 행을 먼저 잠근 뒤 다시 검사하므로,
+    검사와 복구 사이에 끝난 정상 거래 때문에 값을 잘못 덮어쓰지 않는다.
+    거래 후 잔액은 테이블마다 UPDATE 한 번으로 고친다.
+    """
+    qn = connection.ops.quote_name
+    with transaction.atomic():
+        # 교착을 피하기 위해 항상 id 순서로 잠금
+        locked = list(
+            Account.objects.select_for_update()
+            .filter(pk__in=account_ids)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        if not locked:
+            return []
+        drift = find_drift(locked)
+        if not drift:
+            return []
+        ledger, params = ledger_sql([row["account_id"] for row in drift])
+        with connection.cursor() as cursor:
+            for model, archived in LEDGER_TABLES:
+                # 파티션 테이블에서 행을 찾도록 기본 키 (id, transaction_date)를 모두 비교
+                cursor.execute(
+                    f"""
+                    WITH ledger AS ({ledger})
+                    UPDATE {qn(model._meta.db_table)} AS t
+                    SET balance_after = ledger.expected
+                    FROM ledger
+                    WHERE ledger.archived = {"TRUE" if archived else "FALSE"}
+                      AND t.id = ledger.id
+                      AND t.transaction_date = ledger.transaction_date
+                      AND t.balance_after <> ledger.expected
+                    """,
+                    params,
+                )
+        now = timezone.now()
+        for row in drift:
+            if row["balance"] != row["expected_balance"]:
+                Account.objects.filter(pk=row["account_id"]).update(
+                    balance=row["expected_balance"], updated_at=now
+                )
+            bump_user_version(row["user_id"])  # 커밋 후 계좌 목록 캐시/ETag 무효화
+    return drift
+
+
+def reconcile_range(bounds, repair=False):
+    """계좌 id 구간 [lo, hi) 를 검사해 어긋난 계좌 목록을 반환 (repair 면 복구한 계좌 목록)"""
+    drift = find_drift(tuple(bounds))
+    if drift and repair:
+        drift = repair_drift([row["account_id"] for row in drift])
+    return drift
+
+
+def account_ranges(chunk_size, account_ids=None):
+    """검사할 계좌 id 구간 [lo, hi) 목록 (account_ids 를 주면 그 계좌들만)"""
+    if account_ids:
+        return [(account_id, account_id + 1) for account_id in sorted(account_ids)]
+    bounds = Account.objects.aggregate(lo=Min("pk"), hi=Max("pk"))
+    if bounds["lo"] is None:
+        return []
+    return [
+        (lo, min(lo + chunk_size, bounds["hi"] + 1))
+        for lo in range(bounds["lo"], bounds["hi"] + 1, chunk_size)
+    ]
+
+
+def _init_worker():
+    # spawn 방식으로 시작한 워커 프로세스도 설정을 읽도록 (fork 면 이미 설정되어 있어 아무것도 안 함)
+    django.setup()
+
+
+def reconcile_ledgers(chunk_size=1000, workers=1, repair=False, account_ids=None):
+    """
+    모든 계좌(또는 account_ids)의 원장을 chunk_size 개 계좌 id 구간씩 검사해
+    어긋난 계좌를 계좌 id 순서로 하나씩 내보내는 제너레이터
+
+    workers 가 2 이상이면 구간들을 워커 프로세스에 나눠 처리한다.
+    워커는 각자 DB 연결을 열므로 DB 최대 연결 수를 고려해야 한다.
+    """
+    ranges = account_ranges(chunk_size, account_ids)
+    check = partial(reconcile_range, repair=repair)
+    if workers <= 1:
+        for bounds in ranges:
+            yield from check(bounds)
+        return
+    # fork 된 워커가 부모의 DB 연결(소켓)을 같이 쓰지 않도록 먼저 닫음
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for drift in pool.map(check, ranges):
+            yield from drift
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.transactions.archive import archive_cutoff, archive_transactions
+
+
+class Command(BaseCommand):
+    help = (
+        "오래된 거래 내역을 보관 테이블로 옮깁니다. 옮긴 거래도 거래 내역 조회/내보내기에 "
+        "그대로 포함됩니다. (cron 등으로 주기 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            metavar="DAYS",
+            help="DAYS 일보다 오래된 거래를 옮김 (기본 TRANSACTION_ARCHIVE_AFTER_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="한 트랜잭션에서 옮길 최대 거래 수 (기본 5000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than"] is not None and options["older_than"] < 0:
+            raise CommandError("--older-than 은 0 이상이어야 합니다.")
+        before = archive_cutoff(options["older_than"])
+        moved = archive_transactions(before, batch_size=options["batch_size"])
+        self.stdout.write(
+            f"{before:%Y-%m-%d %H:%M} 이전 거래 {moved}건을 보관 테이블로 옮겼습니다."
+        )
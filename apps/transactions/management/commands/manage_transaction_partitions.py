@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.transactions.archive import archive_transactions
+from apps.transactions.partitions import (
+    add_months,
+    create_partition,
+    detach_partition,
+    is_partitioned,
+    list_partitions,
+    month_start,
+    partition_bounds,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "거래 내역 월 파티션을 관리합니다. 앞으로 쓸 달의 파티션을 미리 만들고, "
+        "--detach-after 를 지정하면 오래된 파티션을 떼어 냅니다. (cron 등으로 매월 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="이번 달 이후 미리 만들어 둘 파티션 개월 수 (기본 3)",
+        )
+        parser.add_argument(
+            "--detach-after",
+            type=int,
+            metavar="MONTHS",
+            help=(
+                "이번 달 기준 MONTHS 개월보다 이전 파티션을 떼어 냄. 떼어 내기 전에 그 거래를 "
+                "보관 테이블로 옮기므로 조회/집계/원장 검사에 그대로 포함됨 (생략하면 떼어 내지 않음)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            raise CommandError(
+                "거래 내역 테이블이 파티션 테이블이 아닙니다. (PostgreSQL 에서 migrate 필요)"
+            )
+        current = month_start(timezone.localdate())
+
+        for months in range(options["months_ahead"] + 1):
+            month = add_months(current, months)
+            if create_partition(month):
+                self.stdout.write(f"{month:%Y-%m} 파티션을 만들었습니다.")
+
+        if options["detach_after"] is not None:
+            oldest = add_months(current, -options["detach_after"])
+            # 떼어 낸 파티션의 거래는 조회/내보내기/집계 재생성/원장 검사에서 빠지므로
+            # 먼저 보관 테이블로 옮겨 빈 파티션만 떼어 냄
+            moved = archive_transactions(partition_bounds(oldest)[0])
+            if moved:
+                self.stdout.write(
+                    f"{oldest:%Y-%m} 이전 거래 {moved}건을 보관 테이블로 옮겼습니다."
+                )
+            for month in list_partitions():
+                if month < oldest:
+                    name = detach_partition(month)
+                    self.stdout.write(
+                        f"{month:%Y-%m} 파티션을 떼어 냈습니다. (테이블 {name})"
+                    )
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.transactions.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 멱등성 키를 일정 크기 배치로 나누어 삭제합니다. (cron 등으로 주기 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 DELETE로 지울 최대 행 수 (기본 1000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = timezone.now()
+        deleted = 0
+        # 한 번에 큰 DELETE를 하지 않도록 expires_at 인덱스로 일부씩 골라 삭제
+        while True:
+            ids = list(
+                IdempotencyKey.objects.filter(expires_at__lte=now).values_list(
+                    "id", flat=True
+                )[:batch_size]
+            )
+            if not ids:
+                break
+            deleted += IdempotencyKey.objects.filter(id__in=ids).delete()[0]
+
+        self.stdout.write(f"만료된 멱등성 키 {deleted}건을 삭제했습니다.")
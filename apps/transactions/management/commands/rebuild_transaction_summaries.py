@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.transactions.summaries import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = (
+        "거래 내역(보관 거래 포함)에서 일일 거래 집계(TransactionDailySummary)를 "
+        "다시 생성합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--account",
+            type=int,
+            action="append",
+            dest="account_ids",
+            help="재생성할 계좌 id (여러 번 지정 가능, 생략하면 전체)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 저장할 집계 행 수 (기본 1000)",
+        )
+
+    def handle(self, *args, **options):
+        created = rebuild_summaries(
+            account_ids=options["account_ids"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(f"일일 거래 집계 {created}건을 생성했습니다.")
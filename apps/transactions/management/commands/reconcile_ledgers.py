@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.transactions.ledgers import reconcile_ledgers
+
+
+class Command(BaseCommand):
+    help = (
+        "계좌 잔액이 거래(보관 거래 포함) 합계와 같은지, 거래 후 잔액이 (거래 일시, id) 순서 "
+        "누적 합계와 같은지 검사합니다. --repair 를 주면 어긋난 계좌를 고칩니다. (야간 배치 등으로 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--account",
+            type=int,
+            action="append",
+            dest="account_ids",
+            help="검사할 계좌 id (여러 번 지정 가능, 생략하면 전체)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="쿼리 한 번에 검사할 계좌 id 구간 크기 (기본 1000)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="구간을 나눠 처리할 워커 프로세스 수 (기본 1, 워커마다 DB 연결 1개)",
+        )
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="어긋난 계좌의 잔액과 거래 후 잔액을 거래로 계산한 값으로 고침",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--chunk-size 와 --workers 는 1 이상이어야 합니다.")
+        drifted = 0
+        for row in reconcile_ledgers(
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+            repair=options["repair"],
+            account_ids=options["account_ids"],
+        ):
+            drifted += 1
+            self.stdout.write(
+                f"계좌 {row['account_id']}: 잔액 {row['balance']} "
+                f"(거래 합계 {row['expected_balance']}), "
+                f"거래 후 잔액 불일치 {row['drifted_rows']}건"
+            )
+        if options["repair"]:
+            self.stdout.write(f"어긋난 계좌 {drifted}개를 고쳤습니다.")
+        else:
+            self.stdout.write(f"어긋난 계좌 {drifted}개를 찾았습니다.")
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("transactions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["account", "-transaction_date", "-id"],
+                name="txn_account_date_id_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="account",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transactions",
+                to="accounts.account",
+                verbose_name="계좌 정보",
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0002_transaction_account_date_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=255, verbose_name="멱등성 키")),
+                (
+                    "request_hash",
+                    models.CharField(max_length=64, verbose_name="요청 해시"),
+                ),
+                (
+                    "response_status",
+                    models.PositiveSmallIntegerField(verbose_name="응답 상태 코드"),
+                ),
+                ("response_body", models.JSONField(verbose_name="응답 본문")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                ("expires_at", models.DateTimeField(verbose_name="만료일시")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="idempotency_keys",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "멱등성 키",
+                "verbose_name_plural": "멱등성 키 목록",
+                "indexes": [
+                    models.Index(fields=["expires_at"], name="idempotency_expires_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "key"), name="idempotency_user_key_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
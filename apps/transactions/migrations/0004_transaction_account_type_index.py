@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("transactions", "0003_idempotencykey"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["account", "transaction_type", "-transaction_date", "-id"],
+                name="txn_account_type_date_id_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_summaries(apps, schema_editor):
+    # 기존 거래 내역으로 일일 집계를 채움 (이후에는 거래 변경 시 증분으로 유지)
+    Transaction = apps.get_model("transactions", "Transaction")
+    TransactionDailySummary = apps.get_model("transactions", "TransactionDailySummary")
+    rows = (
+        Transaction.objects.annotate(day=TruncDate("transaction_date"))
+        .values("account_id", "day", "io_type", "transaction_type")
+        .annotate(count=Count("id"), total_amount=Sum("amount"))
+        .order_by()
+    )
+    TransactionDailySummary.objects.bulk_create(
+        (TransactionDailySummary(**row) for row in rows.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("transactions", "0004_transaction_account_type_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransactionDailySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="거래일")),
+                (
+                    "io_type",
+                    models.CharField(
+                        choices=[("DEPOSIT", "입금"), ("WITHDRAW", "출금")],
+                        help_text="입출금 타입",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[
+                            ("ATM", "ATM 거래"),
+                            ("TRANSFER", "계좌이체"),
+                            ("AUTOMATIC_TRANSFER", "자동이체"),
+                            ("CARD", "카드결제"),
+                            ("INTEREST", "이자"),
+                        ],
+                        help_text="거래 타입",
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.IntegerField(default=0, verbose_name="거래 건수")),
+                (
+                    "total_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=18,
+                        verbose_name="거래 금액 합계",
+                    ),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_summaries",
+                        to="accounts.account",
+                        verbose_name="계좌 정보",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일일 거래 집계",
+                "verbose_name_plural": "일일 거래 집계 목록",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "day", "io_type", "transaction_type"),
+                        name="txn_summary_account_day_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_daily_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,148 @@
+from datetime import datetime
+
+from django.db import migrations
+from django.utils import timezone
+
+# 거래 내역 테이블을 transaction_date 기준 월 단위 범위 파티션 테이블로 바꾼다. (PostgreSQL 전용)
+#
+# - 파티션 키가 기본 키에 포함되어야 하므로 DB 의 기본 키는 (id, transaction_date) 가 되며,
+#   Django 모델은 그대로 id 를 기본 키로 사용한다. (id 는 시퀀스로만 발급되어 중복되지 않음)
+# - 기존 거래가 있는 달부터 이번 달 + FUTURE_MONTHS 개월까지 월 파티션을 만들고,
+#   범위를 벗어난 거래를 받을 기본 파티션을 둔다.
+#   이후 파티션은 manage_transaction_partitions 관리 명령으로 미리 만든다.
+# - 테이블 전체를 복사하므로 거래가 많은 운영 DB 에서는 점검 시간에 실행한다.
+
+TABLE = "transactions_transaction"
+FUTURE_MONTHS = 3
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def month_bound(month):
+    return timezone.make_aware(datetime(month.year, month.month, 1)).isoformat()
+
+
+def foreign_key_names(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        constraints = schema_editor.connection.introspection.get_constraints(
+            cursor, TABLE
+        )
+    return {
+        info["columns"][0]: name
+        for name, info in constraints.items()
+        if info["foreign_key"]
+    }
+
+
+def copy_table(schema_editor, old_table, partitioned):
+    """TABLE 을 old_table 로 이름을 바꾸고 같은 컬럼의 새 TABLE 을 만든다"""
+    quote = schema_editor.quote_name
+    schema_editor.execute(f"ALTER TABLE {quote(TABLE)} RENAME TO {quote(old_table)}")
+    schema_editor.execute(
+        f"CREATE TABLE {quote(TABLE)} "
+        f"(LIKE {quote(old_table)} INCLUDING DEFAULTS INCLUDING IDENTITY)"
+        + (" PARTITION BY RANGE (transaction_date)" if partitioned else "")
+    )
+
+
+def move_rows(schema_editor, old_table):
+    """old_table 의 행을 TABLE 로 옮기고 id 시퀀스를 이어서 발급하도록 맞춘 뒤 old_table 삭제"""
+    quote = schema_editor.quote_name
+    schema_editor.execute(
+        f"INSERT INTO {quote(TABLE)} SELECT * FROM {quote(old_table)}"
+    )
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence(%s, 'id'), MAX(id)) "
+        f"FROM {quote(TABLE)} HAVING MAX(id) IS NOT NULL",
+        [TABLE],
+    )
+    schema_editor.execute(f"DROP TABLE {quote(old_table)}")
+
+
+def finish_table(schema_editor, model, fk_names, primary_key):
+    """
+    기본 키, 외래 키, Meta.indexes 인덱스를 이전과 같은 이름으로 다시 만들고 id 시퀀스 이름도 되돌린다.
+    (이전 테이블이 남아 있는 동안에는 이름이 겹치므로 이전 테이블을 지운 뒤 호출)
+    """
+    quote = schema_editor.quote_name
+    schema_editor.execute(
+        f"ALTER TABLE {quote(TABLE)} ADD PRIMARY KEY ({', '.join(primary_key)})"
+    )
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [TABLE])
+        (sequence,) = cursor.fetchone()
+    if sequence.rpartition(".")[2] != f"{TABLE}_id_seq":
+        schema_editor.execute(
+            f"ALTER SEQUENCE {sequence} RENAME TO {quote(f'{TABLE}_id_seq')}"
+        )
+    for column, name in fk_names.items():
+        target = model._meta.get_field(column.removesuffix("_id")).target_field
+        schema_editor.execute(
+            f"ALTER TABLE {quote(TABLE)} ADD CONSTRAINT {quote(name)} "
+            f"FOREIGN KEY ({quote(column)}) "
+            f"REFERENCES {quote(target.model._meta.db_table)} ({quote(target.column)}) "
+            f"DEFERRABLE INITIALLY DEFERRED"
+        )
+    for index in model._meta.indexes:
+        schema_editor.add_index(model, index)
+
+
+def partition_transactions(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Transaction = apps.get_model("transactions", "Transaction")
+    quote = schema_editor.quote_name
+    old_table = f"{TABLE}_unpartitioned"
+    fk_names = foreign_key_names(schema_editor)
+    copy_table(schema_editor, old_table, partitioned=True)
+
+    # 기존 거래가 있는 가장 이른 달부터 이번 달 + FUTURE_MONTHS 개월까지
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(transaction_date) FROM {quote(old_table)}")
+        (earliest,) = cursor.fetchone()
+    current = timezone.localdate().replace(day=1)
+    month = current
+    if earliest is not None:
+        month = min(month, timezone.localdate(earliest).replace(day=1))
+    while month <= add_months(current, FUTURE_MONTHS):
+        partition = f"{TABLE}_p{month:%Y_%m}"
+        schema_editor.execute(
+            f"CREATE TABLE {quote(partition)} PARTITION OF {quote(TABLE)} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [month_bound(month), month_bound(add_months(month, 1))],
+        )
+        month = add_months(month, 1)
+    default_partition = f"{TABLE}_default"
+    schema_editor.execute(
+        f"CREATE TABLE {quote(default_partition)} PARTITION OF {quote(TABLE)} DEFAULT"
+    )
+
+    move_rows(schema_editor, old_table)
+    # 파티션 키(transaction_date)가 기본 키에 포함되어야 함
+    finish_table(schema_editor, Transaction, fk_names, ["id", "transaction_date"])
+    schema_editor.execute(f"ANALYZE {quote(TABLE)}")
+
+
+def unpartition_transactions(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Transaction = apps.get_model("transactions", "Transaction")
+    fk_names = foreign_key_names(schema_editor)
+    old_table = f"{TABLE}_partitioned"
+    copy_table(schema_editor, old_table, partitioned=False)
+    move_rows(schema_editor, old_table)  # 파티션도 함께 삭제됨
+    finish_table(schema_editor, Transaction, fk_names, ["id"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0005_transactiondailysummary"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_transactions, unpartition_transactions),
+    ]
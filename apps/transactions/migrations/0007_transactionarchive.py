@@ -0,0 +1,96 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("transactions", "0006_partition_transactions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransactionArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(
+                        primary_key=True, serialize=False, verbose_name="거래 내역 id"
+                    ),
+                ),
+                (
+                    "amount",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=15, verbose_name="거래 금액"
+                    ),
+                ),
+                (
+                    "balance_after",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=15, verbose_name="거래 후 잔액"
+                    ),
+                ),
+                (
+                    "description",
+                    models.CharField(blank=True, help_text="거래 내역", max_length=255),
+                ),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[
+                            ("ATM", "ATM 거래"),
+                            ("TRANSFER", "계좌이체"),
+                            ("AUTOMATIC_TRANSFER", "자동이체"),
+                            ("CARD", "카드결제"),
+                            ("INTEREST", "이자"),
+                        ],
+                        help_text="거래 타입",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "io_type",
+                    models.CharField(
+                        choices=[("DEPOSIT", "입금"), ("WITHDRAW", "출금")],
+                        help_text="입출금 타입",
+                        max_length=10,
+                    ),
+                ),
+                ("transaction_date", models.DateTimeField(verbose_name="거래 일시")),
+                (
+                    "transaction_updated",
+                    models.DateTimeField(verbose_name="거래 내역 수정 일시"),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="보관 일시"),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_transactions",
+                        to="accounts.account",
+                        verbose_name="계좌 정보",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "보관 거래 내역",
+                "verbose_name_plural": "보관 거래 내역들",
+                "indexes": [
+                    models.Index(
+                        fields=["account", "-transaction_date", "-id"],
+                        name="txn_archive_account_date_idx",
+                    ),
+                    models.Index(
+                        fields=["-transaction_date"], name="txn_archive_date_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
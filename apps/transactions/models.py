@@ -1,6 +1,7 @@
 from django.db import models
 
 from apps.accounts.models import Account
+from apps.users.models import User
 
 # 거래 종류
 TRANSACTION_TYPE_CHOICES = [
@@ -23,6 +24,7 @@ class Transaction(models.Model):
         on_delete=models.CASCADE,
         related_name="transactions",
         verbose_name="계좌 정보",
+        db_index=False,  # Meta.indexes의 (account, transaction_date, id) 복합 인덱스가 대신함
     )
     amount = models.DecimalField(
         max_digits=15, decimal_places=2, verbose_name="거래 금액"
@@ -50,8 +52,161 @@ class Transaction(models.Model):
     )
 
     def __str__(self):
-        return f"[{self.account.account_number}] {self.get_io_type_display()} {self.amount} - {self.description}"
+        # 계좌를 함께 읽지 않았으면(select_related 없이 조회) 추가 쿼리 대신 계좌 id 로 표시
+        account = (
+            self.account.account_number
+            if Transaction.account.is_cached(self)
+            else f"계좌 {self.account_id}"
+        )
+        return f"[{account}] {self.get_io_type_display()} {self.amount} - {self.description}"
 
     class Meta:
         verbose_name = "거래 내역"
         verbose_name_plural = "거래 내역들"
+        indexes = [
+            # 계좌별 거래 내역을 최신순으로 읽는 접근 패턴 (목록/커서 페이지네이션)
+            # ORDER BY transaction_date DESC, id DESC 를 정렬 없이 인덱스 순서대로 읽을 수 있음
+            models.Index(
+                fields=["account", "-transaction_date", "-id"],
+                name="txn_account_date_id_idx",
+            ),
+            # 거래 타입 필터(예: 카드결제만 보기)가 걸린 목록 조회용
+            models.Index(
+                fields=["account", "transaction_type", "-transaction_date", "-id"],
+                name="txn_account_type_date_id_idx",
+            ),
+        ]
+
+
+class TransactionArchive(models.Model):
+    """
+    보관(cold storage)으로 옮긴 오래된 거래 내역
+
+    archive_transactions 관리 명령이 TRANSACTION_ARCHIVE_AFTER_DAYS 보다 오래된 거래를
+    거래 내역 테이블에서 옮겨 오며 id/거래 일시 등 모든 값을 그대로 유지한다.
+    거래 내역 조회/내보내기는 조회 기간이 보관 거래에 걸치면 두 테이블을 (거래 일시, id) 순서로
+    합쳐서 읽는다. 보관 거래는 읽기 전용이다. (수정/삭제 API 대상 아님)
+    """
+
+    id = models.BigIntegerField(primary_key=True, verbose_name="거래 내역 id")
+    account = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name="archived_transactions",
+        verbose_name="계좌 정보",
+        db_index=False,  # Meta.indexes의 (account, transaction_date, id) 복합 인덱스가 대신함
+    )
+    amount = models.DecimalField(
+        max_digits=15, decimal_places=2, verbose_name="거래 금액"
+    )
+    balance_after = models.DecimalField(
+        max_digits=15, decimal_places=2, verbose_name="거래 후 잔액"
+    )
+    description = models.CharField(max_length=255, blank=True, help_text="거래 내역")
+    transaction_type = models.CharField(
+        max_length=20, choices=TRANSACTION_TYPE_CHOICES, help_text="거래 타입"
+    )
+    io_type = models.CharField(
+        max_length=10, choices=DEPOSIT_WITHDRAWAL_CHOICES, help_text="입출금 타입"
+    )
+    transaction_date = models.DateTimeField(verbose_name="거래 일시")
+    transaction_updated = models.DateTimeField(verbose_name="거래 내역 수정 일시")
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="보관 일시")
+
+    class Meta:
+        verbose_name = "보관 거래 내역"
+        verbose_name_plural = "보관 거래 내역들"
+        indexes = [
+            # 거래 내역과 같은 최신순 커서 조회용
+            models.Index(
+                fields=["account", "-transaction_date", "-id"],
+                name="txn_archive_account_date_idx",
+            ),
+            # 보관된 가장 최근 거래 일시(MAX) 조회용 - 조회 기간이 보관 거래에 걸치는지 판단
+            models.Index(fields=["-transaction_date"], name="txn_archive_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"[계좌 {self.account_id}] {self.get_io_type_display()} {self.amount} - {self.description}"
+
+
+class TransactionDailySummary(models.Model):
+    """
+    계좌별 일일 거래 집계 (계좌, 날짜, 입출금 타입, 거래 타입 단위)
+
+    거래 생성/수정/삭제 시 증감분만 반영하여 유지하며, 월/연 단위 통계는
+    거래 내역 전체 대신 이 테이블을 합산해서 구한다.
+    rebuild_transaction_summaries 관리 명령으로 거래 내역에서 다시 만들 수 있다.
+    """
+
+    account = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name="daily_summaries",
+        verbose_name="계좌 정보",
+    )
+    day = models.DateField(verbose_name="거래일")
+    io_type = models.CharField(
+        max_length=10, choices=DEPOSIT_WITHDRAWAL_CHOICES, help_text="입출금 타입"
+    )
+    transaction_type = models.CharField(
+        max_length=20, choices=TRANSACTION_TYPE_CHOICES, help_text="거래 타입"
+    )
+    count = models.IntegerField(default=0, verbose_name="거래 건수")
+    total_amount = models.DecimalField(
+        max_digits=18, decimal_places=2, default=0, verbose_name="거래 금액 합계"
+    )
+
+    class Meta:
+        verbose_name = "일일 거래 집계"
+        verbose_name_plural = "일일 거래 집계 목록"
+        constraints = [
+            # 집계 행 조회/증감 및 계좌별 기간 조회에 사용
+            models.UniqueConstraint(
+                fields=["account", "day", "io_type", "transaction_type"],
+                name="txn_summary_account_day_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"[{self.account_id}] {self.day} {self.io_type} {self.transaction_type}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    거래 생성 요청의 멱등성 키
+
+    클라이언트가 Idempotency-Key 헤더로 같은 요청을 재시도하면, 거래를 다시 만들지 않고
+    처음 처리했을 때 저장해 둔 응답을 그대로 돌려준다. 만료된 키는
+    purge_idempotency_keys 관리 명령으로 주기적으로 정리한다.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+        verbose_name="사용자",
+    )
+    key = models.CharField(max_length=255, verbose_name="멱등성 키")
+    request_hash = models.CharField(max_length=64, verbose_name="요청 해시")
+    response_status = models.PositiveSmallIntegerField(verbose_name="응답 상태 코드")
+    response_body = models.JSONField(verbose_name="응답 본문")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    expires_at = models.DateTimeField(verbose_name="만료일시")
+
+    class Meta:
+        verbose_name = "멱등성 키"
+        verbose_name_plural = "멱등성 키 목록"
+        constraints = [
+            # (사용자, 키) 조회용 인덱스이자 동시 재시도 시 중복 처리를 막는 제약
+            models.UniqueConstraint(
+                fields=["user", "key"], name="idempotency_user_key_uniq"
+            ),
+        ]
+        indexes = [
+            # 만료 키 정리용
+            models.Index(fields=["expires_at"], name="idempotency_expires_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key}"
@@ -0,0 +1,184 @@
+import heapq
+from base64 import b64decode, b64encode
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def after_position(queryset, position):
+    """(transaction_date, id) 내림차순으로 position 다음 행만 남긴다 (position 이 None 이면 그대로)"""
+    if position is None:
+        return queryset
+    transaction_date, pk = position
+    # transaction_date__lte 조건은 인덱스 범위 스캔의 시작점을 잡아주기 위한 것
+    return queryset.filter(transaction_date__lte=transaction_date).filter(
+        Q(transaction_date__lt=transaction_date)
+        | Q(transaction_date=transaction_date, id__lt=pk)
+    )
+
+
+def get_position(row):
+    """정렬 키 (transaction_date, id) - queryset.values() 결과(dict)와 모델 인스턴스 모두 지원"""
+    if isinstance(row, dict):
+        return row["transaction_date"], row["id"]
+    return row.transaction_date, row.id
+
+
+def iter_merged(iterables, key=get_position):
+    """
+    (transaction_date, id) 내림차순인 여러 행 이터러블을 같은 순서로 합친다. (key: 행의 정렬 키)
+    거래가 보관 테이블로 옮겨지는 중에 양쪽에서 읽힌 같은 거래는 한 번만 내보낸다.
+    """
+    previous = None
+    for row in heapq.merge(*iterables, key=key, reverse=True):
+        position = key(row)
+        if position != previous:
+            previous = position
+            yield row
+
+
+def merge_rows(rows, other):
+    """(transaction_date, id) 내림차순인 두 행 목록을 합친 목록"""
+    return list(iter_merged([rows, other])) if rows else list(other)
+
+
+class TransactionCursorPagination(BasePagination):
+    """
+    거래 내역 키셋(커서) 페이지네이션
+
+    (transaction_date, id) 쌍을 기준으로 마지막으로 내려준 행 "다음"부터만 조회한다.
+    OFFSET 스캔과 COUNT(*)를 사용하지 않으므로 N번째 페이지도 첫 페이지와 비용이 같다.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50  # 기본 페이지 크기
+    max_page_size = 500  # 클라이언트가 지정할 수 있는 최대 페이지 크기
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_querysets([(queryset, None)], request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset 의 async 버전 (async 뷰에서 사용)"""
+        return await self.apaginate_querysets([(queryset, None)], request, view)
+
+    def paginate_querysets(self, sources, request, view=None):
+        """
+        여러 queryset(예: 거래 내역, 보관 거래 내역)을 하나의 목록처럼 합쳐 페이지네이션한다.
+
+        sources 는 (queryset, newest) 목록이며 newest 는 그 queryset 에 있을 수 있는
+        가장 최근 거래 일시다. (None 이면 제한 없음)
+        queryset 자리에 queryset 목록을 주면 계좌별로 나눠 읽는다. (get_page_queryset 참고)
+        앞에서 읽은 행으로 이미 페이지가 찼고 newest 가 페이지 마지막 행보다 이전이면 조회하지 않는다.
+        """
+        position = self.prepare(request)
+        rows = []
+        for queryset, newest in sources:
+            if self.can_skip(rows, newest):
+                continue
+            rows = merge_rows(rows, self.get_page_queryset(queryset, position))
+        return self.get_page(rows)
+
+    async def apaginate_querysets(self, sources, request, view=None):
+        """paginate_querysets 의 async 버전"""
+        position = self.prepare(request)
+        rows = []
+        for queryset, newest in sources:
+            if self.can_skip(rows, newest):
+                continue
+            queryset = self.get_page_queryset(queryset, position)
+            rows = merge_rows(rows, [row async for row in queryset])
+        return self.get_page(rows)
+
+    def prepare(self, request):
+        """요청의 페이지 크기를 정하고 커서 위치를 반환"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        return self.decode_cursor(request)
+
+    def can_skip(self, rows, newest):
+        if newest is None or len(rows) <= self.page_size:
+            return False
+        return newest < self.get_position(rows[self.page_size])[0]
+
+    def get_page_queryset(self, queryset, position):
+        """
+        position 다음 한 페이지(+1건) 조회 queryset
+
+        queryset 이 목록(예: 계좌별 queryset)이면 각각을 인덱스 순서로 page_size + 1 건만 읽는
+        하위 쿼리로 만들어 UNION ALL 로 합친다. account_id IN (...) 한 쿼리로 읽으면
+        (account_id, transaction_date, id) 인덱스 순서를 쓸 수 없어 계좌의 모든 행을 정렬하지만,
+        이렇게 하면 정렬 대상이 (계좌 수 × 페이지 크기) 건으로 줄어 N번째 페이지도 비용이 같다.
+        """
+        if isinstance(queryset, list):
+            parts = [self.get_page_queryset(part, position) for part in queryset]
+            if len(parts) == 1:
+                return parts[0]
+            combined = parts[0].union(*parts[1:], all=True)
+            return combined.order_by("-transaction_date", "-id")[: self.page_size + 1]
+        # 동일한 거래 일시가 있어도 순서가 고정되도록 id를 보조 정렬 키로 사용
+        queryset = after_position(
+            queryset.order_by("-transaction_date", "-id"), position
+        )
+        # 다음 페이지 존재 여부는 COUNT 대신 한 건을 더 읽어서 판단
+        return queryset[: self.page_size + 1]
+
+    def get_page(self, rows):
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        self.next_position = self.get_position(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_position(self, row):
+        return get_position(row)
+
+    def encode_cursor(self, position):
+        transaction_date, pk = position
+        raw = f"{transaction_date.isoformat()}|{pk}"
+        return b64encode(raw.encode("ascii")).decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = b64decode(encoded.encode("ascii"), validate=True).decode("ascii")
+            transaction_date, pk = raw.split("|")
+            return datetime.fromisoformat(transaction_date), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
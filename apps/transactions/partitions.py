@@ -0,0 +1,127 @@
+import re
+from datetime import date, datetime
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.transactions.models import Transaction
+
+# 거래 내역 테이블의 월 단위 범위 파티션 관리 (PostgreSQL 전용)
+#
+# transactions_transaction 은 transaction_date 로 나눈 파티션 테이블이며 (0006 마이그레이션)
+# 한 달치 거래가 transactions_transaction_pYYYY_MM 파티션 하나에 들어간다.
+# 월 경계는 서비스 시간대(TIME_ZONE) 기준이고, 어느 월 파티션에도 속하지 않는 거래는
+# 기본 파티션(transactions_transaction_default)에 저장된다.
+# manage_transaction_partitions 관리 명령으로 다음 달 파티션을 미리 만들어 두어야
+# 기본 파티션에 거래가 쌓이지 않는다.
+
+TABLE = Transaction._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+PARTITION_NAME_RE = re.compile(rf"^{TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(value):
+    """value(날짜/시각)가 속한 달의 1일"""
+    return value.replace(day=1)
+
+
+def add_months(month, months):
+    """month(월 1일)에서 months 개월 뒤의 1일"""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+def partition_bounds(month):
+    """월 파티션 범위 [시작, 끝) - 서비스 시간대 기준 월 경계 시각"""
+    end = add_months(month, 1)
+    return (
+        timezone.make_aware(datetime(month.year, month.month, 1)),
+        timezone.make_aware(datetime(end.year, end.month, 1)),
+    )
+
+
+def is_partitioned():
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions():
+    """붙어 있는 월 파티션 {월 1일: 파티션 이름} (기본 파티션 제외)"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            """,
+            [TABLE],
+        )
+        names = [name for (name,) in cursor.fetchall()]
+    partitions = {}
+    for name in names:
+        match = PARTITION_NAME_RE.match(name)
+        if match:
+            year, month = map(int, match.groups())
+            partitions[date(year, month, 1)] = name
+    return dict(sorted(partitions.items()))
+
+
+def create_partition(month):
+    """
+    month 의 파티션을 만든다. 이미 있으면 아무것도 하지 않고 False 를 반환한다.
+
+    기본 파티션에 해당 월 거래가 있으면 새 파티션으로 옮긴 뒤 붙인다.
+    (기본 파티션에 범위가 겹치는 행이 있으면 PostgreSQL 이 파티션 생성을 거부함)
+    """
+    name = partition_name(month)
+    if month in list_partitions():
+        return False
+    start, end = partition_bounds(month)
+    quote = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        # 인덱스/제약은 ATTACH 할 때 부모 테이블 기준으로 만들어짐
+        cursor.execute(
+            f"CREATE TABLE {quote(name)} "
+            f"(LIKE {quote(TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {quote(DEFAULT_PARTITION)}
+                WHERE transaction_date >= %s AND transaction_date < %s
+                RETURNING *
+            )
+            INSERT INTO {quote(name)} SELECT * FROM moved
+            """,
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(TABLE)} ATTACH PARTITION {quote(name)} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [start.isoformat(), end.isoformat()],
+        )
+    return True
+
+
+def detach_partition(month):
+    """
+    month 의 파티션을 떼어 낸다. 떼어 낸 테이블은 같은 이름으로 남으며 조회/API 에서는 보이지 않는다.
+    """
+    name = list_partitions()[month]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {connection.ops.quote_name(TABLE)} "
+            f"DETACH PARTITION {connection.ops.quote_name(name)}"
+        )
+    return name
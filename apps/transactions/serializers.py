@@ -1,7 +1,17 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 
+from apps.common.serializers import ValuesListSerializer
 from apps.transactions.models import Transaction
 
+# 거래 금액은 0보다 커야 함 - 입출금 방향은 io_type 으로만 나타냄
+# (음수 금액을 받으면 출금이 잔액을 늘리고 입금이 잔액을 음수로 만들어 잔액 검사를 우회함)
+POSITIVE_AMOUNT = {
+    "min_value": Decimal("0.01"),
+    "error_messages": {"min_value": "거래 금액은 0보다 커야 합니다."},
+}
+
 
 class TransactionHistorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -9,7 +19,21 @@ class TransactionHistorySerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class TransactionHistoryListSerializer(ValuesListSerializer):
+    # 거래 내역 목록 조회용 fast path - TransactionHistorySerializer 와 같은 JSON 을 만든다
+    serializer_class = TransactionHistorySerializer
+
+
 class TransactionsCreateSerializer(serializers.ModelSerializer):
+    # 계좌 소유권 확인과 잠금은 뷰에서 한 번에 하므로 계좌는 id 로만 검증 (계좌 조회 쿼리 없음)
+    account = serializers.IntegerField(source="account_id")
+
+    def create(self, validated_data):
+        # 뷰가 잠근 계좌 객체를 save(account=...)로 넘기면 id 대신 그 객체로 연결
+        if "account" in validated_data:
+            validated_data.pop("account_id", None)
+        return super().create(validated_data)
+
     class Meta:
         model = Transaction
         fields = [
@@ -22,6 +46,7 @@ class TransactionsCreateSerializer(serializers.ModelSerializer):
             "transaction_date",
         ]
         read_only_fields = ["id", "balance_after", "transaction_date"]
+        extra_kwargs = {"amount": POSITIVE_AMOUNT}
 
 
 class TransactionsUpdateSerializer(serializers.ModelSerializer):
@@ -37,4 +62,55 @@ class TransactionsUpdateSerializer(serializers.ModelSerializer):
             "transaction_type",
             "transaction_date",
         ]
-        read_only_fields = ["id"]
+        # 거래 후 잔액은 금액/입출금 타입 변경에 따라 뷰가 다시 계산하고, 계좌는 옮길 수 없음
+        read_only_fields = ["id", "account", "balance_after", "transaction_date"]
+        extra_kwargs = {"amount": POSITIVE_AMOUNT}
+
+
+class TransactionsBulkListSerializer(serializers.ListSerializer):
+    """
+    일괄 거래 생성용 ListSerializer
+
+    한 항목이 실패해도 나머지 항목의 검증을 계속하고, 항목별 오류를 item_errors 에 모은다.
+    validated_data 는 입력과 같은 순서의 리스트이며, 검증에 실패한 항목 자리는 None 이다.
+    """
+
+    def to_internal_value(self, data):
+        self.item_errors = {}
+        self._child_index = 0
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        index = self._child_index
+        self._child_index += 1
+        try:
+            return super().run_child_validation(data)
+        except serializers.ValidationError as exc:
+            self.item_errors[index] = exc.detail
+            return None
+
+
+class TransactionsBulkCreateSerializer(serializers.ModelSerializer):
+    # 항목마다 계좌를 조회하지 않도록 계좌는 id 로만 검증하고, 소유권은 뷰에서 한 번에 확인
+    account = serializers.IntegerField(source="account_id")
+
+    class Meta:
+        model = Transaction
+        fields = [
+            "account",
+            "amount",
+            "description",
+            "io_type",
+            "transaction_type",
+        ]
+        list_serializer_class = TransactionsBulkListSerializer
+        extra_kwargs = {"amount": POSITIVE_AMOUNT}
+
+
+class TransactionSummarySerializer(serializers.Serializer):
+    # 월별이면 해당 월 1일, 연도별이면 해당 연도 1월 1일
+    period = serializers.DateField()
+    deposit_count = serializers.IntegerField()
+    deposit_amount = serializers.DecimalField(max_digits=18, decimal_places=2)
+    withdraw_count = serializers.IntegerField()
+    withdraw_amount = serializers.DecimalField(max_digits=18, decimal_places=2)
@@ -0,0 +1,127 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.transactions.models import (
+    Transaction,
+    TransactionArchive,
+    TransactionDailySummary,
+)
+
+
+def summary_key(transaction_obj):
+    """거래가 속하는 일일 집계 행의 키 (계좌, 날짜, 입출금 타입, 거래 타입)"""
+    return (
+        transaction_obj.account_id,
+        # 날짜는 서비스 시간대(TIME_ZONE) 기준
+        timezone.localdate(transaction_obj.transaction_date),
+        transaction_obj.io_type,
+        transaction_obj.transaction_type,
+    )
+
+
+def apply_summary_changes(added=(), removed=()):
+    """
+    추가/삭제된 거래를 일일 집계에 반영한다.
+
+    같은 집계 행에 대한 변경은 먼저 합쳐서 행마다 한 번만 갱신하며,
+    수정 전/후가 같은 행이면 서로 상쇄되어 아무것도 하지 않는다.
+    거래를 저장하는 것과 같은 DB 트랜잭션 안에서 호출해야 한다.
+    """
+    deltas = defaultdict(lambda: [0, Decimal("0")])
+    for transaction_obj in added:
+        delta = deltas[summary_key(transaction_obj)]
+        delta[0] += 1
+        delta[1] += transaction_obj.amount
+    for transaction_obj in removed:
+        delta = deltas[summary_key(transaction_obj)]
+        delta[0] -= 1
+        delta[1] -= transaction_obj.amount
+
+    for key, (count, amount) in deltas.items():
+        if count or amount:
+            _apply_summary_delta(key, count, amount)
+
+
+def _apply_summary_delta(key, count, amount):
+    account_id, day, io_type, transaction_type = key
+    lookup = {
+        "account_id": account_id,
+        "day": day,
+        "io_type": io_type,
+        "transaction_type": transaction_type,
+    }
+    changes = {
+        "count": F("count") + count,
+        "total_amount": F("total_amount") + amount,
+    }
+    # 대부분은 이미 그날의 집계 행이 있으므로 UPDATE 한 번으로 끝남
+    if TransactionDailySummary.objects.filter(**lookup).update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            TransactionDailySummary.objects.create(
+                **lookup, count=count, total_amount=amount
+            )
+    except IntegrityError:
+        # 다른 요청이 같은 집계 행을 먼저 만든 경우
+        TransactionDailySummary.objects.filter(**lookup).update(**changes)
+
+
+def summary_rows_sql(account_ids=None):
+    """
+    거래 내역과 보관 거래 내역을 합쳐 일일 집계 행을 구하는 (SQL, 파라미터)
+
+    일일 집계는 보관 거래도 포함하므로 두 테이블을 UNION ALL 로 합친 뒤 한 번에 GROUP BY 한다.
+    한 쿼리(한 스냅샷)로 읽어야 보관 명령이 옮기는 중인 거래가 두 번 세어지거나 빠지지 않는다.
+    """
+    parts = []
+    for model in (Transaction, TransactionArchive):
+        queryset = model.objects.all()
+        if account_ids is not None:
+            queryset = queryset.filter(account_id__in=account_ids)
+        parts.append(
+            queryset.annotate(day=TruncDate("transaction_date"))
+            .values("account_id", "day", "io_type", "transaction_type", "amount")
+            .order_by()
+        )
+    ledger_sql, params = parts[0].union(parts[1], all=True).query.sql_with_params()
+    sql = f"""
+        SELECT account_id, day, io_type, transaction_type, COUNT(*), SUM(amount)
+        FROM ({ledger_sql}) AS ledger_rows
+        GROUP BY account_id, day, io_type, transaction_type
+    """
+    return sql, params
+
+
+def rebuild_summaries(account_ids=None, batch_size=1000):
+    """
+    거래 내역 전체(보관 거래 포함)를 다시 집계하여 일일 집계 테이블을 재생성한다.
+    account_ids 를 지정하면 해당 계좌만 재생성한다. 생성한 집계 행 수를 반환한다.
+    """
+    summaries = TransactionDailySummary.objects.all()
+    if account_ids is not None:
+        summaries = summaries.filter(account_id__in=account_ids)
+
+    sql, params = summary_rows_sql(account_ids)
+    fields = ["account_id", "day", "io_type", "transaction_type", "count"]
+    created = 0
+    with transaction.atomic():
+        summaries.delete()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            # 집계 결과를 배치 단위로 나누어 저장하여 메모리 사용량을 일정하게 유지
+            while batch := cursor.fetchmany(batch_size):
+                created += len(
+                    TransactionDailySummary.objects.bulk_create(
+                        TransactionDailySummary(
+                            **dict(zip(fields, row[:5])), total_amount=row[5]
+                        )
+                        for row in batch
+                    )
+                )
+    return created
@@ -1,13 +1,50 @@
+import csv
+import json
+import threading
+from datetime import timedelta
 from decimal import Decimal
+from io import StringIO
+from unittest import skipUnless
 
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.accounts.models import Account
-from apps.transactions.models import Transaction
+from apps.common.admin import EstimatedCountPaginator
+from apps.transactions.archive import ARCHIVE_FIELDS
+from apps.transactions.filters import TransactionFilterSerializer
+from apps.transactions.ledgers import reconcile_ledgers
+from apps.transactions.models import (
+    IdempotencyKey,
+    Transaction,
+    TransactionArchive,
+    TransactionDailySummary,
+)
+from apps.transactions.pagination import TransactionCursorPagination
+from apps.transactions.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    create_partition,
+    list_partitions,
+    month_start,
+    partition_bounds,
+    partition_name,
+)
+from apps.transactions.serializers import (
+    TransactionHistoryListSerializer,
+    TransactionHistorySerializer,
+)
+from apps.transactions.views import get_history_sources
 
 User = get_user_model()
 
@@ -55,7 +92,109 @@ class TransactionHistoryAPITestCase(APITestCase):
     def test_transaction_list(self):
         response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)  # 거래 내역 1건 존재
+        self.assertEqual(len(response.data["results"]), 1)  # 거래 내역 1건 존재
+        self.assertIsNone(response.data["next"])  # 다음 페이지 없음
+
+    def test_transaction_list_fast_path_matches_model_serializer(self):
+        Transaction.objects.create(
+            account=self.account,
+            amount=Decimal("0.10"),
+            io_type="WITHDRAW",
+            transaction_type="CARD",
+            balance_after=Decimal("109999.90"),
+            description='따옴표 " 와 줄바꿈\n',
+        )
+        queryset = Transaction.objects.order_by("-transaction_date", "-id")
+        expected = JSONRenderer().render(
+            TransactionHistorySerializer(queryset, many=True).data
+        )
+        fast = JSONRenderer().render(
+            TransactionHistoryListSerializer(
+                queryset.values(*TransactionHistoryListSerializer.value_fields())
+            ).data
+        )
+        self.assertEqual(fast, expected)
+
+        response = self.client.get(self.list_url)
+        self.assertEqual(JSONRenderer().render(response.data["results"]), expected)
+
+    def test_transaction_list_cursor_pagination(self):
+        for i in range(4):
+            Transaction.objects.create(
+                account=self.account,
+                amount=Decimal("1000.00"),
+                io_type="DEPOSIT",
+                transaction_type="ATM",
+                balance_after=Decimal("110000.00"),
+                description=f"입금 {i}",
+            )
+        expected_ids = list(
+            Transaction.objects.order_by("-transaction_date", "-id").values_list(
+                "id", flat=True
+            )
+        )
+
+        # next 링크를 따라가며 모든 페이지 순회
+        seen_ids = []
+        url = f"{self.list_url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen_ids += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(seen_ids, expected_ids)  # 중복/누락 없이 정렬 순서 유지
+
+    def test_transaction_list_cursor_pagination_across_accounts(self):
+        # 계좌별로 나눠 읽은 페이지를 합쳐도 전체 (거래 일시, id) 순서와 같아야 함
+        other = Account.objects.create(user=self.user, account_number="MULTI-2")
+        for i in range(5):
+            Transaction.objects.create(
+                account=other if i % 2 else self.account,
+                amount=Decimal("1000.00"),
+                io_type="DEPOSIT",
+                transaction_type="ATM",
+                balance_after=Decimal("1000.00"),
+            )
+        expected_ids = list(
+            Transaction.objects.order_by("-transaction_date", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        seen_ids, url = [], f"{self.list_url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen_ids += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(seen_ids, expected_ids)
+
+    def test_transaction_list_page_size_is_capped(self):
+        response = self.client.get(self.list_url, {"page_size": 100000})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_transaction_list_conditional_get(self):
+        first = self.client.get(self.list_url)
+        etag = first["ETag"]
+        response = self.client.get(self.list_url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        # 쿼리 문자열이 다르면 다른 ETag
+        other = self.client.get(self.list_url, {"io_type": "DEPOSIT"})
+        self.assertNotEqual(other["ETag"], etag)
+
+        # 거래가 바뀌면 커밋 후 ETag 가 바뀜
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(self.detail_url)
+        response = self.client.get(self.list_url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+
+    def test_transaction_list_invalid_cursor(self):
+        response = self.client.get(self.list_url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_transaction_create(self):
         data = {
@@ -69,6 +208,55 @@ class TransactionHistoryAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Transaction.objects.count(), 2)
 
+    def test_transaction_create_rejects_non_positive_amount(self):
+        for io_type in ("DEPOSIT", "WITHDRAW"):
+            for amount in ("-500.00", "0.00"):
+                data = {
+                    "account": self.account.id,
+                    "amount": amount,
+                    "io_type": io_type,
+                    "transaction_type": "ATM",
+                }
+                with self.subTest(io_type=io_type, amount=amount):
+                    response = self.client.post(self.create_url, data)
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                    self.assertIn("amount", response.data)
+        self.assertEqual(Transaction.objects.count(), 1)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("100000.00"))
+
+    def test_transaction_create_runs_one_lock_insert_and_update(self):
+        account_table = Account._meta.db_table
+        transaction_table = Transaction._meta.db_table
+        for io_type in ("DEPOSIT", "WITHDRAW"):
+            data = {
+                "account": self.account.id,
+                "amount": "100.00",
+                "io_type": io_type,
+                "transaction_type": "ATM",
+            }
+            with self.subTest(io_type=io_type):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.post(self.create_url, data)
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+                self.assertEqual(response.data["account"], self.account.id)
+
+                def statements(verb, table):
+                    return [
+                        query["sql"]
+                        for query in queries.captured_queries
+                        if query["sql"].startswith(verb)
+                        and f'"{table}"' in query["sql"]
+                    ]
+
+                # 계좌는 잠금 조회 1번과 잔액 UPDATE 1번, 거래는 INSERT 1번 (다시 읽지 않음)
+                account_reads = statements("SELECT", account_table)
+                self.assertEqual(len(account_reads), 1)
+                self.assertIn("FOR UPDATE", account_reads[0])
+                self.assertEqual(len(statements("UPDATE", account_table)), 1)
+                self.assertEqual(len(statements("INSERT", transaction_table)), 1)
+                self.assertEqual(statements("SELECT", transaction_table), [])
+
     def test_transaction_update(self):
         data = {
             "amount": "20000.00",
@@ -87,6 +275,118 @@ class TransactionHistoryAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Transaction.objects.count(), 0)
 
+    def create_ledger(self):
+        # 입금 1000 → 출금 300 → 입금 200 순서의 계좌 (잔액 900)
+        account = Account.objects.create(
+            user=self.user, account_number="L-1", balance=Decimal("900.00")
+        )
+        ledger = [
+            ("DEPOSIT", "1000.00", "1000.00"),
+            ("WITHDRAW", "300.00", "700.00"),
+            ("DEPOSIT", "200.00", "900.00"),
+        ]
+        return account, [
+            Transaction.objects.create(
+                account=account,
+                amount=Decimal(amount),
+                io_type=io_type,
+                transaction_type="ATM",
+                balance_after=Decimal(balance_after),
+            )
+            for io_type, amount, balance_after in ledger
+        ]
+
+    def assertLedger(self, account, balances, balance):
+        rows = Transaction.objects.filter(account=account).order_by(
+            "transaction_date", "id"
+        )
+        self.assertEqual(
+            [row.balance_after for row in rows], [Decimal(b) for b in balances]
+        )
+        account.refresh_from_db()
+        self.assertEqual(account.balance, Decimal(balance))
+
+    def test_transaction_update_shifts_later_balances(self):
+        account, (first, middle, last) = self.create_ledger()
+        url = reverse("transactions:transaction-detail", args=[middle.id])
+        # 거래 후 잔액은 직접 바꿀 수 없고 금액/입출금 타입 변경에 따라 다시 계산됨
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                url,
+                {"amount": "500.00", "balance_after": "1.00"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["balance_after"], "500.00")
+        self.assertLedger(account, ["1000.00", "500.00", "700.00"], "700.00")
+        # 이후 거래는 행 수와 관계없이 UPDATE 한 번으로 고침
+        table = Transaction._meta.db_table
+        shifts = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(f'UPDATE "{table}"')
+            and '"balance_after" + ' in query["sql"]
+        ]
+        self.assertEqual(len(shifts), 1)
+
+        response = self.client.put(url, {"io_type": "DEPOSIT"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLedger(account, ["1000.00", "1500.00", "1700.00"], "1700.00")
+
+    def test_transaction_delete_shifts_later_balances(self):
+        account, (first, middle, last) = self.create_ledger()
+        url = reverse("transactions:transaction-detail", args=[middle.id])
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_200_OK)
+        self.assertLedger(account, ["1000.00", "1200.00"], "1200.00")
+
+    def test_transaction_update_and_delete_reject_negative_balance(self):
+        account, (first, middle, last) = self.create_ledger()
+        url = reverse("transactions:transaction-detail", args=[middle.id])
+        response = self.client.put(url, {"amount": "1300.00"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "잔액이 부족합니다."})
+        response = self.client.delete(
+            reverse("transactions:transaction-detail", args=[first.id])
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertLedger(account, ["1000.00", "700.00", "900.00"], "900.00")
+
+    def test_transaction_update_rejects_non_positive_amount(self):
+        # 입금 +100 을 출금 -100 으로 바꾸면 잔액 변화(delta)는 0 이지만 음수 거래가 저장되므로 거부
+        account, (first, middle, last) = self.create_ledger()
+        url = reverse("transactions:transaction-detail", args=[first.id])
+        for amount in ("-1000.00", "0.00"):
+            with self.subTest(amount=amount):
+                response = self.client.put(
+                    url, {"amount": amount, "io_type": "WITHDRAW"}, format="json"
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("amount", response.data)
+        first.refresh_from_db()
+        self.assertEqual((first.amount, first.io_type), (Decimal("1000.00"), "DEPOSIT"))
+        self.assertLedger(account, ["1000.00", "700.00", "900.00"], "900.00")
+
+    def test_transaction_delete_rejects_negative_intermediate_balance(self):
+        # 입금 1000 → 출금 300 → 입금 200 → 입금 500 에서 첫 입금을 지우면 최종 잔액은 400 이지만
+        # 그 입금에 기대어 출금한 거래의 거래 후 잔액이 -300 이 되므로 거부
+        account, (first, middle, last) = self.create_ledger()
+        Transaction.objects.create(
+            account=account,
+            amount=Decimal("500.00"),
+            io_type="DEPOSIT",
+            transaction_type="ATM",
+            balance_after=Decimal("1400.00"),
+        )
+        Account.objects.filter(pk=account.pk).update(balance=Decimal("1400.00"))
+        response = self.client.delete(
+            reverse("transactions:transaction-detail", args=[first.id])
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "잔액이 부족합니다."})
+        self.assertLedger(
+            account, ["1000.00", "700.00", "900.00", "1400.00"], "1400.00"
+        )
+
     def test_unauthenticated_access(self):
         self.client.logout()
         response = self.client.get(self.list_url)
@@ -94,3 +394,933 @@ class TransactionHistoryAPITestCase(APITestCase):
             response.status_code,
             [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN],
         )
+
+
+class TransactionFilterAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="filter@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(user=self.user, account_number="F-1")
+        self.other_account = Account.objects.create(
+            user=self.user, account_number="F-2"
+        )
+        self.list_url = reverse("transactions:transaction-list")
+
+        rows = [
+            (self.account, "1000.00", "DEPOSIT", "ATM", "2025-01-10T12:00:00+09:00"),
+            (self.account, "5000.00", "WITHDRAW", "CARD", "2025-01-31T23:59:00+09:00"),
+            (self.account, "300.00", "WITHDRAW", "CARD", "2025-02-01T00:00:00+09:00"),
+            (
+                self.other_account,
+                "700.00",
+                "DEPOSIT",
+                "INTEREST",
+                "2025-01-15T09:00:00+09:00",
+            ),
+        ]
+        for account, amount, io_type, transaction_type, transaction_date in rows:
+            created = Transaction.objects.create(
+                account=account,
+                amount=Decimal(amount),
+                balance_after=Decimal("0.00"),
+                io_type=io_type,
+                transaction_type=transaction_type,
+            )
+            # auto_now_add 필드는 생성 후 update로 거래 일시를 지정
+            Transaction.objects.filter(pk=created.pk).update(
+                transaction_date=transaction_date
+            )
+
+    def get_amounts(self, params):
+        response = self.client.get(self.list_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["amount"] for row in response.data["results"]]
+
+    def test_filter_by_date_range(self):
+        # 종료일 당일 23:59 거래는 포함, 다음 날 0시 거래는 제외
+        self.assertEqual(
+            self.get_amounts({"start_date": "2025-01-11", "end_date": "2025-01-31"}),
+            ["5000.00", "700.00"],
+        )
+
+    def test_filter_by_types_and_amount(self):
+        self.assertEqual(
+            self.get_amounts({"io_type": "WITHDRAW", "min_amount": "1000"}),
+            ["5000.00"],
+        )
+        self.assertEqual(self.get_amounts({"transaction_type": "INTEREST"}), ["700.00"])
+
+    def test_filter_by_accounts(self):
+        self.assertEqual(
+            self.get_amounts({"account": [self.other_account.id]}), ["700.00"]
+        )
+        # 다른 사용자의 계좌 id 는 무시되어 결과가 없음
+        self.assertEqual(self.get_amounts({"account": [999999]}), [])
+
+    def test_invalid_filter(self):
+        response = self.client.get(
+            self.list_url, {"io_type": "REFUND", "min_amount": "10", "max_amount": "1"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("io_type", response.data)
+
+
+class TransactionExportAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="export@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(user=self.user, account_number="E-1")
+        self.export_url = reverse("transactions:transaction-export")
+        for amount, io_type in [("10.00", "DEPOSIT"), ("3.50", "WITHDRAW")]:
+            Transaction.objects.create(
+                account=self.account,
+                amount=Decimal(amount),
+                balance_after=Decimal("0.00"),
+                io_type=io_type,
+                transaction_type="ATM",
+                description="쉼표, 포함",
+            )
+
+    def read(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_csv(self):
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.reader(self.read(response).splitlines()))
+        self.assertEqual(rows[0][:3], ["id", "amount", "balance_after"])
+        # 최신 거래부터, 쉼표가 포함된 값도 한 컬럼으로 유지
+        self.assertEqual([row[1] for row in rows[1:]], ["3.50", "10.00"])
+        self.assertEqual(rows[1][3], "쉼표, 포함")
+
+    def test_export_ndjson_matches_list_api(self):
+        response = self.client.get(
+            self.export_url, {"export_format": "ndjson", "io_type": "DEPOSIT"}
+        )
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in self.read(response).splitlines()]
+
+        listed = self.client.get(
+            reverse("transactions:transaction-list"), {"io_type": "DEPOSIT"}
+        )
+        self.assertEqual(records, json.loads(listed.content)["results"])
+
+    def test_export_invalid_format(self):
+        response = self.client.get(self.export_url, {"export_format": "xlsx"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TransactionSummaryAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="summary@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user, account_number="S-1", balance=Decimal("1000.00")
+        )
+        self.summary_url = reverse("transactions:transaction-summary")
+
+    def summary_rows(self):
+        return list(
+            TransactionDailySummary.objects.order_by(
+                "day", "io_type", "transaction_type"
+            ).values_list("day", "io_type", "transaction_type", "count", "total_amount")
+        )
+
+    def test_summaries_follow_create_update_delete(self):
+        create_url = reverse("transactions:transaction-create")
+        bulk_url = reverse("transactions:transaction-bulk-create")
+        item = {
+            "account": self.account.id,
+            "io_type": "DEPOSIT",
+            "transaction_type": "ATM",
+        }
+        first = self.client.post(
+            create_url, {**item, "amount": "100.00"}, format="json"
+        )
+        self.client.post(create_url, {**item, "amount": "50.00"}, format="json")
+        self.client.post(
+            bulk_url,
+            [
+                {**item, "amount": "10.00", "io_type": "WITHDRAW"},
+                {**item, "amount": "20.00", "transaction_type": "CARD"},
+            ],
+            format="json",
+        )
+        detail_url = lambda pk: reverse("transactions:transaction-detail", args=[pk])
+        self.client.put(
+            detail_url(first.data["id"]), {"amount": "150.00"}, format="json"
+        )
+        self.client.delete(
+            detail_url(Transaction.objects.get(transaction_type="CARD").id)
+        )
+
+        today = timezone.localdate()
+        expected = [
+            (today, "DEPOSIT", "ATM", 2, Decimal("200.00")),
+            (today, "DEPOSIT", "CARD", 0, Decimal("0.00")),
+            (today, "WITHDRAW", "ATM", 1, Decimal("10.00")),
+        ]
+        self.assertEqual(self.summary_rows(), expected)
+
+        # 재생성 결과도 증분 유지 결과와 같아야 함 (0건 행은 재생성 시 사라짐)
+        call_command("rebuild_transaction_summaries", stdout=StringIO())
+        self.assertEqual(self.summary_rows(), [expected[0], expected[2]])
+
+    def test_monthly_and_yearly_summary(self):
+        for day, io_type, amount in [
+            ("2024-12-31", "DEPOSIT", "100.00"),
+            ("2025-01-01", "DEPOSIT", "200.00"),
+            ("2025-01-20", "WITHDRAW", "50.00"),
+            ("2025-02-03", "WITHDRAW", "70.00"),
+        ]:
+            TransactionDailySummary.objects.create(
+                account=self.account,
+                day=day,
+                io_type=io_type,
+                transaction_type="ATM",
+                count=1,
+                total_amount=Decimal(amount),
+            )
+
+        response = self.client.get(self.summary_url, {"start_date": "2025-01-01"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [dict(row) for row in response.data],
+            [
+                {
+                    "period": "2025-01-01",
+                    "deposit_count": 1,
+                    "deposit_amount": "200.00",
+                    "withdraw_count": 1,
+                    "withdraw_amount": "50.00",
+                },
+                {
+                    "period": "2025-02-01",
+                    "deposit_count": 0,
+                    "deposit_amount": "0.00",
+                    "withdraw_count": 1,
+                    "withdraw_amount": "70.00",
+                },
+            ],
+        )
+
+        response = self.client.get(self.summary_url, {"period": "year"})
+        self.assertEqual(
+            [(row["period"], row["deposit_amount"]) for row in response.data],
+            [("2024-01-01", "100.00"), ("2025-01-01", "200.00")],
+        )
+
+
+class TransactionIdempotencyAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="idem@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user, account_number="IDEM-1", balance=Decimal("100.00")
+        )
+        self.create_url = reverse("transactions:transaction-create")
+        self.payload = {
+            "account": self.account.id,
+            "amount": "10.00",
+            "io_type": "DEPOSIT",
+            "transaction_type": "ATM",
+        }
+
+    def test_retry_with_same_key_returns_stored_response(self):
+        headers = {"Idempotency-Key": "retry-1"}
+        first = self.client.post(
+            self.create_url, self.payload, format="json", headers=headers
+        )
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        # 재시도는 (사용자, 키) 조회 한 번만 하고 쓰기는 하지 않음
+        with self.assertNumQueries(1):
+            retry = self.client.post(
+                self.create_url, self.payload, format="json", headers=headers
+            )
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(Transaction.objects.count(), 1)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("110.00"))
+
+    def test_same_key_with_different_body_is_rejected(self):
+        headers = {"Idempotency-Key": "retry-2"}
+        self.client.post(self.create_url, self.payload, format="json", headers=headers)
+        response = self.client.post(
+            self.create_url,
+            {**self.payload, "amount": "20.00"},
+            format="json",
+            headers=headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Transaction.objects.count(), 1)
+
+    def test_purge_expired_keys(self):
+        self.client.post(
+            self.create_url,
+            self.payload,
+            format="json",
+            headers={"Idempotency-Key": "expired"},
+        )
+        self.client.post(
+            self.create_url,
+            self.payload,
+            format="json",
+            headers={"Idempotency-Key": "fresh"},
+        )
+        IdempotencyKey.objects.filter(key="expired").update(expires_at=timezone.now())
+
+        call_command("purge_idempotency_keys", batch_size=1, stdout=StringIO())
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list("key", flat=True)), ["fresh"]
+        )
+
+
+class TransactionBulkCreateAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="bulk@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user, account_number="BULK-1", balance=Decimal("100.00")
+        )
+        self.other_account = Account.objects.create(
+            user=self.user, account_number="BULK-2"
+        )
+        self.bulk_url = reverse("transactions:transaction-bulk-create")
+
+    def item(self, account, amount, io_type="DEPOSIT"):
+        return {
+            "account": account.id,
+            "amount": amount,
+            "io_type": io_type,
+            "transaction_type": "CARD",
+        }
+
+    def test_bulk_create_applies_items_in_order(self):
+        payload = [
+            self.item(self.account, "50.00"),
+            self.item(self.other_account, "30.00"),
+            self.item(self.account, "120.00", "WITHDRAW"),
+            self.item(self.other_account, "5.00", "WITHDRAW"),
+        ]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(
+            [row["balance_after"] for row in response.data["created"]],
+            ["150.00", "30.00", "30.00", "25.00"],
+        )
+        self.account.refresh_from_db()
+        self.other_account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("30.00"))
+        self.assertEqual(self.other_account.balance, Decimal("25.00"))
+
+    def test_bulk_create_rejects_whole_batch_on_error(self):
+        other_user = User.objects.create_user(
+            email="bulk2@example.com", password="pw", nickname="bulk2"
+        )
+        foreign_account = Account.objects.create(
+            user=other_user, account_number="BULK-3"
+        )
+        payload = [
+            self.item(self.account, "10.00"),
+            self.item(self.account, "1000.00", "WITHDRAW"),  # 잔액 부족
+            self.item(foreign_account, "10.00"),  # 다른 사용자의 계좌
+            {"account": self.account.id, "amount": "x", "io_type": "DEPOSIT"},
+        ]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [error["index"] for error in response.data["errors"]], [1, 2, 3]
+        )
+        self.assertEqual(Transaction.objects.count(), 0)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("100.00"))
+
+    def test_bulk_create_rejects_non_positive_amounts(self):
+        payload = [
+            self.item(self.account, "10.00"),
+            self.item(self.account, "-500.00"),
+            self.item(self.account, "-500.00", "WITHDRAW"),
+            self.item(self.other_account, "0.00"),
+        ]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [error["index"] for error in response.data["errors"]], [1, 2, 3]
+        )
+        self.assertEqual(Transaction.objects.count(), 0)
+        self.account.refresh_from_db()
+        self.other_account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("100.00"))
+        self.assertEqual(self.other_account.balance, Decimal("0.00"))
+
+    def test_bulk_create_allow_partial(self):
+        payload = [
+            self.item(self.account, "1000.00", "WITHDRAW"),  # 잔액 부족
+            self.item(self.account, "10.00"),
+        ]
+        response = self.client.post(
+            f"{self.bulk_url}?allow_partial=true", payload, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["created"]), 1)
+        self.assertEqual(response.data["errors"][0]["index"], 0)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("110.00"))
+
+    def test_bulk_create_uses_one_update_per_account(self):
+        payload = [self.item(self.account, "1.00") for _ in range(50)]
+        payload += [self.item(self.other_account, "1.00") for _ in range(50)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Transaction.objects.count(), 100)
+
+        statements = [query["sql"] for query in queries.captured_queries]
+        # 거래 100건은 INSERT 한 번, 잔액은 계좌당 UPDATE 한 번
+        self.assertEqual(
+            sum(
+                sql.startswith('INSERT INTO "transactions_transaction"')
+                for sql in statements
+            ),
+            1,
+        )
+        self.assertEqual(
+            sum(sql.startswith('UPDATE "accounts_account"') for sql in statements), 2
+        )
+
+    def test_bulk_create_requires_list(self):
+        response = self.client.post(self.bulk_url, {"foo": "bar"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN 검증은 PostgreSQL 전용")
+class TransactionHistoryIndexTestCase(TestCase):
+    """
+    거래 내역 조회 쿼리가 정렬 없이 복합 인덱스를 타는지 EXPLAIN으로 확인
+    뷰와 같은 경로로 계좌가 여러 개인 사용자의 페이지 쿼리를 만든다. (account_id IN (...) 정렬 회귀 검출)
+    """
+
+    ROW_COUNT = 1_000_000
+    ACCOUNT_COUNT = 10
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="explain@example.com", password="pw")
+        accounts = [
+            Account.objects.create(user=user, account_number=f"EXPLAIN-{i}")
+            for i in range(cls.ACCOUNT_COUNT)
+        ]
+        cls.account_ids = [account.id for account in accounts]
+        # 100만 건을 여러 계좌에 나눠 DB 안에서 바로 생성
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO transactions_transaction (
+                    account_id, amount, balance_after, description,
+                    transaction_type, io_type, transaction_date, transaction_updated
+                )
+                SELECT (%s::bigint[])[1 + g %% %s], 1000, 1000, '', 'ATM', 'DEPOSIT',
+                       now() - g * interval '1 second', now()
+                FROM generate_series(1, %s) AS g
+                """,
+                [[a.id for a in accounts], cls.ACCOUNT_COUNT, cls.ROW_COUNT],
+            )
+            cursor.execute("ANALYZE transactions_transaction")
+
+    def assert_index_scan_without_sort(self, queryset):
+        plan = json.loads(queryset.explain(format="json"))[0]["Plan"]
+        node_types = []
+        nodes = [plan]
+        while nodes:
+            node = nodes.pop()
+            node_types.append(node["Node Type"])
+            nodes.extend(node.get("Plans", []))
+        self.assertNotIn("Sort", node_types)
+        self.assertNotIn("Incremental Sort", node_types)
+        self.assertTrue({"Index Scan", "Index Only Scan"} & set(node_types), node_types)
+
+    def get_page_queryset(self, cursor=None):
+        # 뷰와 같은 경로(get_history_sources → 페이지네이터)로 여러 계좌의 한 페이지 쿼리를 만듦
+        params = {"cursor": cursor} if cursor else {}
+        filters = TransactionFilterSerializer(data={})
+        filters.is_valid(raise_exception=True)
+        paginator = TransactionCursorPagination()
+        request = Request(APIRequestFactory().get("/", params))
+        position = paginator.prepare(request)
+        (parts, _newest), *_archived = get_history_sources(
+            filters, self.account_ids, None
+        )
+        return paginator.get_page_queryset(parts, position)
+
+    def test_history_first_page_uses_index(self):
+        self.assert_index_scan_without_sort(self.get_page_queryset())
+
+    def test_history_next_page_uses_index(self):
+        position = (
+            Transaction.objects.filter(account_id__in=self.account_ids)
+            .order_by("-transaction_date", "-id")
+            .values_list("transaction_date", "id")[5000]
+        )
+        cursor = TransactionCursorPagination().encode_cursor(position)
+        self.assert_index_scan_without_sort(self.get_page_queryset(cursor))
+
+
+class TransactionAdminTestCase(TestCase):
+    def setUp(self):
+        admin = User.objects.create_superuser(email="admin@example.com", password="pw")
+        self.client.force_login(admin)
+        self.changelist_url = reverse("admin:transactions_transaction_changelist")
+
+    def create_transactions(self, count):
+        for index in range(count):
+            user = User.objects.create_user(
+                email=f"admin-{count}-{index}@example.com",
+                password="pw",
+                nickname=f"admin-{count}-{index}",
+            )
+            account = Account.objects.create(
+                user=user, account_number=f"ADMIN-{count}-{index}"
+            )
+            Transaction.objects.create(
+                account=account,
+                amount=Decimal("1.00"),
+                balance_after=Decimal("1.00"),
+                io_type="DEPOSIT",
+                transaction_type="ATM",
+            )
+
+    def changelist_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.changelist_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_changelist_query_count_does_not_grow_with_rows(self):
+        self.create_transactions(2)
+        few = self.changelist_queries()
+        self.create_transactions(20)
+        self.assertEqual(self.changelist_queries(), few)
+        self.assertEqual(
+            self.client.get(reverse("admin:accounts_account_changelist")).status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_changelist_filters_recent_period_without_date_scans(self):
+        self.create_transactions(1)
+        old = Transaction.objects.get()
+        Transaction.objects.filter(pk=old.pk).update(
+            transaction_date=timezone.now() - timedelta(days=60)
+        )
+        self.create_transactions(2)
+        for url in (
+            self.changelist_url,
+            reverse("admin:transactions_transactionarchive_changelist"),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            # date_hierarchy 의 MIN/MAX, DISTINCT 날짜 조회가 없어야 함
+            for query in queries.captured_queries:
+                self.assertNotIn("MIN(", query["sql"])
+                self.assertNotIn("DISTINCT", query["sql"])
+
+        response = self.client.get(self.changelist_url, {"period": "30"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result_ids = [row.pk for row in response.context["cl"].result_list]
+        self.assertEqual(len(result_ids), 2)
+        self.assertNotIn(old.pk, result_ids)
+
+    def test_str_does_not_query_unloaded_relations(self):
+        self.create_transactions(1)
+        transaction = Transaction.objects.get()
+        with self.assertNumQueries(0):
+            self.assertIn(f"계좌 {transaction.account_id}", str(transaction))
+        account = Account.objects.get()
+        with self.assertNumQueries(0):
+            self.assertIn(f"사용자 {account.user_id}", str(account))
+
+        transaction = Transaction.objects.select_related("account__user").get()
+        with self.assertNumQueries(0):
+            self.assertIn(transaction.account.account_number, str(transaction))
+            self.assertIn(transaction.account.user.nickname, str(transaction.account))
+
+    @skipUnless(connection.vendor == "postgresql", "예상 건수는 PostgreSQL 전용")
+    def test_estimated_count_skips_count_query(self):
+        self.create_transactions(3)
+        paginator = EstimatedCountPaginator(Transaction.objects.order_by("-id"), 100)
+        paginator.exact_count_limit = -1  # 항상 예상 건수 사용
+        with CaptureQueriesContext(connection) as queries:
+            self.assertGreaterEqual(paginator.count, 0)
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("EXPLAIN"))
+        # 예상 건수가 적으면 정확한 건수
+        self.assertEqual(
+            EstimatedCountPaginator(Transaction.objects.order_by("-id"), 100).count, 3
+        )
+
+
+class TransactionArchiveAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="archive@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(user=self.user, account_number="AR-1")
+        self.list_url = reverse("transactions:transaction-list")
+        now = timezone.now()
+        # 최근 거래 2건, 보관 기간(기본 730일)이 지난 거래 3건
+        for days_ago in [1, 2, 800, 900, 1000]:
+            transaction = Transaction.objects.create(
+                account=self.account,
+                amount=Decimal(days_ago),
+                balance_after=Decimal("0.00"),
+                io_type="DEPOSIT",
+                transaction_type="ATM",
+            )
+            Transaction.objects.filter(pk=transaction.pk).update(
+                transaction_date=now - timedelta(days=days_ago)
+            )
+        self.expected = [
+            row["id"] for row in self.client.get(self.list_url).data["results"]
+        ]
+        call_command("archive_transactions", stdout=StringIO())
+
+    def list_ids(self, params=None):
+        ids, url = [], self.list_url
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [row["id"] for row in response.data["results"]]
+            url, params = response.data["next"], None
+        return ids
+
+    def test_archive_moves_old_transactions(self):
+        self.assertEqual(Transaction.objects.count(), 2)
+        self.assertEqual(
+            sorted(TransactionArchive.objects.values_list("id", flat=True)),
+            sorted(self.expected[2:]),
+        )
+
+    def test_rebuilt_summaries_include_archived_transactions(self):
+        call_command("rebuild_transaction_summaries", stdout=StringIO())
+        summaries = TransactionDailySummary.objects.filter(account=self.account)
+        self.assertEqual(summaries.count(), 5)  # 거래마다 날짜가 다름
+        self.assertEqual(
+            sorted(summaries.values_list("total_amount", flat=True)),
+            [Decimal(days_ago) for days_ago in [1, 2, 800, 900, 1000]],
+        )
+
+    def test_list_merges_archived_transactions(self):
+        self.assertEqual(self.list_ids(), self.expected)
+        self.assertEqual(self.list_ids({"page_size": 2}), self.expected)
+        # 같은 거래가 옮겨지는 중에 양쪽에서 읽혀도 한 번만 내려줌
+        archived = TransactionArchive.objects.get(pk=self.expected[2])
+        hot = Transaction(**{f: getattr(archived, f) for f in ARCHIVE_FIELDS})
+        Transaction.objects.bulk_create([hot])
+        Transaction.objects.filter(pk=hot.pk).update(  # auto_now_add 로 바뀐 일시 복원
+            transaction_date=archived.transaction_date
+        )
+        self.assertEqual(self.list_ids({"page_size": 2}), self.expected)
+
+    def test_archive_is_read_only_when_needed(self):
+        def archive_queries(params):
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(self.list_url, params)
+            table = TransactionArchive._meta.db_table
+            return [q["sql"] for q in queries.captured_queries if table in q["sql"]]
+
+        # 첫 페이지가 최근 거래로 찼으면 보관 거래는 가장 최근 일시(MAX)만 확인
+        self.assertEqual(len(archive_queries({"page_size": 1})), 1)
+        # 조회 기간이 보관 거래보다 나중이면 보관 거래를 읽지 않음
+        start_date = timezone.localdate() - timedelta(days=10)
+        self.assertEqual(len(archive_queries({"start_date": start_date})), 1)
+        self.assertEqual(len(archive_queries({"page_size": 3})), 2)
+
+    def test_export_includes_archived_transactions(self):
+        response = self.client.get(
+            reverse("transactions:transaction-export"), {"export_format": "ndjson"}
+        )
+        content = b"".join(response.streaming_content).decode()
+        records = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([record["id"] for record in records], self.expected)
+
+    def test_archived_transactions_cannot_be_modified(self):
+        url = reverse(
+            "transactions:transaction-detail", kwargs={"pk": self.expected[-1]}
+        )
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_404_NOT_FOUND)
+
+
+@skipUnless(connection.vendor == "postgresql", "파티션 테이블은 PostgreSQL 전용")
+class TransactionPartitionTestCase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="partition@example.com", password="pw")
+        account = Account.objects.create(user=user, account_number="PARTITION")
+        self.transaction = Transaction.objects.create(
+            account=account,
+            amount=Decimal("1000.00"),
+            balance_after=Decimal("1000.00"),
+            transaction_type="ATM",
+            io_type="DEPOSIT",
+        )
+        self.current = month_start(timezone.localdate())
+        # 테스트 트랜잭션 안에서 쌓인 외래 키 검사를 끝내야 파티션을 붙이거나 뗄 수 있음
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+    def move_to(self, month):
+        start, _ = partition_bounds(month)
+        Transaction.objects.filter(pk=self.transaction.pk).update(
+            transaction_date=start
+        )
+
+    def stored_partition(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT tableoid::regclass::text FROM transactions_transaction "
+                "WHERE id = %s",
+                [self.transaction.pk],
+            )
+            return cursor.fetchone()[0]
+
+    def test_transactions_are_stored_in_month_partition(self):
+        self.assertEqual(self.stored_partition(), partition_name(self.current))
+        # 다른 달로 옮기면 해당 파티션으로 이동
+        self.move_to(add_months(self.current, 1))
+        self.assertEqual(
+            self.stored_partition(), partition_name(add_months(self.current, 1))
+        )
+
+    def test_create_future_partitions(self):
+        future = add_months(self.current, 12)
+        self.move_to(future)
+        self.assertEqual(self.stored_partition(), DEFAULT_PARTITION)
+
+        call_command(
+            "manage_transaction_partitions", months_ahead=12, stdout=StringIO()
+        )
+        months = list(list_partitions())
+        for offset in range(13):
+            self.assertIn(add_months(self.current, offset), months)
+        # 기본 파티션에 있던 거래는 새 파티션으로 옮겨짐
+        self.assertEqual(self.stored_partition(), partition_name(future))
+        self.assertTrue(Transaction.objects.filter(pk=self.transaction.pk).exists())
+
+    def test_detach_old_partitions(self):
+        old = add_months(self.current, -6)
+        self.move_to(old)
+        self.assertTrue(create_partition(old))
+        self.assertFalse(create_partition(old))
+
+        call_command("manage_transaction_partitions", detach_after=3, stdout=StringIO())
+        self.assertNotIn(old, list_partitions())
+        self.assertIn(self.current, list_partitions())
+        self.assertFalse(Transaction.objects.filter(pk=self.transaction.pk).exists())
+        # 떼어 내기 전에 보관 테이블로 옮겨 거래 내역에서 사라지지 않음
+        self.assertTrue(
+            TransactionArchive.objects.filter(pk=self.transaction.pk).exists()
+        )
+
+
+class ReconcileLedgersTestCase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="ledger@example.com", password="pw")
+        self.account = Account.objects.create(
+            user=user, account_number="LG-1", balance=Decimal("700.00")
+        )
+        self.empty = Account.objects.create(user=user, account_number="LG-2")
+        # 보관 거래(입금 1000) 다음에 거래 내역 테이블의 출금 200, 출금 100
+        now = timezone.now()
+        TransactionArchive.objects.create(
+            id=10**9,
+            account=self.account,
+            amount=Decimal("1000.00"),
+            balance_after=Decimal("1000.00"),
+            io_type="DEPOSIT",
+            transaction_type="ATM",
+            transaction_date=now - timedelta(days=1000),
+            transaction_updated=now,
+        )
+        self.transactions = [
+            Transaction.objects.create(
+                account=self.account,
+                amount=Decimal(amount),
+                balance_after=Decimal(balance_after),
+                io_type="WITHDRAW",
+                transaction_type="CARD",
+            )
+            for amount, balance_after in [("200.00", "800.00"), ("100.00", "700.00")]
+        ]
+
+    def reconcile(self, *args):
+        out = StringIO()
+        call_command("reconcile_ledgers", *args, chunk_size=1, stdout=out)
+        return out.getvalue()
+
+    def test_consistent_ledgers_have_no_drift(self):
+        self.assertIn("어긋난 계좌 0개를 찾았습니다.", self.reconcile())
+
+    def test_reports_and_repairs_drift(self):
+        Transaction.objects.filter(pk=self.transactions[0].pk).update(
+            balance_after=Decimal("1.00")
+        )
+        Account.objects.filter(pk=self.empty.pk).update(balance=Decimal("5.00"))
+
+        output = self.reconcile()
+        self.assertIn(f"계좌 {self.account.id}: 잔액 700.00 (거래 합계 700.00)", output)
+        self.assertIn(f"계좌 {self.empty.id}: 잔액 5.00 (거래 합계 0)", output)
+        self.assertIn("어긋난 계좌 2개를 찾았습니다.", output)
+        # 검사만 하면 아무것도 바꾸지 않음
+        self.transactions[0].refresh_from_db()
+        self.assertEqual(self.transactions[0].balance_after, Decimal("1.00"))
+
+        self.assertIn("어긋난 계좌 2개를 고쳤습니다.", self.reconcile("--repair"))
+        self.transactions[0].refresh_from_db()
+        self.assertEqual(self.transactions[0].balance_after, Decimal("800.00"))
+        self.empty.refresh_from_db()
+        self.assertEqual(self.empty.balance, Decimal("0.00"))
+        self.assertIn("어긋난 계좌 0개를 찾았습니다.", self.reconcile())
+
+    def test_repairs_archived_rows_and_selected_accounts_only(self):
+        TransactionArchive.objects.update(balance_after=Decimal("0.00"))
+        Account.objects.filter(pk=self.empty.pk).update(balance=Decimal("5.00"))
+
+        output = self.reconcile("--repair", "--account", str(self.account.id))
+        self.assertIn("어긋난 계좌 1개를 고쳤습니다.", output)
+        self.assertEqual(
+            TransactionArchive.objects.get().balance_after, Decimal("1000.00")
+        )
+        self.empty.refresh_from_db()
+        self.assertEqual(self.empty.balance, Decimal("5.00"))
+
+
+# 워커 프로세스는 별도 DB 연결을 쓰므로 커밋된 데이터만 보임 (TransactionTestCase 사용)
+class ReconcileLedgersWorkersTestCase(TransactionTestCase):
+    def setUp(self):
+        user = User.objects.create_user(email="workers@example.com", password="pw")
+        self.accounts = [
+            Account.objects.create(
+                user=user, account_number=f"LW-{i}", balance=Decimal("100.00")
+            )
+            for i in range(4)
+        ]
+        for account in self.accounts:
+            Transaction.objects.create(
+                account=account,
+                amount=Decimal("100.00"),
+                balance_after=Decimal("100.00"),
+                io_type="DEPOSIT",
+                transaction_type="ATM",
+            )
+
+    def test_workers_report_and_repair_drift_in_account_order(self):
+        self.assertEqual(list(reconcile_ledgers(chunk_size=1, workers=2)), [])
+
+        drifted = self.accounts[2]
+        Account.objects.filter(pk=drifted.pk).update(balance=Decimal("90.00"))
+        rows = list(reconcile_ledgers(chunk_size=1, workers=2, repair=True))
+        self.assertEqual([row["account_id"] for row in rows], [drifted.pk])
+        self.assertEqual(rows[0]["expected_balance"], Decimal("100.00"))
+
+        drifted.refresh_from_db()
+        self.assertEqual(drifted.balance, Decimal("100.00"))
+        self.assertEqual(list(reconcile_ledgers(chunk_size=1, workers=2)), [])
+
+
+@skipUnless(connection.vendor == "postgresql", "행 잠금 동시성 검증은 PostgreSQL 전용")
+class TransactionConcurrencyTestCase(TransactionTestCase):
+    """동시에 여러 요청이 같은 계좌의 잔액을 변경해도 갱신 손실/초과 출금이 없는지 확인"""
+
+    WRITERS = 64
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="concurrency@example.com", password="pw"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="CONCURRENCY-1"
+        )
+        self.create_url = reverse("transactions:transaction-create")
+
+    def run_concurrently(self, payload, headers=None):
+        barrier = threading.Barrier(self.WRITERS)
+        status_codes = []
+
+        def writer():
+            client = APIClient()
+            client.force_authenticate(user=self.user)
+            try:
+                barrier.wait()  # 모든 스레드가 동시에 요청을 보내도록 대기
+                response = client.post(
+                    self.create_url, payload, format="json", headers=headers
+                )
+                status_codes.append(response.status_code)
+            finally:
+                connection.close()  # 스레드별 DB 커넥션 정리
+
+        threads = [threading.Thread(target=writer) for _ in range(self.WRITERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return status_codes
+
+    def test_concurrent_deposits_do_not_lose_updates(self):
+        status_codes = self.run_concurrently(
+            {
+                "account": self.account.id,
+                "amount": "10.00",
+                "io_type": "DEPOSIT",
+                "transaction_type": "ATM",
+            }
+        )
+        self.assertEqual(status_codes.count(status.HTTP_201_CREATED), self.WRITERS)
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("10.00") * self.WRITERS)
+        # 각 거래의 거래 후 잔액은 10, 20, ..., 640 으로 빠짐없이 한 번씩 나타나야 함
+        balances = sorted(
+            Transaction.objects.filter(account=self.account).values_list(
+                "balance_after", flat=True
+            )
+        )
+        self.assertEqual(
+            balances, [Decimal("10.00") * i for i in range(1, self.WRITERS + 1)]
+        )
+
+    def test_concurrent_withdrawals_do_not_overdraw(self):
+        Account.objects.filter(pk=self.account.pk).update(balance=Decimal("320.00"))
+        status_codes = self.run_concurrently(
+            {
+                "account": self.account.id,
+                "amount": "10.00",
+                "io_type": "WITHDRAW",
+                "transaction_type": "ATM",
+            }
+        )
+        # 잔액 320 으로는 10원 출금 32건만 성공해야 함
+        self.assertEqual(status_codes.count(status.HTTP_201_CREATED), 32)
+        self.assertEqual(status_codes.count(status.HTTP_400_BAD_REQUEST), 32)
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("0.00"))
+        self.assertEqual(Transaction.objects.filter(account=self.account).count(), 32)
+
+    def test_concurrent_retries_with_same_idempotency_key(self):
+        status_codes = self.run_concurrently(
+            {
+                "account": self.account.id,
+                "amount": "10.00",
+                "io_type": "DEPOSIT",
+                "transaction_type": "ATM",
+            },
+            headers={"Idempotency-Key": "concurrent-retry"},
+        )
+        # 모든 재시도가 같은 응답을 받지만 거래는 한 건만 생성되어야 함
+        self.assertEqual(status_codes.count(status.HTTP_201_CREATED), self.WRITERS)
+        self.assertEqual(Transaction.objects.filter(account=self.account).count(), 1)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("10.00"))
@@ -1,15 +1,28 @@
 from django.urls import path
 
+from apps.common.views import async_read_view
+
 from .views import (
+    TransactionAsyncView,
+    TransactionBulkCreateView,
     TransactionCreateView,
+    TransactionExportView,
     TransactionHistoryDetailView,
+    TransactionSummaryView,
     TransactionView,
 )
 
 app_name = "transactions"
 urlpatterns = [
-    path("", TransactionView.as_view(), name="transaction-list"),
+    path(
+        "",
+        async_read_view(TransactionAsyncView, TransactionView),
+        name="transaction-list",
+    ),
     path("create/", TransactionCreateView.as_view(), name="transaction-create"),
+    path("bulk/", TransactionBulkCreateView.as_view(), name="transaction-bulk-create"),
+    path("export/", TransactionExportView.as_view(), name="transaction-export"),
+    path("summary/", TransactionSummaryView.as_view(), name="transaction-summary"),
     path(
         "<int:pk>/", TransactionHistoryDetailView.as_view(), name="transaction-detail"
     ),
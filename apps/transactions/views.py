@@ -1,68 +1,237 @@
+from copy import copy
 from decimal import Decimal
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth, TruncYear
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.cache import auser_data_etag, bump_user_version, user_data_etag
 from apps.accounts.models import Account
-from apps.transactions.models import Transaction
+from apps.common.views import AsyncAPIView
+from apps.transactions.archive import aarchive_horizon, archive_horizon
+from apps.transactions.balances import (
+    keeps_later_balances,
+    shift_later_balances,
+    signed_amount,
+)
+from apps.transactions.exports import (
+    EXPORT_FIELDS,
+    EXPORT_POSITION,
+    iter_csv,
+    iter_ndjson,
+)
+from apps.transactions.filters import (
+    TransactionFilterSerializer,
+    TransactionSummaryFilterSerializer,
+)
+from apps.transactions.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    get_idempotency_key,
+    get_stored_response,
+    request_fingerprint,
+    store_response,
+)
+from apps.transactions.models import (
+    Transaction,
+    TransactionArchive,
+    TransactionDailySummary,
+)
+from apps.transactions.pagination import TransactionCursorPagination, iter_merged
 from apps.transactions.serializers import (
+    TransactionHistoryListSerializer,
     TransactionHistorySerializer,
+    TransactionsBulkCreateSerializer,
     TransactionsCreateSerializer,
+    TransactionSummarySerializer,
     TransactionsUpdateSerializer,
 )
+from apps.transactions.summaries import apply_summary_changes
+from config.db_routers import replica_reads
+
+
+def get_user_account_ids(user):
+    # 서브쿼리 대신 id 목록을 넘겨야 플래너가 (account_id, transaction_date) 인덱스를 그대로 탈 수 있음
+    return list(Account.objects.filter(user=user).values_list("id", flat=True))
+
+
+async def aget_user_account_ids(user):
+    """get_user_account_ids 의 async 버전"""
+    return [
+        account_id
+        async for account_id in Account.objects.filter(user=user).values_list(
+            "id", flat=True
+        )
+    ]
+
+
+def get_history_queryset(filters, account_ids, model=Transaction):
+    """
+    거래 내역(model: Transaction 또는 TransactionArchive) 조회 queryset - 정렬은 페이지네이터가 담당
+    모델 인스턴스 대신 values()로 필요한 컬럼만 읽어 읽기 전용 fast path 로 직렬화
+    """
+    return filters.filter_queryset(
+        model.objects.filter(account_id__in=filters.filter_account_ids(account_ids))
+    ).values(*TransactionHistoryListSerializer.value_fields())
+
+
+def get_history_parts(filters, account_ids, model=Transaction):
+    """
+    계좌별 거래 내역 queryset 목록
+    페이지네이터가 계좌마다 인덱스 순서로 한 페이지만 읽어 UNION ALL 로 합친다.
+    """
+    account_ids = filters.filter_account_ids(account_ids)
+    if not account_ids:
+        # 조회할 계좌가 없으면 쿼리 없이 빈 결과가 되는 queryset 하나
+        return [get_history_queryset(filters, [], model)]
+    return [
+        get_history_queryset(filters, [account_id], model) for account_id in account_ids
+    ]
+
+
+def get_history_sources(filters, account_ids, horizon):
+    """
+    거래 내역 페이지네이션 대상 (계좌별 queryset 목록, 가장 최근 거래 일시) 목록
+    보관 거래는 조회 기간이 보관된 가장 최근 거래 일시(horizon)에 걸칠 때만 포함
+    """
+    sources = [(get_history_parts(filters, account_ids), None)]
+    if filters.reaches(horizon):
+        archived = get_history_parts(filters, account_ids, TransactionArchive)
+        sources.append((archived, horizon))
+    return sources
 
 
 class TransactionView(APIView):
     @extend_schema(
         summary="현재 로그인된 사용자의 모든 계좌 거래 내역 조회",
-        description="인증된 사용자가 소유한 모든 계좌의 거래 내역을 최근 거래일 기준으로 내림차순으로 조회합니다.",
+        description=(
+            "인증된 사용자가 소유한 모든 계좌의 거래 내역을 최근 거래일 기준으로 내림차순으로 조회합니다. "
+            "기간, 입출금 타입, 거래 타입, 금액 범위, 계좌로 필터링할 수 있으며 "
+            "응답의 next 링크(cursor)를 따라가며 페이지 단위로 조회합니다."
+        ),
+        parameters=[
+            TransactionFilterSerializer,
+            OpenApiParameter(
+                "cursor", str, description="이전 응답의 next 링크에 포함된 커서"
+            ),
+            OpenApiParameter(
+                "page_size",
+                int,
+                description=f"페이지 크기 (기본 {TransactionCursorPagination.page_size}, "
+                f"최대 {TransactionCursorPagination.max_page_size})",
+            ),
+        ],
         responses={
             200: TransactionHistorySerializer(many=True),
+            400: {"description": "잘못된 필터 조건 (Bad Request)"},
             401: {"description": "인증 정보 없음 (Unauthorized)"},
             404: {"description": "사용자 계좌를 찾을 수 없음"},
         },
         tags=["transaction"],
     )
+    # 사용자 데이터 버전으로 만든 ETag 가 If-None-Match 와 같으면 조회/직렬화 없이 304 응답
+    @method_decorator(condition(etag_func=user_data_etag))
+    @replica_reads
     # 현재 로그인 된 사용자 거래 내역 조회
     def get(self, request):
-        # 사용자와 연결된 계좌 가져오기
-        accounts = Account.objects.filter(user=request.user)
-        if not accounts.exists():
+        # 쿼리 파라미터로 전달된 필터 조건 검증
+        filters = TransactionFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        # 사용자와 연결된 계좌 id 가져오기
+        account_ids = get_user_account_ids(request.user)
+        if not account_ids:
             return Response(
                 {"error": "사용자 계좌를 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # 해당 계좌의 모든 거래 내역 조회 - 최근 거래 시간 순으로 정렬
-        # account__in 은 account 필드 값이 특정 집합에 포함되는지 확인
-        transactions = Transaction.objects.filter(account__in=accounts).order_by(
-            "-transaction_date"
-        )  # 내림차순
-        serializer = TransactionHistorySerializer(
-            transactions, many=True
-        )  # 거래 내역 직렬화
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 해당 계좌의 거래 내역 조회 - 최근 거래 시간 순으로 정렬 (필요하면 보관 거래와 합침)
+        sources = get_history_sources(filters, account_ids, archive_horizon())
+        paginator = TransactionCursorPagination()
+        page = paginator.paginate_querysets(sources, request, view=self)
+        serializer = TransactionHistoryListSerializer(page)  # 거래 내역 직렬화
+        return paginator.get_paginated_response(serializer.data)
+
+
+class TransactionAsyncView(AsyncAPIView):
+    """TransactionView.get 의 async 버전 (ASGI 에서 GET 요청 처리)"""
+
+    async def get_etag(self, request):
+        return await auser_data_etag(request)
+
+    @replica_reads
+    async def get(self, request):
+        filters = TransactionFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        account_ids = await aget_user_account_ids(request.user)
+        if not account_ids:
+            return Response(
+                {"error": "사용자 계좌를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        sources = get_history_sources(filters, account_ids, await aarchive_horizon())
+        paginator = TransactionCursorPagination()
+        page = await paginator.apaginate_querysets(sources, request, view=self)
+        serializer = TransactionHistoryListSerializer(page)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class TransactionCreateView(APIView):
     @extend_schema(
         summary="새로운 거래 내역 생성 및 계좌 잔액 업데이트",
-        description="입금 또는 출금 거래 내역을 생성하고, 해당 계좌의 잔액을 업데이트합니다.",
+        description=(
+            "입금 또는 출금 거래 내역을 생성하고, 해당 계좌의 잔액을 업데이트합니다. "
+            "Idempotency-Key 헤더를 보내면 같은 키로 재시도한 요청은 거래를 다시 만들지 않고 "
+            "처음 응답을 그대로 돌려받습니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                IDEMPOTENCY_KEY_HEADER,
+                str,
+                location=OpenApiParameter.HEADER,
+                description="재시도 시 중복 거래를 막기 위한 클라이언트 생성 고유 키",
+            ),
+        ],
         request=TransactionsCreateSerializer,
         responses={
             201: TransactionsCreateSerializer,
             400: {"description": "잘못된 요청 데이터 (Bad Request)"},
             401: {"description": "인증 정보 없음 (Unauthorized)"},
             403: {"description": "접근 권한 없음 (Forbidden)"},
+            422: {"description": "같은 Idempotency-Key로 다른 요청을 보냄"},
         },
         tags=["transaction"],
     )
     # 거래 내역 생성
     def post(self, request):
+        # 멱등성 키가 있으면 이미 처리된 요청인지 먼저 확인 (처리된 요청이면 DB 쓰기 없이 반환)
+        idempotency_key = get_idempotency_key(request)
+        if idempotency_key is not None:
+            if len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+                return Response(
+                    {"error": "Idempotency-Key가 너무 깁니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            fingerprint = request_fingerprint(request)
+            stored_response = get_stored_response(
+                request.user, idempotency_key, fingerprint
+            )
+            if stored_response is not None:
+                return stored_response
+
         account_id = request.data.get("account")
         io_type = request.data.get("io_type")
         transaction_type = request.data.get("transaction_type")
@@ -90,53 +259,346 @@ class TransactionCreateView(APIView):
         ]:
             return Response({"error": "올바른 거래 종류를 입력해주세요"})
 
-        # 사용자의 계좌가 맞는지 확인
         try:
-            account = Account.objects.get(id=account_id, user=request.user)
-        except Account.DoesNotExist:
-            # 해당 ID의 계좌가 없거나 사용자의 소유가 아닐 경우
+            transaction_amount = Decimal(str(transaction_amount))
+        except (ArithmeticError, ValueError, TypeError):
+            # Decimal("abc") 는 InvalidOperation(ArithmeticError)을 발생시킴
             return Response(
-                {"error": "유효하지 않은 계좌 ID이거나, 접근 권한이 없습니다."},
-                status=status.HTTP_403_FORBIDDEN,
+                {"error": "잘못된 거래 금액 형식입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # 입력값 검증은 DB 조회 없이 먼저 끝내고, 트랜잭션 안에서는 계좌 잠금 조회 1번, 거래 INSERT 1번,
+        # 계좌 UPDATE 1번(과 일일 집계 반영)만 실행
+        serializer = TransactionsCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
         # Django의 Atomic Transaction을 사용하여 잔액 업데이트와 거래 내역 생성을 원자적으로 처리
+        try:
+            with transaction.atomic():
+                # 사용자의 계좌가 맞는지 확인하면서 계좌 행을 잠금 (SELECT ... FOR UPDATE)
+                # 잠금을 잡은 뒤에 잔액을 읽어야 동시 입출금 시 갱신 손실이나 초과 출금이 생기지 않음
+                try:
+                    account = Account.objects.select_for_update().get(
+                        id=account_id, user=request.user
+                    )
+                except Account.DoesNotExist:
+                    # 해당 ID의 계좌가 없거나 사용자의 소유가 아닐 경우
+                    return Response(
+                        {"error": "유효하지 않은 계좌 ID이거나, 접근 권한이 없습니다."},
+                        status=status.HTTP_403_FORBIDDEN,
+                    )
+
+                current_balance = account.balance
+                new_balance = current_balance
+
+                if io_type == "DEPOSIT":
+                    new_balance = current_balance + transaction_amount
+                elif io_type == "WITHDRAW":
+                    if transaction_amount > current_balance:
+                        return Response(
+                            {"error": "잔액이 부족합니다."},
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+                    new_balance = current_balance - transaction_amount
+
+                # 거래 내역 생성 - 잠근 계좌 객체를 그대로 연결하고 거래 후 잔액은 뷰에서 계산하여 전달
+                serializer.save(account=account, balance_after=new_balance)
+                apply_summary_changes(added=[serializer.instance])  # 일일 집계 반영
+
+                # 계좌 잔액 업데이트 - 잔액과 수정일시 컬럼만 UPDATE
+                account.balance = new_balance
+                account.save(update_fields=["balance", "updated_at"])
+                # 커밋 후 계좌 목록 캐시/ETag 무효화
+                bump_user_version(request.user.id)
+
+                response = Response(serializer.data, status=status.HTTP_201_CREATED)
+                if idempotency_key is not None:
+                    # 거래와 같은 트랜잭션에서 응답을 저장해야 둘 중 하나만 남는 일이 없음
+                    store_response(request.user, idempotency_key, fingerprint, response)
+        except IntegrityError:
+            # 같은 키로 동시에 들어온 요청이 먼저 커밋된 경우 - 이 요청은 롤백하고 그 결과를 반환
+            if idempotency_key is None:
+                raise
+            stored_response = get_stored_response(
+                request.user, idempotency_key, fingerprint
+            )
+            if stored_response is None:
+                raise
+            return stored_response
+
+        return response
+
+
+class TransactionBulkCreateView(APIView):
+    # 한 번의 요청으로 받을 수 있는 최대 거래 건수
+    max_batch_size = 5000
+
+    @extend_schema(
+        summary="거래 내역 일괄 생성 및 계좌 잔액 일괄 업데이트",
+        description=(
+            "여러 건의 입금/출금 거래를 한 번에 생성합니다. 항목은 요청 순서대로 적용되며, "
+            "계좌별 순변동액을 계좌당 한 번의 UPDATE로 반영합니다. "
+            "기본적으로 한 건이라도 실패하면 전체를 거부하고, allow_partial=true 이면 "
+            "유효한 항목만 원자적으로 반영한 뒤 실패 항목의 오류를 함께 반환합니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                "allow_partial", bool, description="유효한 항목만 부분 반영할지 여부"
+            ),
+        ],
+        request=TransactionsBulkCreateSerializer(many=True),
+        responses={
+            201: TransactionHistorySerializer(many=True),
+            400: {"description": "잘못된 요청 데이터 (Bad Request), 항목별 오류 포함"},
+            401: {"description": "인증 정보 없음 (Unauthorized)"},
+        },
+        tags=["transaction"],
+    )
+    # 거래 내역 일괄 생성
+    def post(self, request):
+        allow_partial = request.query_params.get("allow_partial") in ("true", "1")
+
+        serializer = TransactionsBulkCreateSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.max_batch_size,
+        )
+        if not serializer.is_valid():
+            # 리스트가 아니거나 비어있는 등 배치 전체에 대한 오류
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        items = serializer.validated_data
+        errors = dict(serializer.item_errors)  # 항목별 검증 오류 {인덱스: 오류}
+
         with transaction.atomic():
-            current_balance = account.balance
-            new_balance = current_balance
+            # 배치에 포함된 사용자 소유 계좌를 한 번에 잠금 (id 순으로 잠가 교착 상태 방지)
+            account_ids = {item["account_id"] for item in items if item is not None}
+            accounts = {
+                account.id: account
+                for account in Account.objects.select_for_update()
+                .filter(id__in=account_ids, user=request.user)
+                .order_by("id")
+            }
+            balances = {
+                account_id: account.balance for account_id, account in accounts.items()
+            }
+
+            # 요청 순서대로 잔액을 누적하며 거래별 거래 후 잔액 계산
+            new_transactions = []
+            for index, item in enumerate(items):
+                if item is None:
+                    continue
+                if item["account_id"] not in accounts:
+                    errors[index] = {
+                        "account": [
+                            "유효하지 않은 계좌 ID이거나, 접근 권한이 없습니다."
+                        ]
+                    }
+                    continue
 
-            try:
-                transaction_amount = Decimal(str(transaction_amount))
-            except (ValueError, TypeError):
+                balance = balances[item["account_id"]]
+                if item["io_type"] == "DEPOSIT":
+                    balance += item["amount"]
+                elif item["amount"] > balance:
+                    errors[index] = {"amount": ["잔액이 부족합니다."]}
+                    continue
+                else:
+                    balance -= item["amount"]
+
+                balances[item["account_id"]] = balance
+                new_transactions.append(Transaction(balance_after=balance, **item))
+
+            error_list = [
+                {"index": index, "errors": errors[index]} for index in sorted(errors)
+            ]
+            if not new_transactions or (errors and not allow_partial):
+                # 아직 아무것도 쓰지 않았으므로 그대로 반환하면 배치 전체가 거부됨
                 return Response(
-                    {"error": "잘못된 거래 금액 형식입니다."},
-                    status=status.HTTP_400_BAD_REQUEST,
+                    {"errors": error_list}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            if io_type == "DEPOSIT":
-                new_balance = current_balance + transaction_amount
-            elif io_type == "WITHDRAW":
-                if transaction_amount > current_balance:
-                    return Response(
-                        {"error": "잔액이 부족합니다."},
-                        status=status.HTTP_400_BAD_REQUEST,
+            created = Transaction.objects.bulk_create(new_transactions, batch_size=1000)
+            apply_summary_changes(added=created)  # 일일 집계 반영
+
+            # 계좌별 순변동액을 계좌당 한 번의 UPDATE로 반영
+            now = timezone.now()
+            for account_id, account in accounts.items():
+                delta = balances[account_id] - account.balance
+                if delta:
+                    Account.objects.filter(pk=account_id).update(
+                        balance=F("balance") + delta, updated_at=now
                     )
-                new_balance = current_balance - transaction_amount
+            if created:
+                # 커밋 후 계좌 목록 캐시/ETag 무효화
+                bump_user_version(request.user.id)
 
-            # 시리얼라이저를 통한 거래 내역 생성
-            # post_transaction_amount는 뷰에서 계산하여 전달
-            serializer = TransactionsCreateSerializer(data=request.data)
-            if serializer.is_valid():
-                # 유효한 데이터라면 저장
-                serializer.save(account=account, balance_after=new_balance)
+        return Response(
+            {
+                "created": TransactionHistorySerializer(created, many=True).data,
+                "errors": error_list,
+            },
+            status=status.HTTP_201_CREATED,
+        )
 
-                # 계좌 잔액 업데이트
-                account.balance = new_balance
-                account.save()
 
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            else:
-                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+class TransactionSummaryView(APIView):
+    @extend_schema(
+        summary="월별/연도별 입출금 통계 조회",
+        description=(
+            "사용자 계좌의 입금/출금 건수와 합계를 월별 또는 연도별로 조회합니다. "
+            "거래 내역 전체가 아닌 일일 집계 테이블을 합산하여 계산합니다."
+        ),
+        parameters=[TransactionSummaryFilterSerializer],
+        responses={
+            200: TransactionSummarySerializer(many=True),
+            400: {"description": "잘못된 조회 조건 (Bad Request)"},
+            401: {"description": "인증 정보 없음 (Unauthorized)"},
+        },
+        tags=["transaction"],
+    )
+    @replica_reads
+    # 월별/연도별 거래 통계 조회
+    def get(self, request):
+        filters = TransactionSummaryFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        account_ids = filters.filter_account_ids(get_user_account_ids(request.user))
+        trunc = TruncMonth if filters.validated_data["period"] == "month" else TruncYear
+        deposit, withdraw = Q(io_type="DEPOSIT"), Q(io_type="WITHDRAW")
+        zero = Value(Decimal("0.00"))
+        amount_field = DecimalField(max_digits=18, decimal_places=2)
+
+        # 기간 버킷마다 하루치 집계 행만 합산 (버킷당 최대 366행)
+        summaries = (
+            filters.filter_queryset(
+                TransactionDailySummary.objects.filter(account_id__in=account_ids)
+            )
+            .annotate(period=trunc("day"))
+            .values("period")
+            .annotate(
+                deposit_count=Coalesce(Sum("count", filter=deposit), 0),
+                deposit_amount=Coalesce(
+                    Sum("total_amount", filter=deposit), zero, output_field=amount_field
+                ),
+                withdraw_count=Coalesce(Sum("count", filter=withdraw), 0),
+                withdraw_amount=Coalesce(
+                    Sum("total_amount", filter=withdraw),
+                    zero,
+                    output_field=amount_field,
+                ),
+            )
+            .order_by("period")
+        )
+        serializer = TransactionSummarySerializer(summaries, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class TransactionExportView(APIView):
+    # 서버 측 커서로 한 번에 읽어올 행 수
+    chunk_size = 2000
+
+    @extend_schema(
+        summary="거래 내역 내보내기 (CSV / NDJSON 스트리밍)",
+        description=(
+            "거래 내역 조회와 같은 필터 조건으로 전체 거래 내역을 CSV 또는 NDJSON 파일로 내려받습니다. "
+            "서버 측 커서로 일정 크기씩 읽어 바로 전송하므로 기간이 길어도 메모리 사용량이 일정합니다."
+        ),
+        parameters=[
+            TransactionFilterSerializer,
+            OpenApiParameter(
+                "export_format",
+                str,
+                enum=["csv", "ndjson"],
+                description="내보내기 형식 (기본 csv)",
+            ),
+        ],
+        responses={
+            (200, "text/csv"): OpenApiTypes.STR,
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            400: {"description": "잘못된 필터 조건 (Bad Request)"},
+            401: {"description": "인증 정보 없음 (Unauthorized)"},
+            404: {"description": "사용자 계좌를 찾을 수 없음"},
+        },
+        tags=["transaction"],
+    )
+    @replica_reads
+    # 거래 내역 내보내기
+    def get(self, request):
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in ("csv", "ndjson"):
+            return Response(
+                {"error": "내보내기 형식은 csv 또는 ndjson 이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        filters = TransactionFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        account_ids = get_user_account_ids(request.user)
+        if not account_ids:
+            return Response(
+                {"error": "사용자 계좌를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        model_list = [Transaction]
+        if filters.reaches(archive_horizon()):
+            model_list.append(TransactionArchive)  # 조회 기간이 보관 거래에 걸침
+        # 모델 인스턴스 대신 튜플로 읽고, 서버 측 커서로 chunk_size 만큼씩 가져옴
+        # 응답을 보내는 동안(뷰가 끝난 뒤) 조회하므로 지금 라우팅된 DB(복제본)로 고정
+        row_iterators = []
+        for model in model_list:
+            transactions = filters.filter_queryset(
+                model.objects.filter(
+                    account_id__in=filters.filter_account_ids(account_ids)
+                )
+            )
+            row_iterators.append(
+                transactions.using(transactions.db)
+                .order_by("-transaction_date", "-id")
+                .values_list(*EXPORT_FIELDS)
+                .iterator(chunk_size=self.chunk_size)
+            )
+        if len(row_iterators) == 1:
+            rows = row_iterators[0]
+        else:
+            rows = iter_merged(row_iterators, key=EXPORT_POSITION)
+        if export_format == "csv":
+            content, content_type = iter_csv(rows), "text/csv; charset=utf-8"
+        else:
+            content, content_type = iter_ndjson(rows), "application/x-ndjson"
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="transactions.{export_format}"'
+        )
+        return response
+
+    def perform_content_negotiation(self, request, force=False):
+        # Accept: text/csv 등으로 요청해도 406 대신 스트리밍 응답을 돌려주도록 강제
+        return super().perform_content_negotiation(request, force=True)
+
+
+def lock_account_transaction(user, pk):
+    """
+    user 의 거래 pk 와 그 계좌를 잠그고 (계좌, 거래)를 반환한다. 없으면 404.
+
+    거래 생성과 같이 계좌 행을 먼저 잠가 같은 계좌의 쓰기를 한 줄로 세운다.
+    거래 행을 먼저 잠그면 이후 거래들을 UPDATE 하는 다른 수정 요청과 서로 기다리며 교착될 수 있다.
+    """
+    # transaction -FK> account -FK> user, 조인한 거래 행은 잠그지 않도록 계좌 테이블만 잠금
+    account = get_object_or_404(
+        Account.objects.select_for_update(of=("self",)),
+        user=user,
+        transactions__pk=pk,
+    )
+    # 보관 명령이 같은 거래를 옮기는 중이면 끝날 때까지 기다렸다가 404
+    transaction_obj = get_object_or_404(
+        Transaction.objects.select_for_update(), pk=pk, account=account
+    )
+    return account, transaction_obj
 
 
 class TransactionHistoryDetailView(APIView):
@@ -146,7 +608,7 @@ class TransactionHistoryDetailView(APIView):
         request=TransactionsUpdateSerializer(partial=True),  # partial=True 명시
         responses={
             200: TransactionsUpdateSerializer,
-            400: {"description": "잘못된 요청 데이터 (Bad Request)"},
+            400: {"description": "잘못된 요청 데이터 또는 잔액 부족 (Bad Request)"},
             401: {"description": "인증 정보 없음 (Unauthorized)"},
             404: {"description": "거래 내역을 찾을 수 없음"},
         },
@@ -154,30 +616,52 @@ class TransactionHistoryDetailView(APIView):
     )
     # 특정 거래 내역 수정
     def put(self, request, pk):
-        # 거래 내역 ID로 특정 거래 내역 조회 (로그인된 사용자의 계좌와 연결된 거래만 허용)
-        transaction_obj = get_object_or_404(
-            Transaction, pk=pk, account__user=request.user
-        )
-        # account__user 는 관계 모델의 특정 필드를 지정해서 필터링하거나 값을 가져올 때 사용
-        # transaction -FK> account -FK> user
+        with transaction.atomic():
+            # 계좌를 먼저 잠그고 거래를 읽음 (account__user 로 로그인된 사용자의 거래만 허용)
+            account, transaction_obj = lock_account_transaction(request.user, pk)
 
-        # 데이터 업데이트
-        serializer = TransactionsUpdateSerializer(
-            transaction_obj, data=request.data, partial=True
-        )
-        # partial=True 는 부분 업데이트를 허용하여 요청 데이터에 포함된 필드만 업데이트 하고, 나머지는 기존값을 유지
-        # partial 옵션을 설정하지 않으면 기본값인 False 가 되어 모든 필드가 포함 되어야 유효성 검증을 통과
+            # 데이터 업데이트
+            serializer = TransactionsUpdateSerializer(
+                transaction_obj, data=request.data, partial=True
+            )
+            # partial=True 는 부분 업데이트를 허용하여 요청 데이터에 포함된 필드만 업데이트 하고, 나머지는 기존값을 유지
+            # partial 옵션을 설정하지 않으면 기본값인 False 가 되어 모든 필드가 포함 되어야 유효성 검증을 통과
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+            # 수정 전 값을 복사해 두었다가 일일 집계에서 빼고 수정 후 값을 더함
+            previous = copy(transaction_obj)
+            for field, value in serializer.validated_data.items():
+                setattr(transaction_obj, field, value)
+            # 금액/입출금 타입이 바뀐 만큼 이 거래와 이후 거래의 거래 후 잔액, 계좌 잔액이 달라짐
+            delta = signed_amount(transaction_obj) - signed_amount(previous)
+            if (
+                account.balance + delta < 0
+                or previous.balance_after + delta < 0
+                or not keeps_later_balances(previous, delta)
+            ):
+                return Response(
+                    {"error": "잔액이 부족합니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            serializer.save(balance_after=previous.balance_after + delta)
+            apply_summary_changes(added=[serializer.instance], removed=[previous])
+            if delta:
+                shift_later_balances(previous, delta)
+                account.balance += delta
+                account.save(update_fields=["balance", "updated_at"])
+            bump_user_version(request.user.id)  # 커밋 후 ETag 무효화
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
     @extend_schema(
         summary="특정 거래 내역 삭제",
         description="지정된 ID의 거래 내역을 삭제합니다. 해당 거래가 로그인된 사용자의 계좌와 연결되어 있어야 합니다.",
         responses={
             200: {"description": "성공적으로 삭제됨"},
+            400: {
+                "description": "삭제하면 계좌 잔액이나 이후 거래 후 잔액이 음수가 됨"
+            },
             401: {"description": "인증 정보 없음 (Unauthorized)"},
             404: {"description": "거래 내역을 찾을 수 없음"},
         },
@@ -185,10 +669,24 @@ class TransactionHistoryDetailView(APIView):
     )
     # 특정 거래 내역 삭제
     def delete(self, request, pk):
-        transaction_obj = get_object_or_404(
-            Transaction, pk=pk, account__user=request.user
-        )
-        transaction_obj.delete()
+        with transaction.atomic():
+            account, transaction_obj = lock_account_transaction(request.user, pk)
+            # 거래가 없어진 만큼 이후 거래의 거래 후 잔액과 계좌 잔액이 달라짐
+            delta = -signed_amount(transaction_obj)
+            if account.balance + delta < 0 or not keeps_later_balances(
+                transaction_obj, delta
+            ):
+                return Response(
+                    {"error": "잔액이 부족합니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            apply_summary_changes(removed=[transaction_obj])  # 일일 집계 반영
+            shift_later_balances(transaction_obj, delta)
+            transaction_obj.delete()
+            account.balance += delta
+            account.save(update_fields=["balance", "updated_at"])
+            bump_user_version(request.user.id)  # 커밋 후 ETag 무효화
         return Response(
             {"message": "거래 내역이 성공적으로 삭제되었습니다."},
             status=status.HTTP_200_OK,
@@ -0,0 +1,152 @@
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import DEFERRED
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+from .tokens import CachedBlacklistRefreshToken
+
+# 로그인 시 토큰에 넣는 사용자 클레임 (access 토큰에도 그대로 복사됨)
+USER_CLAIMS = ("is_active", "is_staff", "is_superuser")
+
+# 사용자 활성 상태 캐시 {user_id: (is_active, 만료 시각)} - 프로세스 단위
+_active_cache = {}
+_active_cache_lock = threading.Lock()
+ACTIVE_CACHE_MAX_SIZE = 10000
+
+
+def issue_refresh_token(user):
+    """사용자 클레임을 담은 refresh 토큰 발급 (refresh.access_token 에도 같은 클레임이 들어감)"""
+    refresh = CachedBlacklistRefreshToken.for_user(user)
+    for claim in USER_CLAIMS:
+        refresh[claim] = getattr(user, claim)
+    return refresh
+
+
+def is_user_active(user_id):
+    """
+    사용자가 존재하고 활성 상태인지 확인한다.
+    결과를 USER_ACTIVE_CACHE_TTL 초 동안 프로세스 메모리에 캐시하므로,
+    비활성화/삭제된 사용자는 최대 TTL 이 지난 뒤부터 거부된다.
+    """
+    is_active = _get_cached_active(user_id)
+    if is_active is None:
+        is_active = _cache_active(
+            user_id,
+            User.objects.filter(pk=user_id).values_list("is_active", flat=True).first(),
+        )
+    return is_active
+
+
+async def ais_user_active(user_id):
+    """is_user_active 의 async 버전"""
+    is_active = _get_cached_active(user_id)
+    if is_active is None:
+        is_active = _cache_active(
+            user_id,
+            await User.objects.filter(pk=user_id)
+            .values_list("is_active", flat=True)
+            .afirst(),
+        )
+    return is_active
+
+
+def _get_cached_active(user_id):
+    cached = _active_cache.get(user_id)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    return None
+
+
+def _cache_active(user_id, is_active):
+    is_active = bool(is_active)  # 존재하지 않는 사용자(None)는 비활성으로 취급
+    with _active_cache_lock:
+        if len(_active_cache) >= ACTIVE_CACHE_MAX_SIZE:
+            _active_cache.clear()
+        _active_cache[user_id] = (
+            is_active,
+            time.monotonic() + settings.USER_ACTIVE_CACHE_TTL,
+        )
+    return is_active
+
+
+def forget_user(user_id):
+    """사용자 활성 상태 캐시에서 제거 (이 프로세스에서는 다음 요청부터 바로 반영)"""
+    with _active_cache_lock:
+        _active_cache.pop(user_id, None)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    토큰 클레임으로 사용자 객체를 만들어 요청마다 User 를 조회하지 않는 JWT 인증
+
+    반환하는 User 는 id 와 클레임(is_active, is_staff, is_superuser)만 채워진 인스턴스로,
+    나머지 필드는 deferred 상태라 처음 접근할 때 DB 에서 읽어 온다.
+    (save() 도 불러온 필드만 UPDATE 하므로 빈 값으로 덮어쓰지 않는다)
+    클레임이 없는 이전 토큰이나 CHECK_REVOKE_TOKEN 설정 시에는 기존처럼 DB 에서 조회한다.
+    """
+
+    def get_user(self, validated_token):
+        if not self.has_user_claims(validated_token):
+            return super().get_user(validated_token)
+        user_id = self.get_user_id(validated_token)
+        if not is_user_active(user_id):
+            self.raise_user_inactive()
+        return self.build_user(user_id, validated_token)
+
+    async def aauthenticate(self, request):
+        """authenticate 의 async 버전 (async 뷰에서 사용)"""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        if not self.has_user_claims(validated_token):
+            # 클레임이 없는 이전 토큰은 기존 DB 조회 로직을 그대로 사용
+            return await sync_to_async(super().get_user)(validated_token)
+        user_id = self.get_user_id(validated_token)
+        if not await ais_user_active(user_id):
+            self.raise_user_inactive()
+        return self.build_user(user_id, validated_token)
+
+    @staticmethod
+    def has_user_claims(validated_token):
+        return not api_settings.CHECK_REVOKE_TOKEN and all(
+            claim in validated_token for claim in USER_CLAIMS
+        )
+
+    @staticmethod
+    def get_user_id(validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("토큰에 사용자 식별 정보가 없습니다.")
+
+    @staticmethod
+    def raise_user_inactive():
+        raise AuthenticationFailed(
+            "비활성화되었거나 존재하지 않는 사용자입니다.", code="user_inactive"
+        )
+
+    @staticmethod
+    def build_user(user_id, validated_token):
+        values = {api_settings.USER_ID_FIELD: user_id, "is_active": True}
+        for claim in ("is_staff", "is_superuser"):
+            values[claim] = bool(validated_token[claim])
+        fields = User._meta.concrete_fields
+        return User.from_db(
+            DEFAULT_DB_ALIAS,
+            [field.attname for field in fields],
+            [values.get(field.attname, DEFERRED) for field in fields],
+        )
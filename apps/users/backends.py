@@ -0,0 +1,57 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import make_password, verify_password
+
+from .hashers import arun_in_hashing_pool, run_in_hashing_pool
+from .models import User
+
+
+class PooledHashingModelBackend(ModelBackend):
+    """
+    비밀번호 검증/재해싱을 해싱 전용 스레드 풀에서 실행하는 ModelBackend
+
+    DB 조회/저장은 요청 스레드에서 하고 CPU 를 쓰는 해싱만 스레드 풀로 넘긴다.
+    저장된 해시가 현재 정책(PASSWORD_HASHER_POLICY)과 다르면 로그인 성공 시 새 정책으로 다시 해싱한다.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = User._default_manager.get_by_natural_key(username)
+        except User.DoesNotExist:
+            # 존재하지 않는 사용자도 해싱을 한 번 실행해 응답 시간 차이를 줄임 (ModelBackend 와 동일)
+            run_in_hashing_pool(make_password, password)
+            return None
+
+        is_correct, must_update = run_in_hashing_pool(
+            verify_password, password, user.password
+        )
+        if not (is_correct and self.user_can_authenticate(user)):
+            return None
+        if must_update:
+            user.password = run_in_hashing_pool(make_password, password)
+            user.save(update_fields=["password"])
+        return user
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = await User._default_manager.aget_by_natural_key(username)
+        except User.DoesNotExist:
+            await arun_in_hashing_pool(make_password, password)
+            return None
+
+        is_correct, must_update = await arun_in_hashing_pool(
+            verify_password, password, user.password
+        )
+        if not (is_correct and self.user_can_authenticate(user)):
+            return None
+        if must_update:
+            user.password = await arun_in_hashing_pool(make_password, password)
+            await user.asave(update_fields=["password"])
+        return user
@@ -0,0 +1,51 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+# 비밀번호 해싱 정책 - settings.PASSWORD_HASHER_POLICY 로 선택하며 비용 파라미터는 환경 변수로 조정
+# 알고리즘 이름은 Django 기본 hasher 와 같으므로 기존 해시도 그대로 검증되고,
+# 정책이나 비용 파라미터가 바뀌면 다음 로그인 때 새 설정으로 다시 해싱된다. (must_update)
+
+
+class TunedPBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    iterations = settings.PBKDF2_ITERATIONS
+
+
+class TunedScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    work_factor = settings.SCRYPT_WORK_FACTOR
+    block_size = settings.SCRYPT_BLOCK_SIZE
+    parallelism = settings.SCRYPT_PARALLELISM
+    # 필요한 메모리(128 * n * r * p)의 두 배까지 허용 - OpenSSL 기본 한도(32MB)로는 n=2**15 부터 실패
+    maxmem = 2 * 128 * work_factor * block_size * parallelism
+
+
+class TunedArgon2PasswordHasher(hashers.Argon2PasswordHasher):
+    # argon2-cffi 패키지 필요
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
+
+
+# 비밀번호 해싱 전용 스레드 풀
+# 해시 함수는 실행 중 GIL 을 놓으므로 여러 스레드에서 병렬로 실행되며,
+# 동시에 해싱하는 수를 PASSWORD_HASHING_WORKERS 개로 제한해 로그인이 몰릴 때 CPU 를 모두 점유하지 않게 한다.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    thread_name_prefix="password-hashing",
+)
+
+
+def run_in_hashing_pool(func, *args, **kwargs):
+    """해싱 전용 스레드 풀에서 func 를 실행하고 결과를 반환 (DB 를 사용하지 않는 함수만)"""
+    return _executor.submit(func, *args, **kwargs).result()
+
+
+async def arun_in_hashing_pool(func, *args, **kwargs):
+    """run_in_hashing_pool 의 async 버전 - 해싱하는 동안 이벤트 루프를 막지 않는다"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(func, *args, **kwargs)
+    )
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 발급 토큰(OutstandingToken)과 블랙리스트 토큰(BlacklistedToken)을 "
+        "일정 크기 배치로 나누어 삭제합니다. (cron 등으로 주기 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 DELETE로 지울 최대 행 수 (기본 1000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = timezone.now()
+        outstanding_deleted = blacklisted_deleted = 0
+        # 만료된 토큰은 서명 검증 단계에서 거부되므로 블랙리스트 행도 더 이상 필요 없음
+        # 한 번에 큰 DELETE를 하지 않도록 먼저 만료된 행부터 일부씩 골라 삭제
+        # (expires_at 인덱스 범위만 읽음 - users 0003 마이그레이션)
+        while True:
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by("expires_at")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            # 블랙리스트 행은 CASCADE 로 같은 배치에서 함께 삭제됨
+            _, counts = OutstandingToken.objects.filter(id__in=ids).delete()
+            outstanding_deleted += counts.get(OutstandingToken._meta.label, 0)
+            blacklisted_deleted += counts.get(BlacklistedToken._meta.label, 0)
+
+        self.stdout.write(
+            f"만료된 토큰 {outstanding_deleted}건"
+            f"(블랙리스트 {blacklisted_deleted}건)을 삭제했습니다."
+        )
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+# 만료된 발급 토큰 정리(prune_expired_tokens)용 expires_at 인덱스 (PostgreSQL 전용)
+#
+# OutstandingToken 은 simplejwt token_blacklist 앱의 모델이라 Meta.indexes 를 바꿀 수 없으므로 SQL 로 만든다.
+# 인덱스가 없으면 배치마다 만료 토큰을 찾으려고 기본 키 순서로 테이블을 읽고, 마지막 배치는 테이블 전체를 읽는다.
+# 토큰 발급이 계속되는 테이블이므로 쓰기를 막지 않도록 CONCURRENTLY 로 만든다. (트랜잭션 밖에서 실행)
+
+INDEX = "token_outstanding_expires_at_idx"
+TABLE = "token_blacklist_outstandingtoken"
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("token_blacklist", "0012_alter_outstandingtoken_user"),
+        ("users", "0002_user_is_staff"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{INDEX}" ON "{TABLE}" ("expires_at")',
+            reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS "{INDEX}"',
+        ),
+    ]
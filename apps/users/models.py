@@ -6,6 +6,8 @@ from django.contrib.auth.models import (
 from django.db import models
 from django.utils import timezone
 
+from .hashers import run_in_hashing_pool
+
 
 # 유저 관리자 생성 클래스
 class CustomUserManager(BaseUserManager):
@@ -15,7 +17,8 @@ class CustomUserManager(BaseUserManager):
             raise ValueError("이메일 주소를 입력해주세요.")
         email = self.normalize_email(email)  # 이메일 표준화
         user = self.model(email=email, **extra_fields)
-        user.set_password(password)  # 비밀번호 해싱
+        # 비밀번호 해싱 - 해싱 전용 스레드 풀에서 실행 (동시 해싱 수 제한)
+        run_in_hashing_pool(user.set_password, password)
         user.save(using=self._db)  # 현재 사용중인 DB에 저장
         return user
 
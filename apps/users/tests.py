@@ -1,3 +1,191 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .authentication import (
+    ClaimsJWTAuthentication,
+    forget_user,
+    issue_refresh_token,
+)
+from .backends import PooledHashingModelBackend
+from .models import User
+from .tokens import CachedBlacklistRefreshToken, blacklist_cache
+
+
+class ClaimsJWTAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="claims@example.com",
+            password="testpassword123",
+            nickname="claims",
+        )
+        self.accounts_url = reverse("account-list-create")
+
+    def login(self):
+        response = self.client.post(
+            reverse("users:jwt_login"),
+            {"email": "claims@example.com", "password": "testpassword123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_authenticated_request_without_user_query(self):
+        self.login()
+        self.client.get(self.accounts_url)  # 활성 상태 확인, 계좌 목록 캐시
+        with self.assertNumQueries(0):
+            response = self.client.get(self.accounts_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deactivated_user_is_rejected_after_recheck(self):
+        self.login()
+        self.assertEqual(
+            self.client.get(self.accounts_url).status_code, status.HTTP_200_OK
+        )
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        forget_user(self.user.pk)  # TTL 만료와 같은 효과
+        self.assertEqual(
+            self.client.get(self.accounts_url).status_code,
+            status.HTTP_401_UNAUTHORIZED,
+        )
+
+    def test_claims_user_loads_profile_fields_on_access(self):
+        token = issue_refresh_token(self.user).access_token
+        forget_user(self.user.pk)
+        with self.assertNumQueries(1):  # 활성 상태 확인
+            user = ClaimsJWTAuthentication().get_user(token)
+        self.assertEqual(user, self.user)
+        self.assertFalse(user.is_staff)
+        with self.assertNumQueries(1):  # deferred 필드는 처음 접근할 때 조회
+            self.assertEqual(user.email, "claims@example.com")
+
+        # 불러온 필드만 저장하므로 다른 필드를 덮어쓰지 않음
+        user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.nickname, "claims")
+
+    def test_token_without_claims_falls_back_to_database(self):
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(
+            self.client.get(self.accounts_url).status_code, status.HTTP_200_OK
+        )
+
+
+class TokenBlacklistTestCase(APITestCase):
+    def setUp(self):
+        blacklist_cache.clear()
+        self.user = User.objects.create_user(
+            email="blacklist@example.com",
+            password="testpassword123",
+            nickname="blacklist",
+        )
+
+    def test_blacklisted_token_is_rejected_from_cache(self):
+        refresh = issue_refresh_token(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh.blacklist()
+        with self.assertNumQueries(0), self.assertRaises(TokenError):
+            CachedBlacklistRefreshToken(str(refresh))
+
+    def test_blacklist_from_other_process_is_checked_in_database(self):
+        refresh = issue_refresh_token(self.user)
+        RefreshToken(str(refresh)).blacklist()  # 캐시를 거치지 않은 블랙리스트 등록
+        with self.assertRaises(TokenError):
+            CachedBlacklistRefreshToken(str(refresh))
+        with self.assertNumQueries(0), self.assertRaises(TokenError):
+            CachedBlacklistRefreshToken(str(refresh))
+
+    def test_prune_expired_tokens(self):
+        expired = [issue_refresh_token(self.user) for _ in range(3)]
+        alive = issue_refresh_token(self.user)
+        for token in expired[:2] + [alive]:
+            token.blacklist()
+        OutstandingToken.objects.filter(
+            jti__in=[token["jti"] for token in expired]
+        ).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        out = StringIO()
+        call_command("prune_expired_tokens", "--batch-size", "2", stdout=out)
+        self.assertIn("3건", out.getvalue())
+        self.assertEqual(
+            list(OutstandingToken.objects.values_list("jti", flat=True)),
+            [alive["jti"]],
+        )
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+    def test_outstanding_tokens_are_indexed_by_expiry(self):
+        # 만료 토큰 정리가 테이블 전체를 읽지 않도록 expires_at 인덱스가 있어야 함
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, OutstandingToken._meta.db_table
+            )
+        self.assertIn(
+            ["expires_at"],
+            [info["columns"] for info in constraints.values() if info["index"]],
+        )
+
+
+class PasswordHasherPolicyTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="hasher@example.com",
+            password="testpassword123",
+            nickname="hasher",
+        )
+        self.login_url = reverse("users:jwt_login")
+
+    def login(self, password):
+        return self.client.post(
+            self.login_url,
+            {"email": "hasher@example.com", "password": password},
+            format="json",
+        )
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "apps.users.hashers.TunedScryptPasswordHasher",
+            "apps.users.hashers.TunedPBKDF2PasswordHasher",
+        ]
+    )
+    def test_password_is_rehashed_with_new_policy_on_login(self):
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+
+        self.assertEqual(
+            self.login("wrongpassword").status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+
+        self.assertEqual(self.login("testpassword123").status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$"))
+        self.assertTrue(self.user.check_password("testpassword123"))
+
+    def test_async_authenticate(self):
+        backend = PooledHashingModelBackend()
+        authenticate = async_to_sync(backend.aauthenticate)
+        self.assertEqual(
+            authenticate(None, email="hasher@example.com", password="testpassword123"),
+            self.user,
+        )
+        self.assertIsNone(
+            authenticate(None, email="hasher@example.com", password="wrongpassword")
+        )
+        self.assertIsNone(
+            authenticate(None, email="nobody@example.com", password="testpassword123")
+        )
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BlacklistCache:
+    """
+    블랙리스트에 오른 토큰 jti 의 LRU 캐시 (프로세스 단위)
+
+    블랙리스트에서 빠지는 토큰은 없으므로 "블랙리스트에 있음" 결과만 저장한다.
+    캐시에 없으면 항상 DB 를 확인하므로 다른 프로세스에서 블랙리스트에 올린 토큰도 놓치지 않는다.
+
+    "블랙리스트에 없음" 결과는 TTL 을 두더라도 캐시하지 않는다.
+    - ROTATE_REFRESH_TOKENS + BLACKLIST_AFTER_ROTATION 설정에서 유효한 refresh 토큰은 재발급/로그아웃에
+      한 번 쓰이고 곧바로 블랙리스트에 오르므로, 같은 토큰을 다시 "유효"로 확인하는 일이 거의 없어 얻는 것이 없다.
+    - 캐시는 프로세스 단위라 다른 프로세스가 블랙리스트에 올린 것을 무효화할 수 없으므로, TTL 동안
+      이미 재발급에 쓰인 토큰을 다시 받아들이게 된다. (탈취된 refresh 토큰 재사용을 막는 검사가 무력해짐)
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._jtis = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, jti):
+        with self._lock:
+            if jti not in self._jtis:
+                return False
+            self._jtis.move_to_end(jti)
+            return True
+
+    def add(self, jti):
+        with self._lock:
+            self._jtis[jti] = None
+            self._jtis.move_to_end(jti)
+            if len(self._jtis) > self.max_size:
+                self._jtis.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._jtis.clear()
+
+
+blacklist_cache = BlacklistCache(settings.TOKEN_BLACKLIST_CACHE_SIZE)
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """
+    블랙리스트 확인 결과를 캐시하는 refresh 토큰
+
+    로그아웃/재발급(rotation)으로 이미 블랙리스트에 오른 토큰이 다시 들어오면 DB 조회 없이 거부한다.
+    """
+
+    def check_blacklist(self):
+        if self.payload[api_settings.JTI_CLAIM] in blacklist_cache:
+            raise TokenError("블랙리스트에 등록된 토큰입니다.")
+        try:
+            super().check_blacklist()
+        except TokenError:
+            blacklist_cache.add(self.payload[api_settings.JTI_CLAIM])
+            raise
+
+    def blacklist(self):
+        result = super().blacklist()
+        # 블랙리스트 등록이 롤백되면 캐시에도 남지 않도록 커밋 후 추가
+        jti = self.payload[api_settings.JTI_CLAIM]
+        transaction.on_commit(lambda: blacklist_cache.add(jti))
+        return result
@@ -1,6 +1,14 @@
 from django.urls import path
 
-from .views import JWTLoginView, JWTLogoutView, UserProfileAPIView, UserRegisterView
+from apps.common.views import async_read_view
+
+from .views import (
+    JWTLoginView,
+    JWTLogoutView,
+    UserProfileAPIView,
+    UserProfileAsyncView,
+    UserRegisterView,
+)
 
 app_name = "users"
 
@@ -8,5 +16,9 @@ urlpatterns = [
     path("register/", UserRegisterView.as_view(), name="register"),
     path("auth/login/", JWTLoginView.as_view(), name="jwt_login"),
     path("auth/logout/", JWTLogoutView.as_view(), name="jwt_logout"),
-    path("<int:pk>/", UserProfileAPIView.as_view(), name="user_profile"),
+    path(
+        "<int:pk>/",
+        async_read_view(UserProfileAsyncView, UserProfileAPIView),
+        name="user_profile",
+    ),
 ]
@@ -1,15 +1,18 @@
 from django.conf import settings
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView, Response
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.common.views import AsyncAPIView
+
+from .authentication import forget_user, issue_refresh_token
 from .models import User
 from .permissions import IsOwner
 from .serializers import LoginSerializer, UserRegisterSerializer, UserSerializer
+from .tokens import CachedBlacklistRefreshToken
 
 
 # 회원가입 API
@@ -74,7 +77,8 @@ class JWTLoginView(APIView):
         # validate 메서드에서 설정한 user 가져오기
         user = serializer.validated_data["user"]
 
-        refresh = RefreshToken.for_user(user)
+        # 요청마다 사용자를 조회하지 않도록 활성/권한 클레임을 토큰에 담아 발급
+        refresh = issue_refresh_token(user)
         access_token = str(refresh.access_token)
 
         user_serializer = UserSerializer(user)
@@ -113,7 +117,8 @@ class JWTLogoutView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            token = RefreshToken(refresh_token)
+            # 이미 로그아웃한 토큰은 블랙리스트 캐시에서 DB 조회 없이 거부
+            token = CachedBlacklistRefreshToken(refresh_token)
             token.blacklist()
 
             response = Response(
@@ -195,6 +200,19 @@ class UserProfileAPIView(APIView):
         self.check_object_permissions(request, user_to_delete)
 
         user_to_delete.delete()
+        forget_user(pk)  # 활성 상태 캐시에서 제거
         return Response(
             {"message": "Deleted successfully"}, status=status.HTTP_204_NO_CONTENT
         )
+
+
+class UserProfileAsyncView(AsyncAPIView):
+    """UserProfileAPIView.get 의 async 버전 (ASGI 에서 GET 요청 처리)"""
+
+    async def get(self, request, pk):
+        user_to_retrieve = await aget_object_or_404(User, pk=pk)
+
+        self.check_object_permissions(request, user_to_retrieve)
+
+        serializer = UserSerializer(user_to_retrieve)
+        return Response(serializer.data, status=status.HTTP_200_OK)
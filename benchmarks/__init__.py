@@ -0,0 +1,27 @@
+"""
+성능 벤치마크 스크립트 모음
+
+프로젝트 루트에서 모듈로 실행한다. (.env 또는 환경 변수에 DJANGO_SECRET_KEY 등 필요)
+
+    python -m benchmarks.serializers
+"""
+
+import os
+import time
+
+import django
+
+
+def setup():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+
+
+def measure(func, repeat=5):
+    """func 를 repeat 번 실행하여 가장 빠른 실행 시간(초)을 반환"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
@@ -0,0 +1,134 @@
+"""
+거래 수정/삭제 시 이후 거래의 거래 후 잔액(balance_after) 재계산 벤치마크
+
+한 계좌에 거래를 넣고 가운데 거래를 수정했을 때, 이후 거래 전체에 잔액 차이(delta)를 더하는 방법을 비교한다.
+- set-based: UPDATE ... SET balance_after = balance_after + delta WHERE (거래 일시, id) 가 이후인 행 (뷰의 방식)
+- row loop: 이후 거래를 읽어 파이썬에서 행마다 UPDATE (sample 행만 실행해 전체 시간을 추정)
+환경 변수의 DB 에 임시 스키마(bench_balance_recompute)를 만들어 측정하고 끝나면 지운다.
+
+    python -m benchmarks.balance_recompute [행 수] [row loop 표본 행 수]
+"""
+
+import sys
+import time
+
+from benchmarks import measure, setup
+
+SCHEMA = "bench_balance_recompute"
+TABLE = f"{SCHEMA}.transaction"
+
+# 가운데 거래 이후 전체 (apps.transactions.balances.later_transactions 와 같은 조건)
+LATER = """
+    account_id = 1 AND (transaction_date > %(moment)s
+                        OR (transaction_date = %(moment)s AND id > %(id)s))
+"""
+
+
+def create_table(cursor, row_count):
+    cursor.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {SCHEMA}")
+    cursor.execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            id bigint PRIMARY KEY, account_id bigint NOT NULL,
+            amount numeric(15, 2) NOT NULL, balance_after numeric(15, 2) NOT NULL,
+            io_type varchar(10) NOT NULL, transaction_date timestamptz NOT NULL
+        )
+        """
+    )
+    started = time.perf_counter()
+    # 입금 3건당 출금 1건, 거래 후 잔액은 누적 합계
+    cursor.execute(
+        f"""
+        INSERT INTO {TABLE}
+        SELECT id, 1, amount, SUM(signed) OVER (ORDER BY id), io_type, transaction_date
+        FROM (
+            SELECT g AS id, 1000.00 AS amount,
+                   CASE WHEN g %% 4 = 0 THEN 'WITHDRAW' ELSE 'DEPOSIT' END AS io_type,
+                   CASE WHEN g %% 4 = 0 THEN -1000.00 ELSE 1000.00 END AS signed,
+                   now() - (%s - g) * interval '1 second' AS transaction_date
+            FROM generate_series(1, %s) AS g
+        ) AS ledger
+        """,
+        [row_count, row_count],
+    )
+    cursor.execute(
+        f"CREATE INDEX ON {TABLE} (account_id, transaction_date DESC, id DESC)"
+    )
+    cursor.execute(f"VACUUM ANALYZE {TABLE}")
+    print(f"loaded in {time.perf_counter() - started:6.1f} s")
+
+
+def main(row_count, sample):
+    setup()
+
+    from django.db import connection
+
+    print(f"rows: {row_count}, row loop sample: {sample}")
+    connection.ensure_connection()
+    connection.connection.autocommit = True  # VACUUM 은 트랜잭션 밖에서 실행
+    try:
+        with connection.cursor() as cursor:
+            create_table(cursor, row_count)
+            middle = row_count // 2
+            cursor.execute(
+                f"SELECT transaction_date FROM {TABLE} WHERE id = %s", [middle]
+            )
+            params = {"moment": cursor.fetchone()[0], "id": middle}
+            cursor.execute(f"SELECT COUNT(*) FROM {TABLE} WHERE {LATER}", params)
+            later = cursor.fetchone()[0]
+
+            # 가운데 출금/입금 금액을 바꾼 것처럼 delta 를 더했다가 되돌리기를 반복
+            signs = iter([1, -1] * 10)
+
+            def set_based():
+                cursor.execute(
+                    f"UPDATE {TABLE} SET balance_after = balance_after + %(delta)s "
+                    f"WHERE {LATER}",
+                    dict(params, delta=500 * next(signs)),
+                )
+
+            def row_loop():
+                delta = 500 * next(signs)
+                cursor.execute(
+                    f"SELECT id, balance_after FROM {TABLE} WHERE {LATER} "
+                    f"ORDER BY transaction_date, id LIMIT {sample}",
+                    params,
+                )
+                for row_id, balance_after in cursor.fetchall():
+                    cursor.execute(
+                        f"UPDATE {TABLE} SET balance_after = %s WHERE id = %s",
+                        [balance_after + delta, row_id],
+                    )
+
+            set_time = measure(set_based, repeat=4)
+            loop_time = measure(row_loop, repeat=2) * later / sample
+            print(f"later rows          : {later}")
+            print(f"set-based UPDATE    : {set_time * 1e3:10.1f} ms")
+            print(
+                f"row loop (estimated): {loop_time * 1e3:10.1f} ms "
+                f"({loop_time / set_time:.0f}x)"
+            )
+
+            # 재계산 후에도 거래 후 잔액이 누적 합계와 같은지 확인 (+/- 를 같은 횟수만큼 적용)
+            cursor.execute(
+                f"""
+                SELECT COUNT(*) FROM (
+                    SELECT balance_after, SUM(CASE WHEN io_type = 'DEPOSIT'
+                                                   THEN amount ELSE -amount END)
+                           OVER (ORDER BY transaction_date, id) AS expected
+                    FROM {TABLE} WHERE account_id = 1
+                ) AS ledger WHERE balance_after <> expected
+                """
+            )
+            print(f"mismatched rows     : {cursor.fetchone()[0]}")
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+    )
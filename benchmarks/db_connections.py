@@ -0,0 +1,108 @@
+"""
+DB 연결 재사용 설정별 요청 처리량 벤치마크
+
+동시 요청(기본 200개)을 요청 처리 스레드(기본 50개)가 나누어 처리할 때,
+요청마다 연결(CONN_MAX_AGE=0) / 스레드별 영구 연결(CONN_MAX_AGE + CONN_HEALTH_CHECKS) /
+psycopg 3 커넥션 풀(DB_POOL=true)의 초당 처리량과 응답 시간(p50/p99)을 비교한다.
+요청은 request_started/request_finished 시그널 사이에서 쿼리 1개를 실행하는 것으로 흉내 낸다.
+설정은 settings import 시점에 결정되므로 설정마다 새 프로세스에서 실행한다. 환경 변수의 DB 를 사용한다.
+
+    python -m benchmarks.db_connections [동시 요청 수] [요청 처리 스레드 수] [요청 수]
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import setup
+
+MODES = {
+    "no reuse": {"DB_POOL": "false", "DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_POOL": "false", "DB_CONN_MAX_AGE": "60"},
+    "pool": {"DB_POOL": "true"},
+}
+
+
+def handle_request():
+    """Django 요청 처리와 같은 순서로 연결을 열고 닫으며 쿼리 1개 실행"""
+    from django.core import signals
+    from django.db import connection
+
+    signals.request_started.send(sender=None)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    finally:
+        signals.request_finished.send(sender=None)
+
+
+def run_mode(mode, concurrency, threads, request_count):
+    """현재 프로세스 설정으로 측정 후 결과 출력"""
+    setup()
+
+    from django.db import connection
+
+    # 연결 1회에 드는 시간 (새 연결은 TCP/TLS/인증 핸드셰이크, 풀은 풀에서 꺼내는 시간)
+    started = time.perf_counter()
+    for _ in range(10):
+        connection.close()
+        connection.ensure_connection()
+    connect = (time.perf_counter() - started) / 10
+    connection.close()
+
+    latencies = []
+    with ThreadPoolExecutor(max_workers=threads) as server:
+        # 워밍업 (영구 연결/풀 연결 생성)
+        list(server.map(lambda _: handle_request(), range(threads)))
+
+        def client(n):
+            # 동시 요청 concurrency 개 중 하나 - 처리 스레드에 차례로 요청을 보냄
+            for _ in range(n, request_count, concurrency):
+                submitted = time.perf_counter()
+                server.submit(handle_request).result()
+                latencies.append(time.perf_counter() - submitted)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as clients:
+            list(clients.map(client, range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"{mode:10}: connect {connect * 1e3:6.2f} ms, "
+        f"{request_count / elapsed:8.1f} req/s, "
+        f"p50 {latencies[len(latencies) // 2] * 1e3:7.2f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:7.2f} ms"
+    )
+
+
+def main(concurrency, threads, request_count):
+    print(f"concurrency: {concurrency}, threads: {threads}, requests: {request_count}")
+    for mode, env in MODES.items():
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.db_connections",
+                "--run",
+                mode,
+                str(concurrency),
+                str(threads),
+                str(request_count),
+            ],
+            env={**os.environ, **env},
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run_mode(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]), int(sys.argv[5]))
+    else:
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+            int(sys.argv[3]) if len(sys.argv) > 3 else 5000,
+        )
@@ -0,0 +1,60 @@
+"""
+비밀번호 해싱 정책별 로그인 처리량 벤치마크
+
+정책(PASSWORD_HASHER_POLICIES)마다 해시 1회 시간과, 여러 요청 스레드가 동시에 로그인할 때
+(해싱 전용 스레드 풀에서 비밀번호 검증) 초당 처리 가능한 로그인 수를 측정한다. DB 없이 메모리에서만 측정한다.
+argon2 는 argon2-cffi 가 설치되어 있을 때만 측정한다.
+
+    python -m benchmarks.hashers [동시 요청 수] [요청 수]
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import measure, setup
+
+
+def main(concurrency, login_count):
+    setup()
+
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password, verify_password
+    from django.test import override_settings
+
+    from apps.users.hashers import run_in_hashing_pool
+
+    password = "benchmark-password-123"
+    print(
+        f"concurrency: {concurrency}, logins: {login_count}, "
+        f"hashing workers: {settings.PASSWORD_HASHING_WORKERS}"
+    )
+    for policy, hasher in settings.PASSWORD_HASHER_POLICIES.items():
+        with override_settings(PASSWORD_HASHERS=[hasher]):
+            try:
+                encoded = make_password(password)
+            except ValueError as exc:  # 라이브러리 미설치 (argon2-cffi)
+                print(f"{policy:8}: 건너뜀 ({exc})")
+                continue
+
+            single = measure(lambda: make_password(password), repeat=3)
+
+            def login(_):
+                return run_in_hashing_pool(verify_password, password, encoded)
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as requests:
+                assert all(ok for ok, _ in requests.map(login, range(login_count)))
+            elapsed = time.perf_counter() - started
+
+        print(
+            f"{policy:8}: hash {single * 1e3:8.1f} ms, "
+            f"{login_count / elapsed:8.1f} logins/s"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 32,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 64,
+    )
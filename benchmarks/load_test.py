@@ -0,0 +1,170 @@
+"""
+읽기 API 부하 테스트 - sync 뷰와 async 뷰(ASYNC_READ_VIEWS) 비교
+
+ASGI 애플리케이션(config.asgi)을 프로세스 안에서 직접 호출하여, 동시 요청 수가 많을 때
+계좌 목록/거래 내역 목록 조회의 초당 처리량과 응답 시간(p50/p99)을 측정한다.
+ASYNC_READ_VIEWS 값만 바꾼 두 프로세스에서 각각 실행하며, 환경 변수의 DB 에 부하 테스트용
+사용자와 계좌/거래 내역을 만든다. (이미 있으면 재사용)
+
+    python -m benchmarks.load_test [동시 요청 수] [요청 수]
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from decimal import Decimal
+
+from benchmarks import setup
+
+EMAIL = "loadtest@example.com"
+ACCOUNT_COUNT = 3
+TRANSACTIONS_PER_ACCOUNT = 200
+PATHS = ("/accounts/", "/transactions/")
+
+
+def seed():
+    """부하 테스트용 사용자와 계좌/거래 내역을 만들고 access 토큰을 반환"""
+    from apps.accounts.models import Account
+    from apps.transactions.models import Transaction
+    from apps.users.authentication import issue_refresh_token
+    from apps.users.models import User
+
+    user = User.objects.filter(email=EMAIL).first()
+    if user is None:
+        user = User.objects.create_user(
+            email=EMAIL, password="loadtest-password-123", nickname="loadtest"
+        )
+        for i in range(ACCOUNT_COUNT):
+            account = Account.objects.create(
+                user=user,
+                account_number=f"{i:010d}",
+                balance=Decimal(TRANSACTIONS_PER_ACCOUNT),
+            )
+            Transaction.objects.bulk_create(
+                Transaction(
+                    account=account,
+                    amount=Decimal("1.00"),
+                    io_type="DEPOSIT",
+                    transaction_type="ATM",
+                    balance_after=Decimal(n + 1),
+                )
+                for n in range(TRANSACTIONS_PER_ACCOUNT)
+            )
+    return str(issue_refresh_token(user).access_token)
+
+
+async def request(application, path, headers):
+    """ASGI 애플리케이션에 GET 요청을 보내고 응답 상태 코드를 반환"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": headers,
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 50000),
+    }
+    body_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    status = None
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await application(scope, receive, send)
+    disconnected.set()
+    return status
+
+
+async def run(concurrency, request_count, token):
+    from config.asgi import application
+
+    headers = [
+        (b"host", b"testserver"),
+        (b"authorization", f"Bearer {token}".encode()),
+    ]
+    latencies = []
+    remaining = iter(range(request_count))
+
+    async def worker():
+        for n in remaining:
+            started = time.perf_counter()
+            status = await request(application, PATHS[n % len(PATHS)], headers)
+            latencies.append(time.perf_counter() - started)
+            assert status == 200, status
+
+    # 워밍업 (URL/뷰 import, DB 연결)
+    for path in PATHS:
+        await request(application, path, headers)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return (
+        request_count / elapsed,
+        latencies[len(latencies) // 2],
+        latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    )
+
+
+def run_mode(concurrency, request_count, token):
+    """현재 프로세스 설정(ASYNC_READ_VIEWS)으로 부하 테스트 실행 후 결과 출력"""
+    setup()
+
+    from django.conf import settings
+
+    mode = "async" if settings.ASYNC_READ_VIEWS else "sync"
+    rps, p50, p99 = asyncio.run(run(concurrency, request_count, token))
+    print(
+        f"{mode:5}: {rps:8.1f} req/s, p50 {p50 * 1e3:8.1f} ms, p99 {p99 * 1e3:8.1f} ms"
+    )
+
+
+def main(concurrency, request_count):
+    setup()
+    token = seed()
+    print(f"concurrency: {concurrency}, requests: {request_count}, paths: {PATHS}")
+    for async_read_views in ("false", "true"):
+        # URL 설정은 import 시점의 ASYNC_READ_VIEWS 로 결정되므로 모드마다 새 프로세스에서 실행
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.load_test",
+                "--run",
+                str(concurrency),
+                str(request_count),
+                token,
+            ],
+            env={**os.environ, "ASYNC_READ_VIEWS": async_read_views},
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run_mode(int(sys.argv[2]), int(sys.argv[3]), sys.argv[4])
+    else:
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+        )
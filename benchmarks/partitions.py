@@ -0,0 +1,122 @@
+"""
+거래 내역 월 파티션 전/후 최근 기간 조회 벤치마크
+
+같은 거래 데이터(최근 24개월에 고르게 분포)를 일반 테이블과 월 파티션 테이블에 각각 넣고,
+같은 인덱스(account_id, transaction_date DESC, id DESC)를 만든 뒤 최근 기간 쿼리 시간을 비교한다.
+환경 변수의 DB 에 임시 스키마(bench_partitions)를 만들어 측정하고 끝나면 지운다.
+
+    python -m benchmarks.partitions [행 수] [계좌 수]
+"""
+
+import sys
+import time
+
+from benchmarks import measure, setup
+
+SCHEMA = "bench_partitions"
+MONTHS = 24
+
+QUERIES = {
+    # 계좌 거래 내역 첫 페이지 (목록 API)
+    "history page": """
+        SELECT * FROM {table} WHERE account_id = 1
+        ORDER BY transaction_date DESC, id DESC LIMIT 51
+    """,
+    # 계좌의 최근 30일 거래 합계
+    "account 30d sum": """
+        SELECT SUM(amount) FROM {table}
+        WHERE account_id = 1 AND transaction_date >= now() - interval '30 days'
+    """,
+    # 전체 계좌의 최근 30일 입출금 집계 (파티션 제외 효과가 가장 큼)
+    "all 30d by io_type": """
+        SELECT io_type, COUNT(*), SUM(amount) FROM {table}
+        WHERE transaction_date >= now() - interval '30 days' GROUP BY io_type
+    """,
+}
+
+
+def create_tables(cursor, row_count, account_count):
+    cursor.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {SCHEMA}")
+    columns = """
+        id bigint NOT NULL, account_id bigint NOT NULL, amount numeric(15, 2) NOT NULL,
+        io_type varchar(10) NOT NULL, transaction_date timestamptz NOT NULL
+    """
+    cursor.execute(f"CREATE TABLE {SCHEMA}.plain ({columns}, PRIMARY KEY (id))")
+    cursor.execute(
+        f"CREATE TABLE {SCHEMA}.partitioned ({columns}, "
+        f"PRIMARY KEY (id, transaction_date)) PARTITION BY RANGE (transaction_date)"
+    )
+    cursor.execute(
+        f"""
+        DO $$
+        DECLARE month timestamptz := date_trunc('month', now()) - interval '{MONTHS} months';
+        BEGIN
+            WHILE month <= date_trunc('month', now()) LOOP
+                EXECUTE format(
+                    'CREATE TABLE {SCHEMA}.%I PARTITION OF {SCHEMA}.partitioned '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'p' || to_char(month, 'YYYY_MM'), month, month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+    for table in ("plain", "partitioned"):
+        started = time.perf_counter()
+        cursor.execute(
+            f"""
+            INSERT INTO {SCHEMA}.{table}
+            SELECT g, 1 + g %% %s, (g %% 100000) / 100.0,
+                   CASE WHEN g %% 2 = 0 THEN 'DEPOSIT' ELSE 'WITHDRAW' END,
+                   now() - (g::float8 / %s) * interval '{MONTHS} months'
+            FROM generate_series(1, %s) AS g
+            """,
+            [account_count, row_count, row_count],
+        )
+        cursor.execute(
+            f"CREATE INDEX ON {SCHEMA}.{table} "
+            f"(account_id, transaction_date DESC, id DESC)"
+        )
+        cursor.execute(f"VACUUM ANALYZE {SCHEMA}.{table}")
+        print(f"{table:12}: loaded in {time.perf_counter() - started:6.1f} s")
+
+
+def main(row_count, account_count):
+    setup()
+
+    from django.db import connection
+
+    print(f"rows: {row_count}, accounts: {account_count}, months: {MONTHS}")
+    connection.ensure_connection()
+    connection.connection.autocommit = True  # VACUUM 은 트랜잭션 밖에서 실행
+    try:
+        with connection.cursor() as cursor:
+            create_tables(cursor, row_count, account_count)
+            for name, sql in QUERIES.items():
+                results = []
+                for table in ("plain", "partitioned"):
+                    query = sql.format(table=f"{SCHEMA}.{table}")
+
+                    def run():
+                        cursor.execute(query)
+                        cursor.fetchall()
+
+                    results.append(measure(run, repeat=10))
+                plain, partitioned = results
+                print(
+                    f"{name:20}: plain {plain * 1e3:8.2f} ms, "
+                    f"partitioned {partitioned * 1e3:8.2f} ms "
+                    f"({plain / partitioned:.1f}x)"
+                )
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+    )
@@ -0,0 +1,68 @@
+"""
+거래 내역 목록 JSON 렌더링 벤치마크
+
+거래 내역 조회 API 응답과 같은 형태(values() fast path 직렬화 결과)의 목록을
+DRF JSONRenderer 와 orjson 기반 FastJSONRenderer 로 렌더링하는 비용을 비교한다.
+Decimal/datetime 객체가 그대로 남아 있는 목록(ModelSerializer 를 거치지 않은 데이터)도 함께 측정한다.
+
+    python -m benchmarks.renderers [행 수]
+"""
+
+import sys
+from datetime import timedelta
+from decimal import Decimal
+
+from benchmarks import measure, setup
+
+
+def main(row_count):
+    setup()
+
+    from django.utils import timezone
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.common import renderers
+    from apps.common.renderers import FastJSONRenderer
+    from apps.transactions.serializers import TransactionHistoryListSerializer
+
+    if renderers.orjson is None:
+        sys.exit("orjson 이 설치되어 있지 않습니다. (pip install orjson)")
+
+    now = timezone.now()
+    raw_rows = [
+        {
+            "id": i,
+            "amount": Decimal("1234.50"),
+            "balance_after": Decimal(i) + Decimal("0.25"),
+            "description": "벤치마크 거래",
+            "transaction_type": "CARD",
+            "io_type": "WITHDRAW",
+            "transaction_date": now - timedelta(seconds=i),
+            "transaction_updated": now,
+            "account_id": 1 + i % 3,
+        }
+        for i in range(row_count)
+    ]
+    api_rows = {
+        "next": None,
+        "results": TransactionHistoryListSerializer(
+            [dict(row, account=row["account_id"]) for row in raw_rows]
+        ).data,
+    }
+
+    print(f"rows: {row_count}")
+    for label, data in (("API 응답", api_rows), ("Decimal/datetime", raw_rows)):
+        drf_body = JSONRenderer().render(data)
+        fast_body = FastJSONRenderer().render(data)
+        assert drf_body == fast_body, "렌더링 결과가 다릅니다."
+        drf = measure(lambda: JSONRenderer().render(data))
+        fast = measure(lambda: FastJSONRenderer().render(data))
+        print(
+            f"[{label}] JSONRenderer: {drf * 1e3:8.2f} ms, "
+            f"FastJSONRenderer: {fast * 1e3:8.2f} ms, "
+            f"speedup: {drf / fast:.1f}x ({len(fast_body) / 1e6:.1f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,62 @@
+"""
+거래 내역 목록 직렬화 마이크로 벤치마크
+
+DRF ModelSerializer(TransactionHistorySerializer) 와 values() 기반 fast path
+(TransactionHistoryListSerializer)의 행당 직렬화 비용을 비교한다. DB 없이 메모리에서만 측정한다.
+
+    python -m benchmarks.serializers [행 수]
+"""
+
+import sys
+from datetime import timedelta
+from decimal import Decimal
+
+from benchmarks import measure, setup
+
+
+def main(row_count):
+    setup()
+
+    from django.utils import timezone
+
+    from apps.transactions.models import Transaction
+    from apps.transactions.serializers import (
+        TransactionHistoryListSerializer,
+        TransactionHistorySerializer,
+    )
+
+    now = timezone.now()
+    instances = [
+        Transaction(
+            id=i,
+            account_id=1 + i % 3,
+            amount=Decimal("1234.50"),
+            balance_after=Decimal(i) + Decimal("0.25"),
+            description="벤치마크 거래",
+            transaction_type="CARD",
+            io_type="WITHDRAW",
+            transaction_date=now - timedelta(seconds=i),
+            transaction_updated=now,
+        )
+        for i in range(row_count)
+    ]
+    fields = TransactionHistoryListSerializer.value_fields()
+    rows = [
+        {
+            field: getattr(instance, field if field != "account" else "account_id")
+            for field in fields
+        }
+        for instance in instances
+    ]
+
+    drf = measure(lambda: TransactionHistorySerializer(instances, many=True).data)
+    fast = measure(lambda: TransactionHistoryListSerializer(rows).data)
+
+    print(f"rows: {row_count}")
+    print(f"ModelSerializer      : {drf * 1e6 / row_count:8.2f} us/row")
+    print(f"ValuesListSerializer : {fast * 1e6 / row_count:8.2f} us/row")
+    print(f"speedup: {drf / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
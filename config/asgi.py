@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# 설정의 ASYNC_READ_VIEWS, DB 연결 유지 기본값이 서버 인터페이스에 따라 정해짐
+os.environ.setdefault("DJANGO_SERVER_INTERFACE", "asgi")
 
 application = get_asgi_application()
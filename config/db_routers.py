@@ -0,0 +1,167 @@
+import functools
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.decorators import sync_and_async_middleware
+
+# 읽기 전용 복제본(replica) 라우팅
+#
+# 쓰기와 대부분의 읽기는 default(primary)로 보내고, replica_reads 를 붙인 조회 뷰의 읽기만
+# settings.DATABASE_REPLICAS 중 하나로 보낸다.
+# 복제 지연 때문에 방금 쓴 데이터가 보이지 않는 일이 없도록
+# - 요청 안에서 한 번이라도 쓰기를 하면 그 요청의 이후 읽기는 primary 로 보내고
+# - 쓰기를 한 사용자는 REPLICA_PIN_SECONDS 동안 모든 읽기를 primary 로 보낸다.
+#   고정은 캐시에 기록하므로 공유 캐시(REDIS_URL)일 때만 다른 워커 프로세스에도 적용되며,
+#   로컬 메모리 캐시에서는 쓰기를 처리한 프로세스 안에서만 유지된다. (prod 설정은 공유 캐시가 없으면 시작하지 않음)
+# 복제본마다 복제 지연이 다르므로 요청 하나의 읽기는 처음 고른 복제본 하나에서만 한다.
+# (쿼리마다 고르면 목록과 건수, 페이지와 다음 페이지가 서로 다른 시점의 데이터가 될 수 있음)
+
+PIN_KEY = "db:primary-pin:{user_id}"
+
+
+class _RoutingState:
+    """요청 하나의 라우팅 상태"""
+
+    __slots__ = ("use_replica", "wrote", "replica")
+
+    def __init__(self):
+        self.use_replica = False
+        self.wrote = False
+        self.replica = None  # 이 요청에서 읽는 복제본 (첫 복제본 읽기에서 고름)
+
+
+# 요청마다 새 상태를 넣음 (sync_to_async 로 넘어간 스레드에서도 같은 객체를 보도록 객체를 공유)
+_state = ContextVar("db_routing_state", default=None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.use_replica or state.wrote:
+            return None  # default
+        if state.replica is None:
+            state.replica = random.choice(settings.DATABASE_REPLICAS)
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return None  # default
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary 와 같은 데이터이므로 어느 쪽에서 읽은 객체끼리도 연결 가능
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        # 복제본은 primary 에서 복제되므로 직접 마이그레이션하지 않음
+        if db != DEFAULT_DB_ALIAS and db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+def pin_to_primary(user_id):
+    """사용자의 읽기를 REPLICA_PIN_SECONDS 동안 primary 로 보낸다"""
+    cache.set(PIN_KEY.format(user_id=user_id), True, settings.REPLICA_PIN_SECONDS)
+
+
+async def apin_to_primary(user_id):
+    """pin_to_primary 의 async 버전"""
+    await cache.aset(
+        PIN_KEY.format(user_id=user_id), True, settings.REPLICA_PIN_SECONDS
+    )
+
+
+def is_pinned_to_primary(user_id):
+    return cache.get(PIN_KEY.format(user_id=user_id), False)
+
+
+async def ais_pinned_to_primary(user_id):
+    """is_pinned_to_primary 의 async 버전"""
+    return await cache.aget(PIN_KEY.format(user_id=user_id), False)
+
+
+def replica_reads(view_method):
+    """
+    조회 뷰 메서드(sync/async)의 DB 읽기를 복제본으로 보낸다.
+    복제본이 설정되지 않았거나 사용자가 최근에 쓰기를 했으면 primary 에서 읽는다.
+    """
+    if iscoroutinefunction(view_method):
+
+        @functools.wraps(view_method)
+        async def wrapper(self, request, *args, **kwargs):
+            state = _state.get()
+            if (
+                state is not None
+                and settings.DATABASE_REPLICAS
+                and not await ais_pinned_to_primary(request.user.id)
+            ):
+                state.use_replica = True
+            return await view_method(self, request, *args, **kwargs)
+
+    else:
+
+        @functools.wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            state = _state.get()
+            if (
+                state is not None
+                and settings.DATABASE_REPLICAS
+                and not is_pinned_to_primary(request.user.id)
+            ):
+                state.use_replica = True
+            return view_method(self, request, *args, **kwargs)
+
+    return wrapper
+
+
+@sync_and_async_middleware
+def replica_routing_middleware(get_response):
+    """요청마다 라우팅 상태를 만들고, 쓰기를 한 사용자는 primary 에 고정한다"""
+
+    def writer_id(request, state):
+        # DRF 뷰가 인증한 사용자도 request.user 에 반영됨
+        user = getattr(request, "user", None)
+        if state.wrote and user is not None and user.is_authenticated:
+            return user.id
+        return None
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            state = _RoutingState()
+            token = _state.set(state)
+            try:
+                response = await get_response(request)
+            finally:
+                _state.reset(token)
+            if state.wrote:
+                # 세션 사용자(request.user) 확인에 DB 조회가 필요할 수 있으므로 스레드에서 실행
+                user_id = await sync_to_async(writer_id)(request, state)
+                if user_id is not None:
+                    await apin_to_primary(user_id)
+            return response
+
+        markcoroutinefunction(middleware)
+    else:
+
+        def middleware(request):
+            state = _RoutingState()
+            token = _state.set(state)
+            try:
+                response = get_response(request)
+            finally:
+                _state.reset(token)
+            user_id = writer_id(request, state)
+            if user_id is not None:
+                pin_to_primary(user_id)
+            return response
+
+    return middleware
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+from datetime import timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -40,6 +41,7 @@ CUSTOM_USER_APPS = [
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
     "drf_spectacular",
+    "apps.common.apps.CommonConfig",
     "apps.users.apps.UsersConfig",
     "apps.transactions.apps.TransactionsConfig",
     "apps.accounts.apps.AccountsConfig",
@@ -49,11 +51,15 @@ CUSTOM_USER_APPS = [
 INSTALLED_APPS = DJANGO_SYSTEM_APPS + CUSTOM_USER_APPS
 
 MIDDLEWARE = [
+    # 요청별 쿼리 수/DB 시간/직렬화 시간/전체 시간 계측 (가장 바깥에서 전체 시간을 잼)
+    "apps.common.metrics.request_metrics_middleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # 조회 API 의 읽기를 복제본으로 보내고 쓰기 직후에는 primary 에서 읽도록 함
+    "config.db_routers.replica_routing_middleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -96,6 +102,99 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# PASSWORD_HASHER_POLICY: pbkdf2(기본) / scrypt / argon2(argon2-cffi 설치 필요)
+# 선택한 정책이 새 비밀번호에 쓰이며, 다른 알고리즘으로 저장된 비밀번호는 다음 로그인 때 다시 해싱된다.
+# 정책별 로그인 처리량 비교: python -m benchmarks.hashers
+
+PASSWORD_HASHER_POLICIES = {
+    "pbkdf2": "apps.users.hashers.TunedPBKDF2PasswordHasher",
+    "scrypt": "apps.users.hashers.TunedScryptPasswordHasher",
+    "argon2": "apps.users.hashers.TunedArgon2PasswordHasher",
+}
+PASSWORD_HASHER_POLICY = os.getenv("PASSWORD_HASHER_POLICY", "pbkdf2")
+if PASSWORD_HASHER_POLICY not in PASSWORD_HASHER_POLICIES:
+    raise ValueError(
+        f"PASSWORD_HASHER_POLICY must be one of: {', '.join(PASSWORD_HASHER_POLICIES)}"
+    )
+PASSWORD_HASHERS = [PASSWORD_HASHER_POLICIES[PASSWORD_HASHER_POLICY]] + [
+    hasher
+    for policy, hasher in PASSWORD_HASHER_POLICIES.items()
+    if policy != PASSWORD_HASHER_POLICY
+]
+
+# 정책별 비용 파라미터 (기본값은 Django 5.2 기본값과 같음)
+PBKDF2_ITERATIONS = int(os.getenv("PBKDF2_ITERATIONS", "1000000"))
+SCRYPT_WORK_FACTOR = int(os.getenv("SCRYPT_WORK_FACTOR", str(2**14)))
+SCRYPT_BLOCK_SIZE = int(os.getenv("SCRYPT_BLOCK_SIZE", "8"))
+SCRYPT_PARALLELISM = int(os.getenv("SCRYPT_PARALLELISM", "1"))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "102400"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "8"))
+
+# 비밀번호 해싱 전용 스레드 풀 크기 (동시에 해싱하는 최대 수)
+PASSWORD_HASHING_WORKERS = int(
+    os.getenv("PASSWORD_HASHING_WORKERS", str(os.cpu_count() or 1))
+)
+
+# 로그인 시 비밀번호 검증/재해싱을 해싱 전용 스레드 풀에서 실행
+AUTHENTICATION_BACKENDS = ["apps.users.backends.PooledHashingModelBackend"]
+
+# 애플리케이션 서버 인터페이스 ("wsgi" 또는 "asgi")
+# config/asgi.py, config/wsgi.py 가 설정을 읽기 전에 지정하며 runserver/관리 명령은 wsgi
+SERVER_INTERFACE = os.getenv("DJANGO_SERVER_INTERFACE", "wsgi").lower()
+
+# Database connection reuse
+# https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+# dev.py / prod.py 의 DATABASES["default"] 에 병합되는 연결 설정
+# - 기본(WSGI): 스레드별 영구 연결 (요청마다 TCP/TLS/인증 핸드셰이크를 하지 않음)
+# - 기본(ASGI): 영구 연결 안 함 (CONN_MAX_AGE=0)
+#   ASGI 에서는 sync 코드가 요청마다 다른 스레드에서 실행될 수 있어 영구 연결이 스레드마다 남아 쌓이므로
+#   연결을 재사용하려면 DB_POOL=true 로 풀을 사용 (DB_CONN_MAX_AGE 를 직접 지정하면 그 값을 사용)
+# - DB_POOL=true: psycopg 3 커넥션 풀 (uv sync --extra pool) - 스레드 수와 관계없이 연결 수를 제한
+# 설정별 요청 처리량 비교: python -m benchmarks.db_connections
+
+DATABASE_CONNECTION = {
+    # 재사용하기 전에 연결 상태를 확인해 DB 재시작/네트워크 단절 후 첫 요청이 실패하지 않도록 함
+    # (풀 사용 시에는 풀에서 연결을 꺼낼 때마다 확인)
+    "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "true").lower()
+    == "true",
+}
+if os.getenv("DB_POOL", "false").lower() == "true":
+    DATABASE_CONNECTION["CONN_MAX_AGE"] = 0  # 풀 사용 시 영구 연결은 사용할 수 없음
+    DATABASE_CONNECTION["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            # 풀에서 연결을 기다리는 최대 시간(초) - 초과 시 PoolTimeout
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            # 사용하지 않는 연결을 닫는 시간 / 연결을 새로 맺는 주기(초)
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "600")),
+            "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+        },
+    }
+else:
+    # 연결 유지 시간(초) - 0 이면 요청마다 연결 (ASGI 기본값)
+    DATABASE_CONNECTION["CONN_MAX_AGE"] = int(
+        os.getenv("DB_CONN_MAX_AGE", "0" if SERVER_INTERFACE == "asgi" else "60")
+    )
+
+# Read replicas
+# DB_REPLICA_HOSTS: 읽기 전용 복제본 호스트 목록 (쉼표로 구분, "host" 또는 "host:port")
+# dev.py / prod.py 에서 replica1, replica2 ... 별칭으로 DATABASES 에 추가되며,
+# 거래 내역/계좌 목록/통계/내보내기 조회의 읽기가 복제본으로 분산된다. (config.db_routers)
+# 로컬에서는 primary 와 같은 호스트를 넣어 확인할 수 있다. (예: DB_REPLICA_HOSTS=localhost)
+DB_REPLICA_HOSTS = [
+    host.strip()
+    for host in os.getenv("DB_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+DATABASE_REPLICAS = [f"replica{i}" for i in range(1, len(DB_REPLICA_HOSTS) + 1)]
+DATABASE_ROUTERS = ["config.db_routers.ReplicaRouter"]
+# 쓰기를 한 사용자의 읽기를 primary 로 보내는 시간(초) - 복제 지연보다 길게 설정
+REPLICA_PIN_SECONDS = int(os.getenv("DB_REPLICA_PIN_SECONDS", "5"))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -126,7 +225,87 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",  # 인증된 사용자만 접근 허용
     ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",  # JWT Token이 있는지 검증
+        # JWT Token 검증 - 토큰 클레임으로 사용자를 만들어 요청마다 User 를 조회하지 않음
+        "apps.users.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # orjson 기반 JSON 렌더러/파서 (orjson 미설치 시 DRF 기본 구현으로 동작)
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.common.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+}
+
+# 계좌 목록/상세, 거래 내역 목록, 프로필 조회(GET)를 async 뷰로 처리 (ASGI 배포용)
+# WSGI 에서는 async 뷰마다 이벤트 루프를 만들게 되므로 ASGI 로 실행할 때만 기본으로 켬
+ASYNC_READ_VIEWS = (
+    os.getenv("ASYNC_READ_VIEWS", str(SERVER_INTERFACE == "asgi")).lower() == "true"
+)
+
+# 토큰 인증 시 사용자 활성 상태(is_active)를 다시 확인하는 주기(초) - 비활성화는 최대 이 시간 뒤에 반영
+USER_ACTIVE_CACHE_TTL = int(os.getenv("USER_ACTIVE_CACHE_TTL", "30"))
+
+# 블랙리스트에 오른 refresh 토큰 jti 를 기억하는 프로세스 로컬 LRU 캐시 크기
+# (블랙리스트에 없는 토큰은 캐시하지 않음 - 이유는 apps/users/tokens.py BlacklistCache 참고)
+# 만료된 토큰/블랙리스트 행은 prune_expired_tokens 관리 명령으로 주기적으로 정리 (cron 등으로 실행)
+TOKEN_BLACKLIST_CACHE_SIZE = int(os.getenv("TOKEN_BLACKLIST_CACHE_SIZE", "10000"))
+
+# 캐시 - 기본은 프로세스 로컬 메모리, REDIS_URL 이 있으면 Redis 사용 (여러 프로세스/서버가 캐시를 공유)
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "default",
+        }
+    }
+# 캐시를 여러 프로세스/서버가 공유하는지 (로컬 메모리 캐시는 프로세스마다 따로 있음)
+SHARED_CACHE = (
+    CACHES["default"]["BACKEND"] != "django.core.cache.backends.locmem.LocMemCache"
+)
+
+# 사용자별 계좌 목록 캐시 유지 시간(초) - 변경 시에는 버전 무효화로 즉시 갱신됨
+ACCOUNT_LIST_CACHE_TIMEOUT = int(os.getenv("ACCOUNT_LIST_CACHE_TIMEOUT", "300"))
+
+# 거래 생성 멱등성 키(Idempotency-Key) 보관 기간
+# 만료된 키는 purge_idempotency_keys 관리 명령으로 주기적으로 정리 (cron 등으로 실행)
+IDEMPOTENCY_KEY_TTL = timedelta(hours=int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24")))
+
+# 이 기간(일)보다 오래된 거래는 archive_transactions 관리 명령이 보관 테이블로 옮김
+# 보관된 거래도 거래 내역 조회/내보내기에는 그대로 포함됨 (apps/transactions/archive.py)
+TRANSACTION_ARCHIVE_AFTER_DAYS = int(os.getenv("TRANSACTION_ARCHIVE_AFTER_DAYS", "730"))
+
+# 요청 지표를 Server-Timing 응답 헤더로 내려줄지 여부 (apps/common/metrics.py)
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "true").lower() == "true"
+
+# URL 이름별 요청당 최대 쿼리 수 - 넘으면 경고 로그, QUERY_BUDGET_STRICT 이면 예외 (N+1 회귀 검출)
+# 목록 조회도 행 수와 관계없이 일정한 쿼리 수로 끝나야 함 (인증 사용자 조회 포함)
+QUERY_BUDGETS = {
+    "users:register": 4,
+    "users:jwt_login": 3,
+    "users:jwt_logout": 6,
+    "users:user_profile": 2,
+    "account-list-create": 3,
+    "account-detail": 5,  # 계좌 삭제 시 연결된 거래/집계 삭제 포함
+    "transactions:transaction-list": 4,  # 보관 거래와 합칠 때 포함
+    "transactions:transaction-summary": 2,
+    "transactions:transaction-export": 2,  # 응답 스트리밍 중의 조회는 제외
+    "transactions:transaction-create": 11,  # 멱등성 키 저장 포함
+    # 일일 집계 행(계좌, 날짜, 입출금 타입, 거래 타입)마다 갱신하므로 배치의 집계 행 수에 비례
+    "transactions:transaction-bulk-create": 25,
+    # 수정/삭제: 계좌 잠금, 거래 읽기, 이후 거래 최소 잔액 조회, 거래 UPDATE/DELETE, 이후 거래 잔액 UPDATE,
+    # 계좌 잔액 UPDATE 에 일일 집계 행 2개(수정 전/후, 행마다 최대 4) 갱신 포함
+    "transactions:transaction-detail": 17,
 }
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
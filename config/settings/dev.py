@@ -30,9 +30,21 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        **DATABASE_CONNECTION,
     }
 }
 
+# 읽기 전용 복제본 - 호스트(포트)만 다르고 나머지 연결 설정은 primary 와 같음
+# 테스트에서는 별도 DB 를 만들지 않고 primary(default)를 그대로 사용
+for alias, replica_host in zip(DATABASE_REPLICAS, DB_REPLICA_HOSTS):
+    replica_host, _, replica_port = replica_host.partition(":")
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": replica_host,
+        "PORT": replica_port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+
 SPECTACULAR_SETTINGS = {
     "COMPONENT_SPLIT_REQUEST": True,
 }
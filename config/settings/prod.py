@@ -1,5 +1,7 @@
 from datetime import timedelta
 
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 DEBUG = False
@@ -27,5 +29,28 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST"),
         "PORT": os.getenv("DB_PORT"),
+        **DATABASE_CONNECTION,
     }
 }
+
+# 읽기 전용 복제본 - 호스트(포트)만 다르고 나머지 연결 설정은 primary 와 같음
+# 테스트에서는 별도 DB 를 만들지 않고 primary(default)를 그대로 사용
+for alias, replica_host in zip(DATABASE_REPLICAS, DB_REPLICA_HOSTS):
+    replica_host, _, replica_port = replica_host.partition(":")
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": replica_host,
+        "PORT": replica_port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+
+# 여러 워커로 실행하는 운영 환경에서는 다음 값을 캐시로 공유해야 하므로 공유 캐시(REDIS_URL)가 필요함
+# - 계좌 목록 캐시/ETag 의 사용자 데이터 버전 (apps/accounts/cache.py)
+#   로컬 메모리 캐시면 다른 워커나 reconcile_ledgers --repair 가 올린 버전을 보지 못해
+#   최대 ACCOUNT_LIST_CACHE_TIMEOUT 동안 지난 계좌 목록/잔액을 응답하거나 바뀐 데이터에 304 를 응답함
+# - 쓰기를 한 사용자의 primary 고정 (config/db_routers.py)
+#   고정을 모르는 다른 워커가 복제본에서 방금 쓴 데이터가 빠진 결과를 읽음
+if not SHARED_CACHE:
+    raise ImproperlyConfigured(
+        "운영 환경에서는 REDIS_URL 로 여러 프로세스가 공유하는 캐시를 설정해야 합니다."
+    )
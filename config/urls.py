@@ -18,9 +18,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from apps.common.views import RequestMetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("users/", include("apps.users.urls")),
     path("transactions/", include("apps.transactions.urls")),
     path("accounts/", include("apps.accounts.urls")),
+    path("metrics/", RequestMetricsView.as_view(), name="request-metrics"),
 ]